@@ -0,0 +1,70 @@
+"""Memory per address and dict lookups keyed by addresses against hex strings."""
+
+import tracemalloc
+
+from common import address, bench
+
+from sui_tx_sdk.bcs import Deserializer
+from sui_tx_sdk.cache import LRUCache
+from sui_tx_sdk.sui_address import SuiAddress
+
+
+def bytes_per_instance(create, count: int = 100_000) -> float:
+    raw = [i.to_bytes(SuiAddress.LENGTH, "big") for i in range(count)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    values = [create(x) for x in raw]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del values
+    return (after - before) / count
+
+
+def main():
+    size = bytes_per_instance(SuiAddress)
+    print(f"{'SuiAddress, bytes per instance':<48} {size:>12.1f} B")
+    size = bytes_per_instance(lambda x: "0x" + x.hex())
+    print(f"{'hex string, bytes per instance':<48} {size:>12.1f} B")
+
+    addresses = [address(i) for i in range(10_000)]
+    by_address = {x: i for (i, x) in enumerate(addresses)}
+    by_hex = {x.hex(): i for (i, x) in enumerate(addresses)}
+    probes = [address(i) for i in range(0, 10_000, 7)]
+
+    def lookup_address():
+        return [by_address[x] for x in probes]
+
+    def lookup_hex():
+        return [by_hex[x.hex()] for x in probes]
+
+    assert lookup_address() == lookup_hex()
+    hexed = bench("1429 lookups, hex string keys", lookup_hex)
+    keyed = bench("1429 lookups, SuiAddress keys", lookup_address)
+    print(f"{'':<48} {hexed / keyed:>11.2f}x")
+
+    # An archive where 100 senders account for 10000 decoded addresses.
+    data = b"".join(address(i % 100).address for i in range(10_000))
+
+    def decode():
+        deser = Deserializer(data)
+        return [SuiAddress.deserialize(deser) for _ in range(10_000)]
+
+    tracemalloc.start()
+    plain = decode()
+    plain_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    SuiAddress.set_intern_pool(LRUCache(1024))
+    tracemalloc.start()
+    interned = decode()
+    interned_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert plain == interned and len({id(x) for x in interned}) == 100
+    print(f"{'10000 decoded addresses, no pool':<48} {plain_size:>12} B")
+    print(f"{'10000 decoded addresses, intern pool':<48} {interned_size:>12} B")
+    bench("10000 decoded addresses, intern pool", decode)
+    SuiAddress.set_intern_pool(None)
+    bench("10000 decoded addresses, no pool", decode)
+
+
+if __name__ == "__main__":
+    main()
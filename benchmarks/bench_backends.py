@@ -0,0 +1,34 @@
+"""Sign and verify throughput of every installed crypto backend."""
+
+from common import bench
+
+from sui_tx_sdk import backends
+
+
+def main():
+    msg = bytes(range(256))
+    for algorithm in (backends.ED25519, backends.SECP256K1):
+        for name in backends.available(algorithm):
+            backend = backends.load(algorithm, name)
+            sk = backend.signing_key(bytes(range(1, 33)))
+            pk = backend.verifying_key(backend.public_bytes(backend.public_key(sk)))
+            if algorithm == backends.ED25519:
+                sign = backend.sign
+            else:
+                sign = backend.sign_recoverable
+            sig = sign(sk, msg)[:64]
+            signing = bench(
+                f"{algorithm} {name} sign", lambda: sign(sk, msg), number=2000
+            )
+            verifying = bench(
+                f"{algorithm} {name} verify",
+                lambda: backend.verify(pk, msg, sig),
+                number=2000,
+            )
+            print(f"{'':<48} {1 / signing:>8.0f} sign/s {1 / verifying:>8.0f} verify/s")
+        backends.use(algorithm, None)
+        print(f"selected: {backends.get(algorithm).name}")
+
+
+if __name__ == "__main__":
+    main()
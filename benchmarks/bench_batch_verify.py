@@ -0,0 +1,30 @@
+"""Ed25519 batch verification against a loop of single verifications."""
+
+from common import bench
+
+from sui_tx_sdk.ed25519 import Ed25519KeyPair, Ed25519PublicKey
+
+
+def main():
+    kps = [Ed25519KeyPair.from_private_key(i.to_bytes(32, "big")) for i in range(64)]
+    for size in [16, 64, 256, 1024, 4096]:
+        msgs = [i.to_bytes(8, "little") * 32 for i in range(size)]
+        pks = [kps[i % len(kps)].public_key() for i in range(size)]
+        sigs = [kps[i % len(kps)].sign(msg) for (i, msg) in enumerate(msgs)]
+        assert Ed25519PublicKey.verify_batch(msgs, pks, sigs) == []
+
+        def loop():
+            return all(pk.verify(msg, sig) for (pk, sig, msg) in zip(pks, sigs, msgs))
+
+        number = max(1, 256 // size)
+        single = bench(f"{size} signatures, pk.verify loop", loop, number)
+        batch = bench(
+            f"{size} signatures, verify_batch",
+            lambda: Ed25519PublicKey.verify_batch(msgs, pks, sigs),
+            number,
+        )
+        print(f"{'':<48} {single / batch:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
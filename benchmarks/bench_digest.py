@@ -0,0 +1,26 @@
+"""Transaction digests: encode-then-hash against hashing while encoding."""
+
+from hashlib import blake2b
+
+from common import bench, move_call, pay_sui, transfer_sui
+
+
+def main():
+    for (name, tx) in [
+        ("TransferSui", transfer_sui()),
+        ("MoveCall", move_call()),
+        ("PaySui x1000", pay_sui(1000)),
+    ]:
+
+        def two_pass():
+            data = b"TransactionData::" + tx.bytes()
+            return blake2b(data, digest_size=32).digest()
+
+        assert tx.digest().value == two_pass()
+        two = bench(f"{name} digest (bytes, then hash)", two_pass)
+        one = bench(f"{name} digest (hashing serializer)", tx.digest)
+        print(f"{'':<48} {two / one:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
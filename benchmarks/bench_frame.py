@@ -0,0 +1,26 @@
+"""Packing many transactions into one frame: bytes() + join against serialize_into."""
+
+from common import bench, move_call, pay_sui, transfer_sui
+
+
+def main():
+    txs = [transfer_sui(), move_call(), pay_sui(10)] * 1000
+    expected = b"".join(tx.bytes() for tx in txs)
+
+    def join():
+        return b"".join([tx.bytes() for tx in txs])
+
+    def into():
+        frame = bytearray()
+        for tx in txs:
+            tx.serialize_into(frame, len(frame))
+        return frame
+
+    assert into() == expected
+    joined = bench("3000 transactions, bytes() + join", join, number=5)
+    packed = bench("3000 transactions, serialize_into", into, number=5)
+    print(f"{'':<48} {joined / packed:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
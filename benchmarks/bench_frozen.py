@@ -0,0 +1,43 @@
+"""Repeated verify, digest and equality on plain against frozen transactions."""
+
+from common import bench, pay_sui
+
+from sui_tx_sdk import schema
+from sui_tx_sdk.crypto import SuiKeyPair
+from sui_tx_sdk.ed25519 import Ed25519KeyPair
+from sui_tx_sdk.transaction import Intent, IntentMessage, SenderSignedData
+
+
+def main():
+    kp = SuiKeyPair(Ed25519KeyPair.from_private_key(bytes(range(32))))
+    tx = pay_sui(64)
+    tx.sender = kp.address()
+    message = IntentMessage(Intent(0, 0, 0), tx)
+    signed = SenderSignedData(message, kp.sign(message.bytes()))
+    data = schema.encode(signed)
+    other = SenderSignedData.from_bytes(data)
+    frozen = SenderSignedData.from_bytes(data, frozen=True)
+    frozen_other = SenderSignedData.from_bytes(data, frozen=True)
+
+    for (name, plain_func, frozen_func) in [
+        ("verify", signed.verify, frozen.verify),
+        ("digest", signed.digest, frozen.digest),
+        ("encode", lambda: schema.encode(signed), lambda: schema.encode(frozen)),
+        (
+            "__eq__",
+            lambda: signed.intent_message == other.intent_message,
+            lambda: frozen.intent_message == frozen_other.intent_message,
+        ),
+    ]:
+        plain = bench(f"PaySui x64 {name}", plain_func)
+        cached = bench(f"PaySui x64 {name}, frozen", frozen_func)
+        print(f"{'':<48} {plain / cached:>11.2f}x")
+    bench("PaySui x64 from_bytes", lambda: SenderSignedData.from_bytes(data))
+    bench(
+        "PaySui x64 from_bytes, frozen",
+        lambda: SenderSignedData.from_bytes(data, frozen=True),
+    )
+
+
+if __name__ == "__main__":
+    main()
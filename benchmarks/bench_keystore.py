@@ -0,0 +1,45 @@
+"""Keystore startup with 100k keys, deriving addresses against reading the index."""
+
+import base64
+import json
+import os
+import tempfile
+
+from common import bench
+
+from sui_tx_sdk.ed25519 import Ed25519PublicKey
+from sui_tx_sdk.keystore import INDEX_SUFFIX, Keystore
+
+
+def main():
+    # Random bytes stand in for the keys: loading never parses them.
+    size = 1 + Ed25519PublicKey.LENGTH + 32
+    keys = [
+        base64.b64encode(
+            bytes([Ed25519PublicKey.SCHEME]) + os.urandom(size - 1)
+        ).decode()
+        for _ in range(100_000)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sui.keystore")
+        with open(path, "w") as f:
+            json.dump(keys, f)
+
+        def cold():
+            if os.path.exists(path + INDEX_SUFFIX):
+                os.remove(path + INDEX_SUFFIX)
+            return Keystore.load(path)
+
+        plain = bench(
+            "100k keys, no index", lambda: Keystore.load(path, index=False), number=3
+        )
+        bench("100k keys, building the index", cold, number=3)
+        Keystore.load(path)
+        indexed = bench(
+            "100k keys, reading the index", lambda: Keystore.load(path), number=3
+        )
+        print(f"{'':<48} {plain / indexed:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
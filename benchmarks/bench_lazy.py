@@ -0,0 +1,29 @@
+"""Header-only scans: eager TransactionData decoding against lazy decoding."""
+
+from common import bench, move_call, pay_sui, transfer_sui
+
+from sui_tx_sdk.transaction import TransactionData
+
+
+def main():
+    for (name, tx) in [
+        ("TransferSui", transfer_sui()),
+        ("MoveCall", move_call()),
+        ("PaySui x100", pay_sui(100)),
+    ]:
+        data = tx.bytes()
+        assert TransactionData.from_bytes(data, lazy=True).sender == tx.sender
+
+        eager = bench(
+            f"{name} sender (eager)",
+            lambda: TransactionData.from_bytes(data).sender,
+        )
+        lazy = bench(
+            f"{name} sender (lazy)",
+            lambda: TransactionData.from_bytes(data, lazy=True).sender,
+        )
+        print(f"{'':<48} {eager / lazy:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Memory held by decoded transactions, measured with tracemalloc.
+
+The baseline copies each decoded transaction into instances of plain classes
+with the same attributes but no `__slots__`, i.e. what the models cost when
+every instance carried a `__dict__`.
+"""
+
+import tracemalloc
+
+from common import move_call, pay_sui, transfer_sui
+
+from sui_tx_sdk.transaction import TransactionData
+
+_DICT_CLASSES = {}
+
+
+def _slots(cls) -> list:
+    return [
+        name
+        for klass in cls.__mro__
+        for name in getattr(klass, "__slots__", ())
+        if name != "__weakref__"
+    ]
+
+
+def dict_backed(value, memo=None):
+    """A copy of `value` whose slotted objects are plain dict-backed ones."""
+    memo = {} if memo is None else memo
+    if id(value) in memo:
+        return memo[id(value)]
+    if isinstance(value, list):
+        copy = [dict_backed(x, memo) for x in value]
+    elif isinstance(value, tuple):
+        copy = tuple(dict_backed(x, memo) for x in value)
+    elif _slots(type(value)):
+        cls = type(value)
+        if cls not in _DICT_CLASSES:
+            _DICT_CLASSES[cls] = type(cls.__name__, (), {})
+        copy = _DICT_CLASSES[cls]()
+        for name in _slots(cls):
+            if hasattr(value, name):
+                copy.__dict__[name] = dict_backed(getattr(value, name), memo)
+    else:
+        return value
+    memo[id(value)] = copy
+    return copy
+
+
+def bytes_per_transaction(decode, data: bytes, count: int = 2000) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    txs = [decode(data) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del txs
+    return (after - before) / count
+
+
+def main():
+    for (name, tx) in [
+        ("TransferSui", transfer_sui()),
+        ("MoveCall", move_call()),
+        ("PaySui x10", pay_sui(10)),
+    ]:
+        data = tx.bytes()
+        slotted = bytes_per_transaction(TransactionData.from_bytes, data)
+        baseline = bytes_per_transaction(
+            lambda d: dict_backed(TransactionData.from_bytes(d)), data
+        )
+        for (label, size) in [("__dict__", baseline), ("__slots__", slotted)]:
+            print(
+                f"{f'{name}, bytes per decoded transaction ({label})':<60}"
+                f" {size:>8.0f} B {size / len(data):>6.1f}x BCS"
+            )
+        print(f"{'':<60} {baseline / slotted:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compiled schema codecs against the hand-written serialize/deserialize path."""
+
+from common import bench, move_call, pay_sui, transfer_sui
+
+from sui_tx_sdk import schema
+from sui_tx_sdk.bcs import Deserializer, Serializer
+from sui_tx_sdk.transaction import TransactionData
+
+
+def main():
+    encode = schema.encoder(TransactionData)
+    decode = schema.decoder(TransactionData)
+
+    for (name, tx) in [
+        ("TransferSui", transfer_sui()),
+        ("MoveCall", move_call()),
+        ("PaySui x100", pay_sui(100)),
+    ]:
+        data = tx.bytes()
+        assert schema.encode(tx) == data
+
+        def hand_encode():
+            ser = Serializer()
+            tx.serialize(ser)
+            return ser.output()
+
+        def schema_encode():
+            ser = Serializer()
+            encode(ser, tx)
+            return ser.output()
+
+        hand = bench(f"{name} encode (hand-written)", hand_encode)
+        fast = bench(f"{name} encode (schema)", schema_encode)
+        print(f"{'':<48} {hand / fast:>11.2f}x")
+
+        hand = bench(
+            f"{name} decode (hand-written)",
+            lambda: TransactionData.deserialize(Deserializer(data)),
+        )
+        fast = bench(f"{name} decode (schema)", lambda: decode(Deserializer(data)))
+        print(f"{'':<48} {hand / fast:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
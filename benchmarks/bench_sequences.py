@@ -0,0 +1,70 @@
+"""Bulk fixed-width sequence codecs against per-element encoding."""
+
+from common import address, bench, object_ref, pay_sui
+
+from sui_tx_sdk.bcs import Deserializer, Serializer
+from sui_tx_sdk.object import ObjectRef
+from sui_tx_sdk.sui_address import SuiAddress
+from sui_tx_sdk.transaction import TransactionData
+
+COUNT = 5000
+
+
+def encode(func, values):
+    ser = Serializer()
+    func(ser, values)
+    return ser.output()
+
+
+def main():
+    amounts = [i * 1000 for i in range(COUNT)]
+    recipients = [address(i) for i in range(COUNT)]
+    coins = [object_ref(i) for i in range(COUNT)]
+
+    for (name, values, generic, bulk, generic_decode, bulk_decode) in [
+        (
+            "u64",
+            amounts,
+            lambda s, x: s.sequence(x, Serializer.u64),
+            Serializer.u64_sequence,
+            lambda d: d.sequence(Deserializer.u64),
+            Deserializer.u64_sequence,
+        ),
+        (
+            "SuiAddress",
+            recipients,
+            lambda s, x: s.sequence(x, Serializer.struct),
+            SuiAddress.serialize_sequence,
+            lambda d: d.sequence(SuiAddress.deserialize),
+            SuiAddress.deserialize_sequence,
+        ),
+        (
+            "ObjectRef",
+            coins,
+            lambda s, x: s.sequence(x, Serializer.struct),
+            ObjectRef.serialize_sequence,
+            lambda d: d.sequence(ObjectRef.deserialize),
+            ObjectRef.deserialize_sequence,
+        ),
+    ]:
+        data = encode(generic, values)
+        assert encode(bulk, values) == data
+        bench(f"{name} x{COUNT} encode (per element)", lambda: encode(generic, values))
+        bench(f"{name} x{COUNT} encode (bulk)", lambda: encode(bulk, values))
+        bench(
+            f"{name} x{COUNT} decode (per element)",
+            lambda: generic_decode(Deserializer(data)),
+        )
+        bench(f"{name} x{COUNT} decode (bulk)", lambda: bulk_decode(Deserializer(data)))
+
+    tx = pay_sui(COUNT)
+    data = tx.bytes()
+    bench(f"PaySui x{COUNT} TransactionData.bytes()", tx.bytes)
+    bench(
+        f"PaySui x{COUNT} TransactionData.from_bytes()",
+        lambda: TransactionData.from_bytes(data),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Signing throughput: a loop of SuiKeyPair.sign against sign_many."""
+
+import os
+
+from common import bench
+
+from sui_tx_sdk.crypto import SuiKeyPair
+from sui_tx_sdk.ed25519 import Ed25519KeyPair
+from sui_tx_sdk.secp256k1 import Secp256k1KeyPair
+
+
+def main():
+    msgs = [i.to_bytes(8, "little") * 40 for i in range(2000)]
+    for (name, kp) in [
+        ("Ed25519", SuiKeyPair(Ed25519KeyPair.from_private_key(bytes(range(32))))),
+        (
+            "Secp256k1",
+            SuiKeyPair(Secp256k1KeyPair.from_private_key(bytes(range(1, 33)))),
+        ),
+    ]:
+        loop = bench(
+            f"{name} 2000 messages, sign loop",
+            lambda: [kp.sign(m) for m in msgs],
+            number=1,
+        )
+        many = bench(
+            f"{name} 2000 messages, sign_many",
+            lambda: kp.sign_many(msgs),
+            number=1,
+        )
+        print(f"{'':<48} {loop / many:>11.2f}x  {len(msgs) / many:>8.0f} sig/s")
+        workers = os.cpu_count() or 1
+        if workers > 1:
+            pooled = bench(
+                f"{name} 2000 messages, sign_many x{workers}",
+                lambda: kp.sign_many(msgs, workers=workers),
+                number=1,
+            )
+            print(f"{'':<48} {loop / pooled:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Payment encoding: building and encoding each transaction against a template."""
+
+from common import address, bench, object_ref, transaction
+
+import sui_tx_sdk.transaction as stx
+from sui_tx_sdk import schema
+from sui_tx_sdk.template import TransactionTemplate
+
+
+def main():
+    intent = stx.Intent(0, 0, 0)
+    recipient, gas = address(7), object_ref(7)
+    for (name, build) in [
+        ("TransferSui", lambda: stx.TransferSui(recipient, 1000)),
+        ("PaySui x4", lambda: stx.PaySui([gas], [recipient] * 4, [1000] * 4)),
+    ]:
+        template = TransactionTemplate(transaction(build()), intent)
+        if name == "TransferSui":
+            values = dict(recipient=recipient, amount=1000)
+        else:
+            values = dict(recipients=[recipient] * 4, amounts=[1000] * 4)
+
+        def full():
+            tx = transaction(build())
+            tx.gas_payment = gas
+            return stx.IntentMessage(intent, tx).bytes()
+
+        def schema_encode():
+            tx = transaction(build())
+            tx.gas_payment = gas
+            return schema.encode(stx.IntentMessage(intent, tx))
+
+        assert template.render(gas_payment=gas, **values) == full()
+        slow = bench(f"{name} build + bytes()", full)
+        bench(f"{name} build + schema.encode", schema_encode)
+        fast = bench(
+            f"{name} template.render",
+            lambda: template.render(gas_payment=gas, **values),
+        )
+        print(f"{'':<48} {slow / fast:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""Resolving Move type strings, with and without the parse cache."""
+
+from common import bench
+
+from sui_tx_sdk.cache import LRUCache
+from sui_tx_sdk.type_tag import TypeTag
+
+
+def main():
+    for source in [
+        "u64",
+        "0x2::coin::Coin<0x2::sui::SUI>",
+        "vector<0x3::pool::LP<0x2::coin::Coin<0x2::sui::SUI>, vector<u8>>>",
+    ]:
+        tag = TypeTag.from_str(source)
+        assert TypeTag.from_str(str(tag)) is tag
+
+        TypeTag.set_parse_cache(None)
+        parse = bench(f"{source[:32]} (parsed)", lambda: TypeTag.from_str(source))
+        TypeTag.set_parse_cache(LRUCache(4096))
+        cached = bench(f"{source[:32]} (cached)", lambda: TypeTag.from_str(source))
+        print(f"{'':<48} {parse / cached:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""ULEB128 encode/decode against the per-byte loops they replaced."""
+
+from common import bench
+
+from sui_tx_sdk.bcs import Deserializer, Serializer
+
+
+def encode_per_byte(ser: Serializer, value: int):
+    while value >= 0x80:
+        ser.u8(value & 0x7F | 0x80)
+        value >>= 7
+    ser.u8(value & 0x7F)
+
+
+def decode_per_byte(der: Deserializer) -> int:
+    value = 0
+    shift = 0
+    while True:
+        byte = der.u8()
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80 == 0:
+            return value
+        shift += 7
+
+
+def main():
+    for (name, value) in [
+        ("1 byte", 5),
+        ("2 bytes", 300),
+        ("3 bytes", 20000),
+        ("5 bytes", 2**32 - 1),
+    ]:
+        values = [value] * 1000
+        ser = Serializer()
+        for x in values:
+            ser.uleb128(x)
+        data = ser.output()
+
+        def encode_old():
+            ser = Serializer()
+            for x in values:
+                encode_per_byte(ser, x)
+
+        def encode_new():
+            ser = Serializer()
+            for x in values:
+                ser.uleb128(x)
+
+        def decode_old():
+            der = Deserializer(data)
+            for _ in values:
+                decode_per_byte(der)
+
+        def decode_new():
+            der = Deserializer(data)
+            for _ in values:
+                der.uleb128()
+
+        old = bench(f"{name} x1000 encode (per byte)", encode_old)
+        new = bench(f"{name} x1000 encode (table)", encode_new)
+        print(f"{'':<48} {old / new:>11.2f}x")
+        old = bench(f"{name} x1000 decode (per byte)", decode_old)
+        new = bench(f"{name} x1000 decode (buffer scan)", decode_new)
+        print(f"{'':<48} {old / new:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
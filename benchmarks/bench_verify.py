@@ -0,0 +1,56 @@
+"""Signature verification for a small set of hot senders."""
+
+from common import bench, transfer_sui
+
+from sui_tx_sdk.cache import LRUCache
+from sui_tx_sdk.crypto import Signature, SuiKeyPair
+from sui_tx_sdk.ed25519 import Ed25519KeyPair, Ed25519PublicKey
+from sui_tx_sdk.secp256k1 import Secp256k1KeyPair, Secp256k1PublicKey
+from sui_tx_sdk.sui_address import SuiAddress
+from sui_tx_sdk.transaction import Intent, IntentMessage
+
+
+def signed(kp: SuiKeyPair):
+    message = IntentMessage(Intent(0, 0, 0), transfer_sui())
+    return message, kp.sign(message.bytes()), kp.address()
+
+
+def set_caches(enabled: bool):
+    SuiAddress.set_derivation_cache(LRUCache(4096) if enabled else None)
+    Ed25519PublicKey.set_parse_cache(LRUCache(4096) if enabled else None)
+    Secp256k1PublicKey.set_parse_cache(LRUCache(4096) if enabled else None)
+
+
+def main():
+    for (name, kp) in [
+        ("Ed25519", SuiKeyPair(Ed25519KeyPair.from_private_key(bytes(range(32))))),
+        (
+            "Secp256k1",
+            SuiKeyPair(Secp256k1KeyPair.from_private_key(bytes(range(1, 33)))),
+        ),
+    ]:
+        message, sig, sender = signed(kp)
+        data = sig.bytes()
+        assert sig.verify(message, sender)
+
+        # Every transaction in an archive carries its own signature bytes.
+        def inputs():
+            return Signature.from_bytes(data).get_verification_inputs(sender)
+
+        def verify():
+            return Signature.from_bytes(data).verify(message, sender)
+
+        set_caches(False)
+        cold = bench(f"{name} verification inputs (no caches)", inputs)
+        cold_verify = bench(f"{name} verify (no caches)", verify)
+        set_caches(True)
+        warm = bench(f"{name} verification inputs (cached)", inputs)
+        warm_verify = bench(f"{name} verify (cached)", verify)
+        print(
+            f"{'':<48} {cold / warm:>11.2f}x inputs"
+            f" {cold_verify / warm_verify:>6.2f}x verify"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""SenderSignedData.verify_many: serial against process pools of growing size."""
+
+import concurrent.futures
+import os
+import time
+
+from common import address, pay_sui, transaction
+
+import sui_tx_sdk.transaction as stx
+from sui_tx_sdk import schema
+from sui_tx_sdk.crypto import SuiKeyPair
+from sui_tx_sdk.ed25519 import Ed25519KeyPair
+
+
+def corpus(count: int):
+    kps = [
+        SuiKeyPair(Ed25519KeyPair.from_private_key(i.to_bytes(32, "big")))
+        for i in range(1, 65)
+    ]
+    datas = []
+    for i in range(count):
+        kp = kps[i % len(kps)]
+        tx = pay_sui(4) if i % 2 else transaction(stx.TransferSui(address(i), i))
+        tx.sender = kp.address()
+        message = stx.IntentMessage(stx.Intent(0, 0, 0), tx)
+        signed = stx.SenderSignedData(message, kp.sign(message.bytes()))
+        datas.append(schema.encode(signed))
+    return datas
+
+
+def timed(name: str, func, count: int) -> float:
+    start = time.perf_counter()
+    results = func()
+    elapsed = time.perf_counter() - start
+    assert all(results)
+    print(f"{name:<48} {count / elapsed:>12.0f} tx/s")
+    return elapsed
+
+
+def main():
+    count = 4000
+    datas = corpus(count)
+    serial = timed("serial", lambda: stx.SenderSignedData.verify_many(datas), count)
+    for workers in sorted({2, 4, os.cpu_count() or 1}):
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            # Start the workers before timing.
+            list(pool.map(abs, range(workers)))
+            elapsed = timed(
+                f"{workers} processes",
+                lambda: stx.SenderSignedData.verify_many(datas, executor=pool),
+                count,
+            )
+        print(f"{'':<48} {serial / elapsed:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Sample transactions and a small timing helper shared by the benchmarks.
+
+Run a benchmark from the repository root, e.g. `python benchmarks/bench_schema.py`.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import sui_tx_sdk.transaction as stx  # noqa: E402
+from sui_tx_sdk.account_address import AccountAddress  # noqa: E402
+from sui_tx_sdk.call_arg import CallArg, ObjectArg, PureArg  # noqa: E402
+from sui_tx_sdk.object import ObjectDigest, ObjectID, ObjectRef  # noqa: E402
+from sui_tx_sdk.sui_address import SuiAddress  # noqa: E402
+from sui_tx_sdk.type_tag import StructTag, TypeTag  # noqa: E402
+
+
+def address(i: int) -> SuiAddress:
+    return SuiAddress(i.to_bytes(SuiAddress.LENGTH, "big"))
+
+
+def object_ref(i: int) -> ObjectRef:
+    return ObjectRef(
+        ObjectID(AccountAddress(i.to_bytes(AccountAddress.LENGTH, "big"))),
+        i,
+        ObjectDigest(i.to_bytes(ObjectDigest.LENGTH, "big")),
+    )
+
+
+def transaction(tx) -> stx.TransactionData:
+    kind = stx.TransactionKind(stx.SingleTransactionKind(tx))
+    return stx.TransactionData(kind, address(1), object_ref(1), 1, 10000)
+
+
+def pay_sui(recipients: int) -> stx.TransactionData:
+    return transaction(
+        stx.PaySui(
+            [object_ref(i) for i in range(4)],
+            [address(i) for i in range(recipients)],
+            [i * 1000 for i in range(recipients)],
+        )
+    )
+
+
+def transfer_sui() -> stx.TransactionData:
+    return transaction(stx.TransferSui(address(2), 1000))
+
+
+def move_call() -> stx.TransactionData:
+    sui = TypeTag(StructTag(AccountAddress.from_hex("0x2"), "sui", "SUI", []))
+    return transaction(
+        stx.MoveCall(
+            object_ref(2),
+            "pay",
+            "split_and_transfer",
+            [sui],
+            [
+                CallArg(ObjectArg(object_ref(3))),
+                CallArg(PureArg((1000).to_bytes(8, "little"))),
+                CallArg(PureArg(address(4).address)),
+            ],
+        )
+    )
+
+
+def bench(name: str, func, number: int = 0):
+    """Print the best per-call time of `func` over a few repeats."""
+    timer = timeit.Timer(func)
+    if number == 0:
+        number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=5, number=number)) / number
+    print(f"{name:<48} {best * 1e6:>12.2f} us")
+    return best
@@ -3,27 +3,78 @@
 
 from __future__ import annotations
 
+import functools
+import typing
+
+from . import schema
 from .bcs import Deserializer, Serializer
+from .cache import LRUCache
 
 
+@functools.total_ordering
 class AccountAddress:
-    """Move `AccountAddress`"""
+    """Move `AccountAddress`
+
+    Immutable and hashable. With an intern pool set (`set_intern_pool`), equal
+    addresses share one instance.
+    """
+
+    __slots__ = ("address",)
 
     address: bytes
     LENGTH: int = 20
+    _intern_pool: typing.ClassVar[typing.Optional[LRUCache]] = None
 
-    def __init__(self, address: bytes):
-        self.address = address
+    def __new__(cls, address: bytes) -> AccountAddress:
+        pool = cls._intern_pool
+        if pool is not None:
+            interned = pool.get(address)
+            if interned is not None:
+                return interned
 
         if len(address) != AccountAddress.LENGTH:
             raise Exception("Expected address of length 20")
 
+        self = object.__new__(cls)
+        object.__setattr__(self, "address", address)
+        if pool is not None:
+            pool.put(address, self)
+        return self
+
+    @classmethod
+    def set_intern_pool(cls, pool: typing.Optional[LRUCache]):
+        """Share instances through `pool` from now on; `None` turns it off."""
+        cls._intern_pool = pool
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), (self.address,))
+
     def __eq__(self, other: AccountAddress) -> bool:
-        return self.address == other.address
+        try:
+            return self.address == other.address
+        except AttributeError:
+            return NotImplemented
+
+    def __lt__(self, other: AccountAddress) -> bool:
+        if not isinstance(other, AccountAddress):
+            return NotImplemented
+        return bytes(self.address) < bytes(other.address)
+
+    def __hash__(self) -> int:
+        return hash(self.address)
 
     def __str__(self):
         return self.hex()
 
+    def __repr__(self):
+        return f"AccountAddress({self.hex()})"
+
     def hex(self) -> str:
         return f"0x{self.address.hex()}"
 
@@ -46,3 +97,11 @@ class AccountAddress:
 
     def serialize(self, serializer: Serializer):
         serializer.fixed_bytes(self.address)
+
+    def serialized_size(self) -> int:
+        return AccountAddress.LENGTH
+
+
+schema.define(
+    AccountAddress, schema.Struct(address=schema.Fixed(AccountAddress.LENGTH))
+)
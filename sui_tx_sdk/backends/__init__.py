@@ -0,0 +1,187 @@
+# Copyright (c) JubiterWallet
+# Author: Ruquan
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Crypto backends behind the Ed25519 and secp256k1 key types.
+
+Each algorithm has a registry of named backends, and a backend's library is
+only imported when that backend is first asked for. The backend an algorithm
+uses is, in order of precedence:
+
+1. the one passed to `use`;
+2. the one named by the `SUI_TX_SDK_ED25519_BACKEND` or
+   `SUI_TX_SDK_SECP256K1_BACKEND` environment variable;
+3. the first installed one in registration order (PyNaCl, then the
+   `secp256k1` binding), unless a micro-benchmark run on first use finds
+   another one faster by a clear margin.
+
+Keys keep the backend they were created with, so switching backends only
+affects keys created afterwards. A key object built outside the SDK is
+matched to its backend by type; see `owner`.
+
+A backend is a class of static methods and a `key_types` tuple holding its
+private and public key classes. Both algorithms share:
+
+- `signing_key(secret) -> sk` and `private_bytes(sk) -> bytes`
+- `public_key(sk) -> pk`, `verifying_key(data) -> pk` and `public_bytes(pk)`
+- `verify(pk, msg, sig) -> bool`
+
+Ed25519 backends add `sign(sk, msg)`, returning the 64-byte signature, and
+`verify_batch(msgs, pks, sigs)`, returning the indices that fail. secp256k1
+backends add `sign_recoverable(sk, msg)`, returning `r || s || v` over the
+sha256 of `msg`, and `recover(msg, sig) -> bytes`, returning the compressed
+public key; their `verify` takes `r || s` and accepts high-S signatures.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import time
+import typing
+
+ED25519 = "ed25519"
+SECP256K1 = "secp256k1"
+
+# Value of the environment variable that asks for the micro-benchmark.
+AUTO = "auto"
+
+# How many times faster than the first installed backend another one must be
+# to replace it, so backends within noise of each other never swap places.
+MARGIN = 1.25
+
+Loader = typing.Callable[[], typing.Any]
+
+_registry: typing.Dict[str, typing.Dict[str, Loader]] = {ED25519: {}, SECP256K1: {}}
+_loaded: typing.Dict[typing.Tuple[str, str], typing.Any] = {}
+_selected: typing.Dict[str, typing.Any] = {}
+
+
+def register(algorithm: str, name: str, loader: Loader):
+    """Register `loader`, which returns the backend or raises ImportError."""
+    _registry[algorithm][name] = loader
+    _loaded.pop((algorithm, name), None)
+
+
+def _module_loader(module: str, attr: str) -> Loader:
+    def load():
+        return getattr(importlib.import_module(f"{__name__}.{module}"), attr)
+
+    return load
+
+
+register(ED25519, "pynacl", _module_loader("pynacl", "Ed25519"))
+register(ED25519, "cryptography", _module_loader("cryptography", "Ed25519"))
+register(SECP256K1, "secp256k1", _module_loader("secp256k1", "Secp256k1"))
+register(SECP256K1, "coincurve", _module_loader("coincurve", "Secp256k1"))
+
+
+def load(algorithm: str, name: str) -> typing.Any:
+    """The backend `name` of `algorithm`. ImportError if it is not installed."""
+    try:
+        loader = _registry[algorithm][name]
+    except KeyError:
+        raise Exception(f"Unknown {algorithm} backend {name!r}") from None
+    backend = _loaded.get((algorithm, name))
+    if backend is None:
+        backend = loader()
+        _loaded[(algorithm, name)] = backend
+    return backend
+
+
+def available(algorithm: str) -> typing.List[str]:
+    """Names of the registered backends of `algorithm` that can be imported."""
+    names = []
+    for name in _registry[algorithm]:
+        try:
+            load(algorithm, name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get(algorithm: str, name: typing.Optional[str] = None) -> typing.Any:
+    """The backend `name`, or the backend `algorithm` currently uses."""
+    if name is not None:
+        return load(algorithm, name)
+    backend = _selected.get(algorithm)
+    if backend is None:
+        backend = _select(algorithm)
+        _selected[algorithm] = backend
+    return backend
+
+
+def owner(algorithm: str, key: typing.Any) -> typing.Any:
+    """The backend whose key classes `key` is an instance of.
+
+    Backends are tried in registration order, so only libraries up to the
+    matching one are imported. Keys of no known type get the backend in use.
+    """
+    for name in _registry[algorithm]:
+        try:
+            backend = load(algorithm, name)
+        except ImportError:
+            continue
+        if isinstance(key, getattr(backend, "key_types", ())):
+            return backend
+    return get(algorithm)
+
+
+def use(algorithm: str, name: typing.Optional[str]):
+    """Make `name` the backend of `algorithm`; `None` selects it again on next use."""
+    if name is None:
+        _selected.pop(algorithm, None)
+    else:
+        _selected[algorithm] = load(algorithm, name)
+
+
+def _select(algorithm: str) -> typing.Any:
+    name = os.environ.get(f"SUI_TX_SDK_{algorithm.upper()}_BACKEND", AUTO)
+    if name != AUTO:
+        return load(algorithm, name)
+    names = available(algorithm)
+    if not names:
+        raise ImportError(f"No {algorithm} backend is installed")
+    if len(names) == 1:
+        return load(algorithm, names[0])
+    timings = benchmark(algorithm, names)
+    if not timings:
+        raise ImportError(f"No {algorithm} backend passed its self-test")
+    fastest = min(timings, key=timings.get)
+    incumbent = names[0]
+    if incumbent in timings and timings[fastest] * MARGIN > timings[incumbent]:
+        return load(algorithm, incumbent)
+    return load(algorithm, fastest)
+
+
+def benchmark(
+    algorithm: str, names: typing.Optional[typing.List[str]] = None, rounds: int = 16
+) -> typing.Dict[str, float]:
+    """Seconds each backend takes to sign and verify `rounds` messages.
+
+    A backend whose signature does not verify is left out.
+    """
+    if names is None:
+        names = available(algorithm)
+    msg = bytes(range(256))
+    timings = {}
+    for name in names:
+        backend = load(algorithm, name)
+        sk = backend.signing_key(bytes(range(1, 33)))
+        pk = backend.verifying_key(backend.public_bytes(backend.public_key(sk)))
+        if algorithm == ED25519:
+            sign = backend.sign
+        else:
+            sign = backend.sign_recoverable
+        verify = backend.verify
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            sig = sign(sk, msg)[:64]
+            ok = verify(pk, msg, sig)
+        elapsed = time.perf_counter() - start
+        if ok:
+            timings[name] = elapsed
+    return timings
@@ -0,0 +1,51 @@
+# Copyright (c) JubiterWallet
+# Author: Ruquan
+# SPDX-License-Identifier: Apache-2.0
+
+"""secp256k1 on coincurve (libsecp256k1)."""
+
+from __future__ import annotations
+
+from coincurve import PrivateKey, PublicKey
+from coincurve.ecdsa import cdata_to_der, deserialize_compact, signature_normalize
+
+
+class Secp256k1:
+    name = "coincurve"
+    key_types = (PrivateKey, PublicKey)
+
+    @staticmethod
+    def signing_key(secret: bytes) -> PrivateKey:
+        return PrivateKey(bytes(secret))
+
+    @staticmethod
+    def private_bytes(sk: PrivateKey) -> bytes:
+        return sk.secret
+
+    @staticmethod
+    def public_key(sk: PrivateKey) -> PublicKey:
+        return sk.public_key
+
+    @staticmethod
+    def verifying_key(data: bytes) -> PublicKey:
+        return PublicKey(bytes(data))
+
+    @staticmethod
+    def public_bytes(pk: PublicKey) -> bytes:
+        return pk.format()
+
+    @staticmethod
+    def sign_recoverable(sk: PrivateKey, msg: bytes) -> bytes:
+        return sk.sign_recoverable(msg)
+
+    @staticmethod
+    def verify(pk: PublicKey, msg: bytes, sig: bytes) -> bool:
+        try:
+            _, sig = signature_normalize(deserialize_compact(sig))
+            return pk.verify(cdata_to_der(sig), msg)
+        except Exception:
+            return False
+
+    @staticmethod
+    def recover(msg: bytes, sig: bytes) -> bytes:
+        return PublicKey.from_signature_and_message(bytes(sig), msg).format()
@@ -0,0 +1,75 @@
+# Copyright (c) JubiterWallet
+# Author: Ruquan
+# SPDX-License-Identifier: Apache-2.0
+
+"""Ed25519 on `cryptography` (OpenSSL).
+
+`cryptography` has no recoverable ECDSA, which Sui secp256k1 signatures need,
+so it only provides Ed25519.
+"""
+
+from __future__ import annotations
+
+import typing
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+
+
+class Ed25519:
+    name = "cryptography"
+    key_types = (Ed25519PrivateKey, Ed25519PublicKey)
+
+    @staticmethod
+    def signing_key(secret: bytes) -> Ed25519PrivateKey:
+        return Ed25519PrivateKey.from_private_bytes(bytes(secret))
+
+    @staticmethod
+    def private_bytes(sk: Ed25519PrivateKey) -> bytes:
+        return sk.private_bytes(Encoding.Raw, PrivateFormat.Raw, NoEncryption())
+
+    @staticmethod
+    def public_key(sk: Ed25519PrivateKey) -> Ed25519PublicKey:
+        return sk.public_key()
+
+    @staticmethod
+    def verifying_key(data: bytes) -> Ed25519PublicKey:
+        return Ed25519PublicKey.from_public_bytes(bytes(data))
+
+    @staticmethod
+    def public_bytes(pk: Ed25519PublicKey) -> bytes:
+        return pk.public_bytes(Encoding.Raw, PublicFormat.Raw)
+
+    @staticmethod
+    def sign(sk: Ed25519PrivateKey, msg: bytes) -> bytes:
+        return sk.sign(msg)
+
+    @staticmethod
+    def verify(pk: Ed25519PublicKey, msg: bytes, sig: bytes) -> bool:
+        try:
+            pk.verify(sig, msg)
+        except InvalidSignature:
+            return False
+        return True
+
+    @staticmethod
+    def verify_batch(
+        msgs: typing.Sequence[bytes],
+        pks: typing.Sequence[Ed25519PublicKey],
+        sigs: typing.Sequence[bytes],
+    ) -> typing.List[int]:
+        verify = Ed25519.verify
+        return [
+            i
+            for (i, (msg, pk, sig)) in enumerate(zip(msgs, pks, sigs))
+            if not verify(pk, msg, sig)
+        ]
@@ -0,0 +1,65 @@
+# Copyright (c) JubiterWallet
+# Author: Ruquan
+# SPDX-License-Identifier: Apache-2.0
+
+"""Ed25519 on PyNaCl (libsodium)."""
+
+from __future__ import annotations
+
+import typing
+
+from nacl.bindings import crypto_sign_open
+from nacl.signing import SigningKey, VerifyKey
+
+
+class Ed25519:
+    name = "pynacl"
+    key_types = (SigningKey, VerifyKey)
+
+    @staticmethod
+    def signing_key(secret: bytes) -> SigningKey:
+        return SigningKey(bytes(secret))
+
+    @staticmethod
+    def private_bytes(sk: SigningKey) -> bytes:
+        return sk.encode()
+
+    @staticmethod
+    def public_key(sk: SigningKey) -> VerifyKey:
+        return sk.verify_key
+
+    @staticmethod
+    def verifying_key(data: bytes) -> VerifyKey:
+        return VerifyKey(bytes(data))
+
+    @staticmethod
+    def public_bytes(pk: VerifyKey) -> bytes:
+        return pk.encode()
+
+    @staticmethod
+    def sign(sk: SigningKey, msg: bytes) -> bytes:
+        return sk.sign(msg).signature
+
+    @staticmethod
+    def verify(pk: VerifyKey, msg: bytes, sig: bytes) -> bool:
+        try:
+            pk.verify(msg, sig)
+        except Exception:
+            return False
+        return True
+
+    @staticmethod
+    def verify_batch(
+        msgs: typing.Sequence[bytes],
+        pks: typing.Sequence[VerifyKey],
+        sigs: typing.Sequence[bytes],
+    ) -> typing.List[int]:
+        # libsodium has no multi-scalar multiplication to batch with, so this
+        # goes straight to crypto_sign_open, skipping the VerifyKey wrapper.
+        failed = []
+        for (i, (msg, pk, sig)) in enumerate(zip(msgs, pks, sigs)):
+            try:
+                crypto_sign_open(sig + msg, pk.encode())
+            except Exception:
+                failed.append(i)
+        return failed
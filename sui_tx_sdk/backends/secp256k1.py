@@ -0,0 +1,57 @@
+# Copyright (c) JubiterWallet
+# Author: Ruquan
+# SPDX-License-Identifier: Apache-2.0
+
+"""secp256k1 on the `secp256k1` binding (libsecp256k1)."""
+
+from __future__ import annotations
+
+import secp256k1
+
+# Stateless helper for parsing signatures. secp256k1 >= 0.14 runs every call
+# on one module-wide libsecp256k1 context, so no context is created per call.
+_ECDSA = secp256k1.ECDSA()
+
+
+class Secp256k1:
+    name = "secp256k1"
+    key_types = (secp256k1.PrivateKey, secp256k1.PublicKey)
+
+    @staticmethod
+    def signing_key(secret: bytes) -> secp256k1.PrivateKey:
+        return secp256k1.PrivateKey(bytes(secret))
+
+    @staticmethod
+    def private_bytes(sk: secp256k1.PrivateKey) -> bytes:
+        return bytes.fromhex(sk.serialize())
+
+    @staticmethod
+    def public_key(sk: secp256k1.PrivateKey) -> secp256k1.PublicKey:
+        return sk.pubkey
+
+    @staticmethod
+    def verifying_key(data: bytes) -> secp256k1.PublicKey:
+        return secp256k1.PublicKey(bytes(data), True)
+
+    @staticmethod
+    def public_bytes(pk: secp256k1.PublicKey) -> bytes:
+        return pk.serialize()
+
+    @staticmethod
+    def sign_recoverable(sk: secp256k1.PrivateKey, msg: bytes) -> bytes:
+        rs, v = sk.ecdsa_recoverable_serialize(sk.ecdsa_sign_recoverable(msg))
+        return rs + bytes([v])
+
+    @staticmethod
+    def verify(pk: secp256k1.PublicKey, msg: bytes, sig: bytes) -> bool:
+        try:
+            sig = _ECDSA.ecdsa_deserialize_compact(sig)
+            _, sig = _ECDSA.ecdsa_signature_normalize(sig)
+            return pk.ecdsa_verify(msg, sig)
+        except Exception:
+            return False
+
+    @staticmethod
+    def recover(msg: bytes, sig: bytes) -> bytes:
+        sig = _ECDSA.ecdsa_recoverable_deserialize(sig[:64], sig[64])
+        return secp256k1.PublicKey(_ECDSA.ecdsa_recover(msg, sig)).serialize()
@@ -7,9 +7,10 @@ This is a simple BCS serializer and deserializer. Learn more at https://github.c
 
 from __future__ import annotations
 
-import io
+import array
+import struct
+import sys
 import typing
-import unittest
 
 MAX_U8 = 2**8 - 1
 MAX_U16 = 2**16 - 1
@@ -17,22 +18,105 @@ MAX_U32 = 2**32 - 1
 MAX_U64 = 2**64 - 1
 MAX_U128 = 2**128 - 1
 
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+# `array("Q")` packs and range checks whole u64 vectors in C; it matches the
+# BCS layout only where it holds little-endian 8-byte items.
+_U64_ARRAY = array.array("Q").itemsize == 8 and sys.byteorder == "little"
+
+
+# Encodings of every value below 2**14, which covers practically all lengths
+# and enum tags; larger values are encoded byte by byte.
+_ULEB128_TABLE_SIZE = 1 << 14
+_ULEB128_TABLE = tuple(
+    [bytes((value,)) for value in range(0x80)]
+    + [bytes((low, high)) for high in range(1, 0x80) for low in range(0x80, 0x100)]
+)
+
+
+def uleb128_size(value: int) -> int:
+    """Number of bytes `Serializer.uleb128` writes for `value`."""
+    if value < 0x80:
+        return 1
+    return (value.bit_length() + 6) // 7
+
+
+def uleb128_encode(value: int) -> bytes:
+    """ULEB128 encoding of a u32, as written by `Serializer.uleb128`."""
+    if 0 <= value < _ULEB128_TABLE_SIZE:
+        return _ULEB128_TABLE[value]
+    if value < 0 or value > MAX_U32:
+        raise Exception(f"Cannot encode {value} into uleb128")
+
+    output = bytearray()
+    while value >= 0x80:
+        # Write 7 (lowest) bits of data and set the 8th bit to 1.
+        output.append(value & 0x7F | 0x80)
+        value >>= 7
+    # Write the remaining bits of data and set the highest bit to 0.
+    output.append(value)
+    return bytes(output)
+
+
+def bytes_size(value: bytes) -> int:
+    return uleb128_size(len(value)) + len(value)
+
+
+def str_size(value: str) -> int:
+    length = len(value) if value.isascii() else len(value.encode())
+    return uleb128_size(length) + length
+
+
+def sequence_size(
+    values: typing.List[typing.Any],
+    value_size: typing.Callable[[typing.Any], int],
+) -> int:
+    return uleb128_size(len(values)) + sum(map(value_size, values))
+
 
 class Deserializer:
-    _input: io.BytesIO
+    """Cursor over a BCS encoded buffer.
+
+    The input is wrapped in a `memoryview` and read with an integer offset, so
+    integers are decoded in place. By default `bytes`/`fixed_bytes` return
+    `bytes` copies; with `zero_copy=True` they return read-only `memoryview`
+    slices of the input instead, which avoids a copy per address and digest but
+    keeps the input buffer alive for as long as the slices are referenced.
+    """
+
+    _input: memoryview
+    _offset: int
     _length: int
+    _zero_copy: bool
     T = typing.TypeVar("T")
     U = typing.TypeVar("U")
 
-    def __init__(self, data: bytes):
-        self._length = len(data)
-        self._input = io.BytesIO(data)
+    def __init__(self, data: bytes, zero_copy: bool = False):
+        view = memoryview(data)
+        if view.ndim != 1 or view.format != "B":
+            view = view.cast("B")
+        self._input = view.toreadonly()
+        self._offset = 0
+        self._length = len(view)
+        self._zero_copy = zero_copy
 
     def remaining(self) -> int:
-        return self._length - self._input.tell()
+        return self._length - self._offset
+
+    def offset(self) -> int:
+        return self._offset
+
+    def slice(self, start: int, end: int) -> bytes:
+        """Bytes of the input between two offsets, copied unless `zero_copy`."""
+        value = self._input[start:end]
+        if self._zero_copy:
+            return value
+        return value.tobytes()
 
     def bool(self) -> bool:
-        value = int.from_bytes(self._read(1), byteorder="little", signed=False)
+        value = self.u8()
         if value == 0:
             return False
         elif value == 1:
@@ -69,78 +153,173 @@ class Deserializer:
             values.append(value_decoder(self))
         return values
 
+    def fixed_bytes_sequence(self, length: int) -> typing.List[bytes]:
+        """Decode a sequence of `length`-byte values with one bounds check."""
+        count = self.uleb128()
+        start = self._advance(count * length)
+        view = self._input
+        if self._zero_copy:
+            return [view[i : i + length] for i in range(start, self._offset, length)]
+        data = view[start : self._offset].tobytes()
+        return [data[i : i + length] for i in range(0, len(data), length)]
+
+    def packed_sequence(self, layout: struct.Struct) -> typing.Iterator[tuple]:
+        """Decode a sequence of fixed-width `layout` records in one pass."""
+        count = self.uleb128()
+        start = self._advance(count * layout.size)
+        return layout.iter_unpack(self._input[start : self._offset])
+
+    def u64_sequence(self) -> typing.List[int]:
+        count = self.uleb128()
+        start = self._advance(count * 8)
+        if _U64_ARRAY:
+            values = array.array("Q")
+            values.frombytes(self._input[start : self._offset])
+            return values.tolist()
+        return list(struct.unpack_from(f"<{count}Q", self._input, start))
+
     def str(self) -> str:
-        return self.bytes().decode()
+        length = self.uleb128()
+        start = self._advance(length)
+        return str(self._input[start : self._offset], "utf-8")
 
     def struct(self, struct: T) -> T:
         return struct.deserialize(self)
 
     def u8(self) -> int:
-        return self._read_int(1)
+        offset = self._offset
+        if offset >= self._length:
+            self._raise_eof(1)
+        self._offset = offset + 1
+        return self._input[offset]
 
     def u16(self) -> int:
-        return self._read_int(2)
+        return _U16.unpack_from(self._input, self._advance(2))[0]
 
     def u32(self) -> int:
-        return self._read_int(4)
+        return _U32.unpack_from(self._input, self._advance(4))[0]
 
     def u64(self) -> int:
-        return self._read_int(8)
+        return _U64.unpack_from(self._input, self._advance(8))[0]
 
     def u128(self) -> int:
         return self._read_int(16)
 
     def uleb128(self) -> int:
+        data = self._input
+        offset = self._offset
+        if offset + 1 < self._length:
+            byte = data[offset]
+            if byte < 0x80:
+                self._offset = offset + 1
+                return byte
+            high = data[offset + 1]
+            if 0 < high < 0x80:
+                self._offset = offset + 2
+                return byte & 0x7F | high << 7
+
         value = 0
         shift = 0
-
-        while value <= MAX_U32:
-            byte = self._read_int(1)
+        while True:
+            if offset >= self._length:
+                self._raise_eof(offset - self._offset + 1)
+            byte = data[offset]
+            offset += 1
             value |= (byte & 0x7F) << shift
-            if byte & 0x80 == 0:
+            if byte < 0x80:
                 break
             shift += 7
+            if shift > 28:
+                raise Exception("Unexpectedly large uleb128 value")
 
-        if value > MAX_U128:
-            raise Exception("Unexpectedly large uleb128 value")
+        if value > MAX_U32:
+            raise Exception(f"uleb128 value {value} does not fit into a u32")
+        if byte == 0 and shift:
+            raise Exception("Non-canonical uleb128 encoding")
 
+        self._offset = offset
         return value
 
+    def _advance(self, length: int) -> int:
+        """Move the cursor forward by `length` bytes and return the old offset."""
+        offset = self._offset
+        end = offset + length
+        if end > self._length:
+            self._raise_eof(length)
+        self._offset = end
+        return offset
+
+    def _raise_eof(self, length: int):
+        error = (
+            f"Unexpected end of input. Requested: {length}, found: {self.remaining()}"
+        )
+        raise Exception(error)
+
     def _read(self, length: int) -> bytes:
-        value = self._input.read(length)
-        if value is None or len(value) < length:
-            actual_length = 0 if value is None else len(value)
-            error = (
-                f"Unexpected end of input. Requested: {length}, found: {actual_length}"
-            )
-            raise Exception(error)
-        return value
+        start = self._advance(length)
+        value = self._input[start : self._offset]
+        if self._zero_copy:
+            return value
+        return value.tobytes()
 
     def _read_int(self, length: int) -> int:
-        return int.from_bytes(self._read(length), byteorder="little", signed=False)
+        start = self._advance(length)
+        return int.from_bytes(
+            self._input[start : self._offset], byteorder="little", signed=False
+        )
 
 
 class Serializer:
-    _output: io.BytesIO
+    """Encoder writing BCS into a single growable `bytearray`.
+
+    Nested values (sequence elements, map entries, struct fields) are encoded
+    straight into the same buffer, so no temporary serializer is created per
+    element. Pass `output` to append to a caller-owned `bytearray` instead;
+    it must not have exported memoryviews while the serializer writes to it.
+    """
+
+    _output: bytearray
 
     T = typing.TypeVar("T")
     U = typing.TypeVar("U")
 
-    def __init__(self):
-        self._output = io.BytesIO()
+    def __init__(self, output: typing.Optional[bytearray] = None):
+        self._output = bytearray() if output is None else output
 
     def output(self) -> bytes:
-        return self._output.getvalue()
+        return bytes(self._output)
+
+    def size(self) -> int:
+        return len(self._output)
+
+    def reset(self):
+        """Drop everything written so far so the serializer can be reused."""
+        del self._output[:]
+
+    def output_into(self, buf: typing.Union[bytearray, memoryview], offset: int) -> int:
+        """Copy the output into `buf` at `offset`; return the offset past it.
+
+        A `bytearray` grows as needed, a `memoryview` must have room.
+        """
+        end = offset + len(self._output)
+        if offset < 0 or offset > len(buf):
+            raise Exception(f"Offset {offset} is outside a buffer of {len(buf)}")
+        if end > len(buf) and not isinstance(buf, bytearray):
+            raise Exception(
+                f"Buffer too small. Requested: {end - offset}, found: {len(buf) - offset}"
+            )
+        buf[offset:end] = self._output
+        return end
 
     def bool(self, value: bool):
         self._write_int(int(value), 1)
 
     def bytes(self, value: bytes):
         self.uleb128(len(value))
-        self._output.write(value)
+        self._write(value)
 
     def fixed_bytes(self, value):
-        self._output.write(value)
+        self._write(value)
 
     def map(
         self,
@@ -148,17 +327,27 @@ class Serializer:
         key_encoder: typing.Callable[[Serializer, T], None],
         value_encoder: typing.Callable[[Serializer, U], None],
     ):
-        encoded_values = []
-        for (key, value) in values.items():
-            encoded_values.append(
-                (self._encoding(key, key_encoder), self._encoding(value, value_encoder))
-            )
-        encoded_values.sort(key=lambda item: item[0])
+        self.uleb128(len(values))
 
-        self.uleb128(len(encoded_values))
-        for (key, value) in encoded_values:
-            self.fixed_bytes(key)
-            self.fixed_bytes(value)
+        # Encode every entry in place, remembering where each key and value
+        # ends, then reorder the entries by their encoded key.
+        output = self._output
+        start = len(output)
+        entries = []
+        for (key, value) in values.items():
+            key_start = len(output)
+            key_encoder(self, key)
+            key_end = len(output)
+            value_encoder(self, value)
+            entries.append((key_start, key_end, len(output)))
+
+        view = memoryview(output)
+        try:
+            entries.sort(key=lambda entry: view[entry[0] : entry[1]].tobytes())
+            encoded = b"".join(view[entry[0] : entry[2]] for entry in entries)
+        finally:
+            view.release()
+        output[start:] = encoded
 
     @staticmethod
     def sequence_serializer(
@@ -173,7 +362,27 @@ class Serializer:
     ):
         self.uleb128(len(values))
         for value in values:
-            self.fixed_bytes(self._encoding(value, value_encoder))
+            value_encoder(self, value)
+
+    def fixed_bytes_sequence(self, values: typing.List[bytes], length: int):
+        """Encode a sequence of `length`-byte values with a single write."""
+        if not all(map(length.__eq__, map(len, values))):
+            raise Exception(f"Expected every value to have length {length}")
+        self.uleb128(len(values))
+        self._write(b"".join(values))
+
+    def u64_sequence(self, values: typing.List[int]):
+        """Encode a sequence of u64 with a single range check and write."""
+        try:
+            if _U64_ARRAY:
+                data = array.array("Q", values).tobytes()
+            else:
+                data = struct.pack(f"<{len(values)}Q", *values)
+        except (OverflowError, struct.error):
+            value = next(x for x in values if not 0 <= x <= MAX_U64)
+            raise Exception(f"Cannot encode {value} into u64") from None
+        self.uleb128(len(values))
+        self._write(data)
 
     def str(self, value: str):
         self.bytes(value.encode())
@@ -212,170 +421,95 @@ class Serializer:
         self._write_int(value, 16)
 
     def uleb128(self, value: int):
-        if value > MAX_U32:
-            raise Exception(f"Cannot encode {value} into uleb128")
-
-        while value >= 0x80:
-            # Write 7 (lowest) bits of data and set the 8th bit to 1.
-            byte = value & 0x7F
-            self.u8(byte | 0x80)
-            value >>= 7
+        if 0 <= value < _ULEB128_TABLE_SIZE:
+            self._write(_ULEB128_TABLE[value])
+        else:
+            self._write(uleb128_encode(value))
 
-        # Write the remaining bits of data and set the highest bit to 0.
-        self.u8(value & 0x7F)
+    def _write(self, value):
+        self._output += value
 
     def _write_int(self, value: int, length: int):
-        self._output.write(value.to_bytes(length, "little", signed=False))
-
-    @staticmethod
-    def _encoding(
-        value: T,
-        encoder: typing.Callable[[Serializer, T], None],
-    ) -> bytes:
-        ser = Serializer()
-        encoder(ser, value)
-        return ser.output()
-
-
-class Test(unittest.TestCase):
-    def test_bool_true(self):
-        in_value = True
-
-        ser = Serializer()
-        ser.bool(in_value)
-        der = Deserializer(ser.output())
-        out_value = der.bool()
-
-        self.assertEqual(in_value, out_value)
-
-    def test_bool_false(self):
-        in_value = False
+        self._write(value.to_bytes(length, "little", signed=False))
 
-        ser = Serializer()
-        ser.bool(in_value)
-        der = Deserializer(ser.output())
-        out_value = der.bool()
-
-        self.assertEqual(in_value, out_value)
-
-    def test_bool_error(self):
-        ser = Serializer()
-        ser.u8(32)
-        der = Deserializer(ser.output())
-        with self.assertRaises(Exception):
-            der.bool()
-
-    def test_bytes(self):
-        in_value = b"1234567890"
-
-        ser = Serializer()
-        ser.bytes(in_value)
-        der = Deserializer(ser.output())
-        out_value = der.bytes()
-
-        self.assertEqual(in_value, out_value)
-
-    def test_map(self):
-        in_value = {"a": 12345, "b": 99234, "c": 23829}
-
-        ser = Serializer()
-        ser.map(in_value, Serializer.str, Serializer.u32)
-        der = Deserializer(ser.output())
-        out_value = der.map(Deserializer.str, Deserializer.u32)
-
-        self.assertEqual(in_value, out_value)
-
-    def test_sequence(self):
-        in_value = ["a", "abc", "def", "ghi"]
-
-        ser = Serializer()
-        ser.sequence(in_value, Serializer.str)
-        der = Deserializer(ser.output())
-        out_value = der.sequence(Deserializer.str)
-
-        self.assertEqual(in_value, out_value)
-
-    def test_sequence_serializer(self):
-        in_value = ["a", "abc", "def", "ghi"]
-
-        ser = Serializer()
-        seq_ser = Serializer.sequence_serializer(Serializer.str)
-        seq_ser(ser, in_value)
-        der = Deserializer(ser.output())
-        out_value = der.sequence(Deserializer.str)
-
-        self.assertEqual(in_value, out_value)
-
-    def test_str(self):
-        in_value = "1234567890"
-
-        ser = Serializer()
-        ser.str(in_value)
-        der = Deserializer(ser.output())
-        out_value = der.str()
-
-        self.assertEqual(in_value, out_value)
-
-    def test_u8(self):
-        in_value = 15
 
-        ser = Serializer()
-        ser.u8(in_value)
-        der = Deserializer(ser.output())
-        out_value = der.u8()
-
-        self.assertEqual(in_value, out_value)
+class HashingSerializer(Serializer):
+    """Serializer that feeds everything it writes into a running hash.
 
-    def test_u16(self):
-        in_value = 11115
-
-        ser = Serializer()
-        ser.u16(in_value)
-        der = Deserializer(ser.output())
-        out_value = der.u16()
+    `hash_factory` is a hashlib constructor such as `hashlib.sha3_256`. Writes
+    are hashed in blocks of `block_size` bytes and then dropped, so computing a
+    digest never holds the whole encoding. With `keep_output` the encoding is
+    kept as well and `output()` and `digest()` come from the same pass.
+    """
 
-        self.assertEqual(in_value, out_value)
-
-    def test_u32(self):
-        in_value = 1111111115
-
-        ser = Serializer()
-        ser.u32(in_value)
-        der = Deserializer(ser.output())
-        out_value = der.u32()
+    _hash_factory: typing.Callable[[], typing.Any]
+    _hasher: typing.Any
+    _keep_output: bool
+    _block_size: int
+    _hashed: int
+    _dropped: int
 
-        self.assertEqual(in_value, out_value)
-
-    def test_u64(self):
-        in_value = 1111111111111111115
-
-        ser = Serializer()
-        ser.u64(in_value)
-        der = Deserializer(ser.output())
-        out_value = der.u64()
-
-        self.assertEqual(in_value, out_value)
+    def __init__(
+        self,
+        hash_factory: typing.Callable[[], typing.Any],
+        keep_output: bool = False,
+        block_size: int = 64 * 1024,
+    ):
+        super().__init__()
+        self._hash_factory = hash_factory
+        self._hasher = hash_factory()
+        self._keep_output = keep_output
+        self._block_size = block_size
+        self._hashed = 0
+        self._dropped = 0
+
+    def digest(self) -> bytes:
+        self._flush()
+        return self._hasher.digest()
 
-    def test_u128(self):
-        in_value = 1111111111111111111111111111111111115
+    def output(self) -> bytes:
+        if not self._keep_output:
+            raise Exception("HashingSerializer does not keep its output")
+        return super().output()
 
-        ser = Serializer()
-        ser.u128(in_value)
-        der = Deserializer(ser.output())
-        out_value = der.u128()
+    def size(self) -> int:
+        return self._dropped + len(self._output)
 
-        self.assertEqual(in_value, out_value)
+    def reset(self):
+        super().reset()
+        self._hasher = self._hash_factory()
+        self._hashed = 0
+        self._dropped = 0
 
-    def test_uleb128(self):
-        in_value = 1111111115
+    def output_into(self, buf: typing.Union[bytearray, memoryview], offset: int) -> int:
+        if not self._keep_output:
+            raise Exception("HashingSerializer does not keep its output")
+        return super().output_into(buf, offset)
 
+    def map(
+        self,
+        values: typing.Dict[T, U],
+        key_encoder: typing.Callable[[Serializer, T], None],
+        value_encoder: typing.Callable[[Serializer, U], None],
+    ):
+        # Entries are reordered after encoding, which needs them in one buffer.
         ser = Serializer()
-        ser.uleb128(in_value)
-        der = Deserializer(ser.output())
-        out_value = der.uleb128()
-
-        self.assertEqual(in_value, out_value)
-
-
-if __name__ == "__main__":
-    unittest.main()
+        ser.map(values, key_encoder, value_encoder)
+        self._write(ser._output)
+
+    def _write(self, value):
+        output = self._output
+        output += value
+        if len(output) - self._hashed >= self._block_size:
+            self._flush()
+
+    def _flush(self):
+        output = self._output
+        if self._hashed < len(output):
+            with memoryview(output) as view:
+                self._hasher.update(view[self._hashed :])
+        if self._keep_output:
+            self._hashed = len(output)
+        else:
+            self._dropped += len(output)
+            del output[:]
@@ -0,0 +1,83 @@
+# Copyright (c) JubiterWallet
+# Author: Ruquan
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Bounded caches shared by the models.
+
+`LRUCache` keeps at most `maxsize` entries, evicting the least recently used
+one, and counts hits and misses so callers can tell whether a cache pays off.
+It is safe to share between threads: verification thread pools hit the
+address and key caches concurrently.
+"""
+
+from __future__ import annotations
+
+import collections
+import threading
+import typing
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+
+class LRUCache(typing.Generic[K, V]):
+    _entries: collections.OrderedDict
+    _lock: threading.Lock
+    maxsize: int
+    hits: int
+    misses: int
+
+    def __init__(self, maxsize: int = 1 << 16):
+        if maxsize <= 0:
+            raise Exception(f"Cache size must be positive, get {maxsize}")
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def get(self, key: K, default: typing.Optional[V] = None) -> typing.Optional[V]:
+        entries = self._entries
+        with self._lock:
+            try:
+                value = entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: K, value: V):
+        entries = self._entries
+        with self._lock:
+            entries[key] = value
+            entries.move_to_end(key)
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+    def get_or_create(self, key: K, create: typing.Callable[[], V]) -> V:
+        """Return the cached value for `key`, creating and caching it on a miss.
+
+        `create` runs without the lock, so two threads missing the same key
+        may both call it; the last one to finish is kept.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = create()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
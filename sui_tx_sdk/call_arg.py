@@ -5,11 +5,14 @@
 from __future__ import annotations
 
 import typing
-from .bcs import Deserializer, Serializer
+from . import schema
+from .bcs import Deserializer, Serializer, bytes_size, sequence_size, uleb128_size
 from .object import ObjectRef, ObjectID
 
 
 class CallArg:
+    __slots__ = ("variant", "value")
+
     PURE: int = 0
     OBJECT: int = 1
     OBJECT_VECTOR: int = 2
@@ -57,8 +60,17 @@ class CallArg:
         else:
             serializer.struct(self.value)
 
+    def serialized_size(self) -> int:
+        if self.variant == CallArg.OBJECT_VECTOR:
+            size = sequence_size(self.value, ObjectArg.serialized_size)
+        else:
+            size = self.value.serialized_size()
+        return uleb128_size(self.variant) + size
+
 
 class PureArg:
+    __slots__ = ("value",)
+
     value: bytes
 
     def __init__(self, v: bytes):
@@ -78,8 +90,13 @@ class PureArg:
     def serialize(self, serializer: Serializer):
         serializer.bytes(self.value)
 
+    def serialized_size(self) -> int:
+        return bytes_size(self.value)
+
 
 class ObjectArg:
+    __slots__ = ("variant", "value")
+
     IMM_OR_OWNED_OBJECT: int = 0
     SHARED_OBJECT: int = 1
 
@@ -118,8 +135,13 @@ class ObjectArg:
         serializer.uleb128(self.variant)
         serializer.struct(self.value)
 
+    def serialized_size(self) -> int:
+        return uleb128_size(self.variant) + self.value.serialized_size()
+
 
 class SharedObjectArg:
+    __slots__ = ("object_id", "initial_shared_version")
+
     object_id: ObjectID
     initial_shared_version: int
 
@@ -146,5 +168,17 @@ class SharedObjectArg:
         serializer.struct(self.object_id)
         serializer.u64(self.initial_shared_version)
 
+    def serialized_size(self) -> int:
+        return self.object_id.serialized_size() + 8
+
 
 ARG = PureArg | ObjectArg | typing.List[ObjectArg]
+
+
+schema.define(CallArg, schema.Enum(PureArg, ObjectArg, schema.Vector(ObjectArg)))
+schema.define(PureArg, schema.Struct(value=schema.BYTES))
+schema.define(ObjectArg, schema.Enum(ObjectRef, SharedObjectArg))
+schema.define(
+    SharedObjectArg,
+    schema.Struct(object_id=ObjectID, initial_shared_version=schema.U64),
+)
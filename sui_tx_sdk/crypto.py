@@ -3,14 +3,18 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from __future__ import annotations
+import itertools
 import typing
 from base64 import b64encode, b64decode
 
-from .bcs import Deserializer, Serializer
+from .bcs import Deserializer, Serializer, bytes_size
 from .sui_address import SuiAddress
 from .ed25519 import Ed25519Signature, Ed25519PublicKey, Ed25519KeyPair
 from .secp256k1 import Secp256k1Signature, Secp256k1PublicKey, Secp256k1KeyPair
 
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
 
 class SuiKeyPair:
     value: Ed25519KeyPair | Secp256k1KeyPair
@@ -26,6 +30,9 @@ class SuiKeyPair:
     def public_key(self) -> PublicKey:
         return PublicKey(self.value.public_key())
 
+    def address(self) -> SuiAddress:
+        return self.public_key().address()
+
     def base64(self) -> str:
         data = bytearray()
         data.append(self.public_key().scheme())
@@ -52,6 +59,52 @@ class SuiKeyPair:
         sig = self.value.sign(msg)
         return Signature.from_public_signature(self.public_key(), sig)
 
+    def sign_many(
+        self,
+        messages: typing.Iterable[bytes],
+        workers: typing.Optional[int] = None,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        chunksize: int = 256,
+    ) -> typing.List[Signature]:
+        """Sign every message, in order, working out the key and flag once.
+
+        With `workers` a process pool of that size signs chunks of
+        `chunksize` messages; pass `executor` to reuse a pool instead. Either
+        way the private key is sent to the workers.
+        """
+        pk = self.value.public_key()
+        flag = bytes([pk.scheme()])
+        pk = pk.bytes()
+        if flag[0] == Ed25519SuiSignature.SCHEME:
+            wrapper = Ed25519SuiSignature
+        else:
+            wrapper = Secp256k1SuiSignature
+
+        messages = list(messages)
+        if executor is None and workers is not None and workers > 1:
+            # Imported on use: concurrent.futures pulls in logging and threading.
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(workers) as pool:
+                return self.sign_many(messages, executor=pool, chunksize=chunksize)
+
+        if executor is None:
+            sign = self.value.sign
+            sigs = [sign(msg).bytes() for msg in messages]
+        else:
+            chunks = [
+                messages[i : i + chunksize] for i in range(0, len(messages), chunksize)
+            ]
+            key = itertools.repeat(self.base64(), len(chunks))
+            sigs = itertools.chain.from_iterable(executor.map(_sign_chunk, key, chunks))
+
+        return [Signature(wrapper(flag + sig + pk)) for sig in sigs]
+
+
+def _sign_chunk(key: str, messages: typing.List[bytes]) -> typing.List[bytes]:
+    sign = SuiKeyPair.from_base64(key).value.sign
+    return [sign(msg).bytes() for msg in messages]
+
 
 Ed25519SuiPublicKey = typing.NewType("Ed25519SuiPublicKey", Ed25519PublicKey)
 Secp256k1SuiPublicKey = typing.NewType("Secp256k1SuiPublicKey", Secp256k1PublicKey)
@@ -85,6 +138,9 @@ class PublicKey:
     def bytes(self) -> bytes:
         return self.value.bytes()
 
+    def address(self) -> SuiAddress:
+        return SuiAddress.from_public_key_bytes(self.scheme(), self.bytes())
+
     def base64(self) -> str:
         data = bytearray()
         data.append(self.scheme())
@@ -134,7 +190,7 @@ class Signature:
 
     @staticmethod
     def deserialize(deserializer: Deserializer) -> Signature:
-        data = deserializer.bytes()
+        data = bytes(deserializer.bytes())
         return Signature.from_bytes(data)
 
     @staticmethod
@@ -152,15 +208,22 @@ class Signature:
     def serialize(self, serializer: Serializer):
         serializer.bytes(self.bytes())
 
+    def serialized_size(self) -> int:
+        return bytes_size(self.bytes())
+
     def get_verification_inputs(self, author: SuiAddress):
-        pk = self.value.public_key
-        received = SuiAddress.from_public_key(pk)
+        # The address comes from the raw key bytes, so a mismatched author is
+        # rejected before the key is parsed.
+        received = SuiAddress.from_public_key_bytes(
+            self.value.SCHEME, self.value.public_key_bytes()
+        )
         if not received == author:
             raise Exception(
                 f"get_verification_inputs Failed. Author is {author}, received is {received}"
             )
 
         sig = self.value.signature
+        pk = self.value.public_key
 
         return sig, pk
 
@@ -171,6 +234,10 @@ class Signature:
 
 
 class Ed25519SuiSignature:
+    """Scheme flag, signature and public key; the parts are parsed once, on use."""
+
+    __slots__ = ("value", "_signature", "_public_key")
+
     value: bytes
     LENGTH: int = Ed25519PublicKey.LENGTH + Ed25519Signature.LENGTH + 1
     SCHEME: int = Ed25519PublicKey.SCHEME
@@ -181,14 +248,25 @@ class Ed25519SuiSignature:
                 f"Expected signature of length {Ed25519SuiSignature.LENGTH}"
             )
         self.value = signature
+        self._signature = None
+        self._public_key = None
 
     @property
     def signature(self) -> Ed25519Signature:
-        return Ed25519Signature.from_bytes(self.value[1 : 1 + Ed25519Signature.LENGTH])
+        if self._signature is None:
+            self._signature = Ed25519Signature.from_bytes(
+                self.value[1 : 1 + Ed25519Signature.LENGTH]
+            )
+        return self._signature
 
     @property
     def public_key(self) -> Ed25519PublicKey:
-        return Ed25519PublicKey.from_bytes(self.value[1 + Ed25519Signature.LENGTH :])
+        if self._public_key is None:
+            self._public_key = Ed25519PublicKey.from_bytes(self.public_key_bytes())
+        return self._public_key
+
+    def public_key_bytes(self) -> bytes:
+        return self.value[1 + Ed25519Signature.LENGTH :]
 
     @staticmethod
     def deserialize(deserializer: Deserializer) -> Ed25519SuiSignature:
@@ -202,11 +280,18 @@ class Ed25519SuiSignature:
     def serialize(self, serializer: Serializer):
         serializer.fixed_bytes(self.value)
 
+    def serialized_size(self) -> int:
+        return Ed25519SuiSignature.LENGTH
+
     def bytes(self) -> bytes:
         return self.value
 
 
 class Secp256k1SuiSignature:
+    """Scheme flag, signature and public key; the parts are parsed once, on use."""
+
+    __slots__ = ("value", "_signature", "_public_key")
+
     value: bytes
     LENGTH: int = Secp256k1PublicKey.LENGTH + Secp256k1Signature.LENGTH + 1
     SCHEME: int = Secp256k1PublicKey.SCHEME
@@ -217,18 +302,25 @@ class Secp256k1SuiSignature:
                 f"Expected signature of length {Secp256k1SuiSignature.LENGTH}"
             )
         self.value = signature
+        self._signature = None
+        self._public_key = None
 
     @property
     def signature(self) -> Secp256k1Signature:
-        return Secp256k1Signature.from_bytes(
-            self.value[1 : 1 + Secp256k1Signature.LENGTH]
-        )
+        if self._signature is None:
+            self._signature = Secp256k1Signature.from_bytes(
+                self.value[1 : 1 + Secp256k1Signature.LENGTH]
+            )
+        return self._signature
 
     @property
     def public_key(self) -> Secp256k1PublicKey:
-        return Secp256k1PublicKey.from_bytes(
-            self.value[1 + Secp256k1Signature.LENGTH :]
-        )
+        if self._public_key is None:
+            self._public_key = Secp256k1PublicKey.from_bytes(self.public_key_bytes())
+        return self._public_key
+
+    def public_key_bytes(self) -> bytes:
+        return self.value[1 + Secp256k1Signature.LENGTH :]
 
     @staticmethod
     def deserialize(deserializer: Deserializer) -> Secp256k1SuiSignature:
@@ -242,5 +334,8 @@ class Secp256k1SuiSignature:
     def serialize(self, serializer: Serializer):
         serializer.fixed_bytes(self.value)
 
+    def serialized_size(self) -> int:
+        return Secp256k1SuiSignature.LENGTH
+
     def bytes(self) -> bytes:
         return self.value
@@ -3,38 +3,51 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from __future__ import annotations
-from nacl.signing import SigningKey, VerifyKey
 import typing
 
+from . import backends
+from .cache import LRUCache
+
 
 class Ed25519KeyPair:
-    sk: SigningKey
+    """A private key of `backend`, by default the one `sk` belongs to."""
+
+    sk: typing.Any
+    backend: typing.Any
 
-    def __init__(self, sk: SigningKey) -> None:
+    def __init__(self, sk: typing.Any, backend: typing.Any = None) -> None:
         self.sk = sk
+        self.backend = backend or backends.owner(backends.ED25519, sk)
 
     @staticmethod
-    def from_private_key(sk: bytes) -> Ed25519KeyPair:
-        return Ed25519KeyPair(SigningKey(sk))
+    def from_private_key(
+        sk: bytes, backend: typing.Optional[str] = None
+    ) -> Ed25519KeyPair:
+        backend = backends.get(backends.ED25519, backend)
+        return Ed25519KeyPair(backend.signing_key(sk), backend)
 
     def public_key(self) -> Ed25519PublicKey:
-        return Ed25519PublicKey(self.sk.verify_key)
+        return Ed25519PublicKey(self.backend.public_key(self.sk), self.backend)
 
     def private_key_bytes(self):
-        return self.sk.encode()
+        return self.backend.private_bytes(self.sk)
 
     def sign(self, msg: bytes) -> Ed25519Signature:
-        sig = self.sk.sign(msg).signature
+        sig = self.backend.sign(self.sk, msg)
         return Ed25519Signature(sig)
 
 
 class Ed25519PublicKey:
     LENGTH: int = 32
     SCHEME: int = 0
-    pk: VerifyKey
+    pk: typing.Any
+    backend: typing.Any
+    # raw key bytes -> parsed Ed25519PublicKey, shared by every `from_bytes`
+    _parse_cache: typing.ClassVar[typing.Optional[LRUCache]] = LRUCache(4096)
 
-    def __init__(self, pk: VerifyKey) -> None:
+    def __init__(self, pk: typing.Any, backend: typing.Any = None) -> None:
         self.pk = pk
+        self.backend = backend or backends.owner(backends.ED25519, pk)
 
     @staticmethod
     def scheme() -> int:
@@ -42,17 +55,67 @@ class Ed25519PublicKey:
 
     @staticmethod
     def from_bytes(data: bytes) -> Ed25519PublicKey:
-        return Ed25519PublicKey(VerifyKey(data))
+        backend = backends.get(backends.ED25519)
+        cache = Ed25519PublicKey._parse_cache
+        if cache is None:
+            return Ed25519PublicKey(backend.verifying_key(data), backend)
+        data = bytes(data)
+        pk = cache.get(data)
+        # Keys parsed before a backend switch are parsed again.
+        if pk is None or pk.backend is not backend:
+            pk = Ed25519PublicKey(backend.verifying_key(data), backend)
+            cache.put(data, pk)
+        return pk
+
+    @classmethod
+    def parse_cache(cls) -> typing.Optional[LRUCache]:
+        return cls._parse_cache
+
+    @classmethod
+    def set_parse_cache(cls, cache: typing.Optional[LRUCache]):
+        """Cache for `from_bytes`; `None` parses every key afresh."""
+        cls._parse_cache = cache
 
     def bytes(self) -> bytes:
-        return self.pk.encode()
+        return self.backend.public_bytes(self.pk)
 
     def verify(self, msg: bytes, signature: Ed25519Signature) -> bool:
-        try:
-            self.pk.verify(msg, signature.bytes())
-        except Exception:
-            return False
-        return True
+        return self.backend.verify(self.pk, msg, signature.bytes())
+
+    @staticmethod
+    def verify_batch(
+        msgs: typing.Sequence[bytes],
+        pks: typing.Sequence[Ed25519PublicKey],
+        sigs: typing.Sequence[Ed25519Signature],
+    ) -> typing.List[int]:
+        """Verify every signature and return the indices of those that fail.
+
+        None of the backends exposes multi-scalar multiplication, and a
+        randomized linear combination assembled from single-point operations
+        costs about twice as much as verifying each signature. The batch is
+        therefore checked item by item, without stopping at the first failure.
+        Keys are grouped by backend so each backend checks its own keys.
+        """
+        if not len(msgs) == len(pks) == len(sigs):
+            raise Exception(
+                "Mismatch between number of messages signatures and public keys provided"
+            )
+
+        groups = {}
+        for (i, pk) in enumerate(pks):
+            groups.setdefault(pk.backend, []).append(i)
+        failed = []
+        for (backend, indices) in groups.items():
+            failed.extend(
+                indices[j]
+                for j in backend.verify_batch(
+                    [msgs[i] for i in indices],
+                    [pks[i].pk for i in indices],
+                    [sigs[i].bytes() for i in indices],
+                )
+            )
+        failed.sort()
+        return failed
 
     @staticmethod
     def verify_batch_emtpy_fail(
@@ -67,6 +130,7 @@ class Ed25519PublicKey:
                 "Mismatch between number of signatures and public keys provided"
             )
 
+        # Stops at the first failure; `verify_batch` is for finding them all.
         return all(pk.verify(msg, sig) for (pk, sig) in zip(pks, sigs))
 
     @staticmethod
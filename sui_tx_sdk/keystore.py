@@ -0,0 +1,147 @@
+# Copyright (c) JubiterWallet
+# Author: Ruquan
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Key pairs from a `sui.keystore` file, indexed by address.
+
+A keystore is a JSON array of base64 keys, each `flag || public key || private
+key`. Addresses come from the embedded public keys, so loading never builds a
+private key object; `signer_for` builds each `SuiKeyPair` on first use.
+
+Deriving 100k addresses still means 100k sha3 hashes, so `load` keeps them in
+a sidecar index file next to the keystore: the sha256 of the keystore bytes
+followed by the 20-byte addresses in key order. The index is rebuilt whenever
+it does not match the keystore.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import typing
+
+from .crypto import SuiKeyPair
+from .ed25519 import Ed25519PublicKey
+from .secp256k1 import Secp256k1PublicKey
+from .sui_address import SuiAddress
+
+_PUBLIC_KEY_LENGTHS = {
+    Ed25519PublicKey.SCHEME: Ed25519PublicKey.LENGTH,
+    Secp256k1PublicKey.SCHEME: Secp256k1PublicKey.LENGTH,
+}
+
+INDEX_SUFFIX = ".index"
+
+
+class Keystore:
+    _keys: typing.Dict[SuiAddress, str]
+    _signers: typing.Dict[SuiAddress, SuiKeyPair]
+
+    def __init__(
+        self,
+        keys: typing.Iterable[str],
+        addresses: typing.Optional[typing.Iterable[SuiAddress]] = None,
+    ):
+        """Index base64 `keys`; `addresses`, if given, must match them in order."""
+        keys = list(keys)
+        if addresses is None:
+            addresses = [address_of(key) for key in keys]
+        else:
+            addresses = list(addresses)
+            if len(addresses) != len(keys):
+                raise Exception(f"Expected {len(keys)} addresses, get {len(addresses)}")
+        self._keys = dict(zip(addresses, keys))
+        self._signers = {}
+
+    @staticmethod
+    def load(path: str, index: bool = True) -> Keystore:
+        """Load a keystore file, reading or refreshing its sidecar index."""
+        with open(path, "rb") as f:
+            data = f.read()
+        keys = json.loads(data)
+        if not index:
+            return Keystore(keys)
+
+        checksum = hashlib.sha256(data).digest()
+        addresses = _read_index(path + INDEX_SUFFIX, checksum, len(keys))
+        if addresses is None:
+            keystore = Keystore(keys)
+            _write_index(path + INDEX_SUFFIX, checksum, keystore._index(keys))
+            return keystore
+        return Keystore(keys, addresses)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, address: SuiAddress) -> bool:
+        return address in self._keys
+
+    def addresses(self) -> typing.List[SuiAddress]:
+        return list(self._keys)
+
+    def signer_for(self, address: SuiAddress) -> SuiKeyPair:
+        """The key pair for `address`, built on first use. KeyError if unknown.
+
+        The entry is indexed by its embedded public key but the key pair is
+        built from its private key, so an entry where the two disagree raises
+        rather than signing for another address.
+        """
+        signer = self._signers.get(address)
+        if signer is None:
+            signer = SuiKeyPair.from_base64(self._keys[address])
+            if signer.address() != address:
+                raise Exception(
+                    f"Keystore entry for {address} holds the private key of"
+                    f" {signer.address()}"
+                )
+            self._signers[address] = signer
+        return signer
+
+    def _index(self, keys: typing.List[str]) -> typing.List[SuiAddress]:
+        by_key = {key: address for (address, key) in self._keys.items()}
+        return [by_key[key] for key in keys]
+
+
+def address_of(key: str) -> SuiAddress:
+    """Address of a base64 keystore entry, from its embedded public key."""
+    data = base64.b64decode(key)
+    length = _PUBLIC_KEY_LENGTHS.get(data[0]) if data else None
+    if length is None:
+        raise TypeError
+    if len(data) <= 1 + length:
+        raise Exception(f"Keystore entry of {len(data)} bytes holds no private key")
+    return SuiAddress.from_public_key_bytes(data[0], data[1 : 1 + length], False)
+
+
+def _read_index(
+    path: str, checksum: bytes, count: int
+) -> typing.Optional[typing.List[SuiAddress]]:
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    size = SuiAddress.LENGTH
+    if data[: len(checksum)] != checksum or len(data) != len(checksum) + count * size:
+        return None
+    return [
+        SuiAddress(data[i : i + size]) for i in range(len(checksum), len(data), size)
+    ]
+
+
+def _write_index(path: str, checksum: bytes, addresses: typing.List[SuiAddress]):
+    # The index is only a cache: a read-only directory just means no index.
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(checksum)
+            f.write(b"".join(x.address for x in addresses))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
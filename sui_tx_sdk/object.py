@@ -4,23 +4,71 @@
 
 from __future__ import annotations
 import base64
-from .bcs import Deserializer, Serializer
+import functools
+import struct
+import typing
+from . import schema
+from .bcs import Deserializer, Serializer, bytes_size
+from .cache import LRUCache
 from .account_address import AccountAddress
 from .sui_address import SuiAddress
 
 
+@functools.total_ordering
 class ObjectID:
+    """Immutable and hashable; see `AccountAddress` for the intern pool."""
+
+    __slots__ = ("value",)
+
     value: AccountAddress
+    _intern_pool: typing.ClassVar[typing.Optional[LRUCache]] = None
+
+    def __new__(cls, address: AccountAddress) -> ObjectID:
+        pool = cls._intern_pool
+        if pool is not None:
+            interned = pool.get(address)
+            if interned is not None:
+                return interned
+
+        self = object.__new__(cls)
+        object.__setattr__(self, "value", address)
+        if pool is not None:
+            pool.put(address, self)
+        return self
+
+    @classmethod
+    def set_intern_pool(cls, pool: typing.Optional[LRUCache]):
+        cls._intern_pool = pool
 
-    def __init__(self, address: AccountAddress):
-        self.value = address
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), (self.value,))
 
     def __eq__(self, o: ObjectID) -> bool:
-        return self.value == o.value
+        try:
+            return self.value == o.value
+        except AttributeError:
+            return NotImplemented
+
+    def __lt__(self, o: ObjectID) -> bool:
+        if not isinstance(o, ObjectID):
+            return NotImplemented
+        return self.value < o.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
 
     def __str__(self) -> str:
         return self.value.__str__()
 
+    def __repr__(self) -> str:
+        return f"ObjectID({self})"
+
     @staticmethod
     def from_hex(address: str) -> ObjectID:
         return ObjectID(AccountAddress.from_hex(address))
@@ -32,23 +80,69 @@ class ObjectID:
     def serialize(self, serializer: Serializer):
         serializer.struct(self.value)
 
+    def serialized_size(self) -> int:
+        return self.value.serialized_size()
+
 
+@functools.total_ordering
 class ObjectDigest:
+    """Immutable and hashable; see `AccountAddress` for the intern pool."""
+
+    __slots__ = ("value",)
+
     LENGTH: int = 32
     value: bytes
+    _intern_pool: typing.ClassVar[typing.Optional[LRUCache]] = None
+
+    def __new__(cls, digest: bytes) -> ObjectDigest:
+        pool = cls._intern_pool
+        if pool is not None:
+            interned = pool.get(digest)
+            if interned is not None:
+                return interned
 
-    def __init__(self, digest: bytes):
         if not len(digest) == ObjectDigest.LENGTH:
             raise Exception(f"Expected digest of length 32, get {len(digest)}")
 
-        self.value = digest
+        self = object.__new__(cls)
+        object.__setattr__(self, "value", digest)
+        if pool is not None:
+            pool.put(digest, self)
+        return self
+
+    @classmethod
+    def set_intern_pool(cls, pool: typing.Optional[LRUCache]):
+        cls._intern_pool = pool
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), (self.value,))
 
     def __eq__(self, o: ObjectDigest) -> bool:
-        return self.value == o.value
+        try:
+            return self.value == o.value
+        except AttributeError:
+            return NotImplemented
+
+    def __lt__(self, o: ObjectDigest) -> bool:
+        if not isinstance(o, ObjectDigest):
+            return NotImplemented
+        return bytes(self.value) < bytes(o.value)
+
+    def __hash__(self) -> int:
+        return hash(self.value)
 
     def __str__(self) -> str:
         return f"0x{self.value.hex()}"
 
+    def __repr__(self) -> str:
+        return f"ObjectDigest({self})"
+
     @staticmethod
     def from_base64(b64: str) -> ObjectDigest:
         digest = base64.b64decode(b64)
@@ -61,8 +155,17 @@ class ObjectDigest:
     def serialize(self, serializer: Serializer):
         serializer.bytes(self.value)
 
+    def serialized_size(self) -> int:
+        return bytes_size(self.value)
+
+
+# ObjectID, sequence number, digest length prefix and digest.
+_OBJECT_REF = struct.Struct(f"<{AccountAddress.LENGTH}sQB{ObjectDigest.LENGTH}s")
+
 
 class ObjectRef:
+    __slots__ = ("object_id", "sequence_number", "object_digest")
+
     object_id: ObjectID
     sequence_number: int
     object_digest: ObjectDigest
@@ -99,3 +202,56 @@ class ObjectRef:
         serializer.struct(self.object_id)
         serializer.u64(self.sequence_number)
         serializer.struct(self.object_digest)
+
+    def serialized_size(self) -> int:
+        return (
+            self.object_id.serialized_size() + 8 + self.object_digest.serialized_size()
+        )
+
+    @staticmethod
+    def deserialize_sequence(deserializer: Deserializer) -> typing.List[ObjectRef]:
+        values = []
+        for (address, sequence_number, length, digest) in deserializer.packed_sequence(
+            _OBJECT_REF
+        ):
+            if length != ObjectDigest.LENGTH:
+                raise Exception(
+                    f"Expected digest of length {ObjectDigest.LENGTH}, get {length}"
+                )
+            values.append(
+                ObjectRef(
+                    ObjectID(AccountAddress(address)),
+                    sequence_number,
+                    ObjectDigest(digest),
+                )
+            )
+        return values
+
+    @staticmethod
+    def serialize_sequence(serializer: Serializer, values: typing.List[ObjectRef]):
+        pack = _OBJECT_REF.pack
+        data = b"".join(
+            [
+                pack(
+                    x.object_id.value.address,
+                    x.sequence_number,
+                    ObjectDigest.LENGTH,
+                    x.object_digest.value,
+                )
+                for x in values
+            ]
+        )
+        serializer.uleb128(len(values))
+        serializer.fixed_bytes(data)
+
+
+schema.define(ObjectID, schema.Struct(value=AccountAddress))
+schema.define(ObjectDigest, schema.Struct(value=schema.SizedBytes(ObjectDigest.LENGTH)))
+schema.define(
+    ObjectRef,
+    schema.Struct(
+        object_id=ObjectID,
+        sequence_number=schema.U64,
+        object_digest=ObjectDigest,
+    ),
+)
@@ -0,0 +1,709 @@
+# Copyright (c) JubiterWallet
+# Author: Ruquan
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Declarative BCS layouts compiled into specialised codecs.
+
+Each model class describes its wire format once, next to its definition:
+
+    schema.define(
+        ObjectRef,
+        schema.Struct(
+            object_id=ObjectID,
+            sequence_number=schema.U64,
+            object_digest=ObjectDigest,
+        ),
+    )
+
+`encoder(cls)` and `decoder(cls)` generate Python source for that layout the
+first time they are asked for it and cache the compiled functions, under a
+lock so threads compiling at once do not clobber each other's names;
+`skipper(cls)` steps over an encoded value without building any objects. Runs of
+fixed-width fields, including nested fixed-width structs, are packed and
+unpacked with one precomputed `struct.Struct`; enum variants are dispatched
+inline. Classes without a layout fall back to their own hand-written
+`serialize`/`deserialize`, which remain the reference implementation.
+
+A value whose class is a subclass of the one a codec was compiled for is
+handed to the encoder of its own class, so subclasses that keep their
+encoded bytes, like `LazyTransactionData`, write them back as they are.
+
+Classes defined with `memoize=True` keep their encoding the first time they
+are encoded and splice it in afterwards; see `define`.
+
+Fixed-width byte fields are packed with `struct`, so the generated encoders
+pass them through `bytes()` first; objects decoded with
+`Deserializer(zero_copy=True)`, whose fields are `memoryview`s, encode the
+same as copied ones.
+"""
+
+from __future__ import annotations
+
+import itertools
+import struct
+import threading
+import typing
+
+from .bcs import Deserializer, Serializer, uleb128_encode
+
+T = typing.TypeVar("T")
+
+
+class Layout:
+    """Wire layout of a BCS value."""
+
+
+class Primitive(Layout):
+    name: str
+    fmt: str
+
+    def __init__(self, name: str, fmt: str):
+        self.name = name
+        self.fmt = fmt
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+BOOL = Primitive("bool", "B")
+U8 = Primitive("u8", "B")
+U16 = Primitive("u16", "H")
+U32 = Primitive("u32", "I")
+U64 = Primitive("u64", "Q")
+U128 = Primitive("u128", "QQ")
+
+
+class Fixed(Layout):
+    """Raw bytes of a known length, without a length prefix."""
+
+    length: int
+
+    def __init__(self, length: int):
+        self.length = length
+
+
+class SizedBytes(Layout):
+    """Length-prefixed bytes whose length is always `length`."""
+
+    length: int
+
+    def __init__(self, length: int):
+        if length >= 0x80:
+            raise Exception("SizedBytes expects a single byte length prefix")
+        self.length = length
+
+
+class _Variable(Layout):
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+BYTES = _Variable("bytes")
+STR = _Variable("str")
+
+
+class Vector(Layout):
+    element: typing.Any
+
+    def __init__(self, element: typing.Any):
+        self.element = element
+
+
+class Option(Layout):
+    element: typing.Any
+
+    def __init__(self, element: typing.Any):
+        self.element = element
+
+
+class Struct(Layout):
+    """Fields in wire order; the class is constructed positionally from them."""
+
+    fields: typing.List[typing.Tuple[str, typing.Any]]
+
+    def __init__(self, **fields: typing.Any):
+        self.fields = list(fields.items())
+
+
+class Enum(Layout):
+    """Variants in tag order, wrapping the payload as `cls(payload)`.
+
+    The tag is read from `value.variant` unless `variant_of` is given. `None`
+    marks a variant the SDK does not decode; unknown tags raise `error`.
+    """
+
+    variants: typing.List[typing.Any]
+    variant_of: typing.Optional[typing.Callable[[typing.Any], int]]
+    error: typing.Type[Exception]
+
+    def __init__(
+        self,
+        *variants: typing.Any,
+        variant_of: typing.Optional[typing.Callable[[typing.Any], int]] = None,
+        error: typing.Type[Exception] = TypeError,
+    ):
+        self.variants = list(variants)
+        self.variant_of = variant_of
+        self.error = error
+
+
+_LAYOUTS: typing.Dict[type, Layout] = {}
+_ENCODERS: typing.Dict[type, typing.Callable[[Serializer, typing.Any], None]] = {}
+_DECODERS: typing.Dict[type, typing.Callable[[Deserializer], typing.Any]] = {}
+_SKIPPERS: typing.Dict[type, typing.Callable[[Deserializer], None]] = {}
+_MEMOIZED: typing.Set[type] = set()
+# Guards compilation and `define`; the tables above are read without it.
+_LOCK = threading.Lock()
+
+
+def define(cls: type, layout: Layout, memoize: bool = False):
+    """Bind `layout` to `cls`.
+
+    With `memoize`, each value keeps its encoding in its `_bcs` attribute the
+    first time it is encoded, and later encodings write those bytes as they
+    are. The class must be immutable and start `_bcs` as `None`. Memoizing
+    pays off for values with strings or nested sequences that are encoded
+    again and again; fixed-width values are already packed with one call.
+    """
+    if not isinstance(layout, (Struct, Enum)):
+        raise TypeError("Only Struct and Enum layouts can be bound to a class")
+    with _LOCK:
+        _LAYOUTS[cls] = layout
+        if memoize:
+            _MEMOIZED.add(cls)
+        else:
+            _MEMOIZED.discard(cls)
+        _ENCODERS.pop(cls, None)
+        _DECODERS.pop(cls, None)
+        _SKIPPERS.pop(cls, None)
+
+
+def layout_of(cls: type) -> typing.Optional[Layout]:
+    return _LAYOUTS.get(cls)
+
+
+def encoder(cls: typing.Type[T]) -> typing.Callable[[Serializer, T], None]:
+    if cls not in _ENCODERS:
+        _compile(cls, _ENCODERS)
+    return _ENCODERS[cls]
+
+
+def decoder(cls: typing.Type[T]) -> typing.Callable[[Deserializer], T]:
+    if cls not in _DECODERS:
+        _compile(cls, _DECODERS)
+    return _DECODERS[cls]
+
+
+def skipper(cls: type) -> typing.Callable[[Deserializer], None]:
+    if cls not in _SKIPPERS:
+        _compile(cls, _SKIPPERS)
+    return _SKIPPERS[cls]
+
+
+def _compile(cls: type, table: typing.Dict[type, typing.Any]):
+    with _LOCK:
+        # Another thread may have compiled `cls` while this one waited.
+        if cls not in table:
+            _Compiler().compile(cls)
+
+
+def encode(value: typing.Any) -> bytes:
+    ser = Serializer()
+    encoder(type(value))(ser, value)
+    return ser.output()
+
+
+def encode_into(
+    value: typing.Any, buf: typing.Union[bytearray, memoryview], offset: int
+) -> int:
+    """Encode `value` into `buf` at `offset` and return the offset past it.
+
+    Appending to the end of a `bytearray` writes in place; anywhere else the
+    value is encoded once and copied into position.
+    """
+    if isinstance(buf, bytearray) and offset == len(buf):
+        try:
+            encoder(type(value))(Serializer(buf), value)
+        except BaseException:
+            del buf[offset:]
+            raise
+        return len(buf)
+    ser = Serializer()
+    encoder(type(value))(ser, value)
+    return ser.output_into(buf, offset)
+
+
+def decode(cls: typing.Type[T], data: bytes) -> T:
+    return decoder(cls)(Deserializer(data))
+
+
+def _unpack_sequence(deserializer: Deserializer, fmt: str, size: int) -> list:
+    length = deserializer.uleb128()
+    start = deserializer._advance(length * size)
+    return list(struct.unpack_from(f"<{length}{fmt}", deserializer._input, start))
+
+
+def _sized_bytes_error(expected: int, found: int):
+    return Exception(f"Expected bytes of length {expected}, found length {found}")
+
+
+def _memoize(encode: typing.Callable[[Serializer, typing.Any], None], value) -> bytes:
+    ser = Serializer()
+    encode(ser, value)
+    data = ser.output()
+    object.__setattr__(value, "_bcs", data)
+    return data
+
+
+# Generated functions live in one namespace so they can call each other by
+# name, which is what makes recursive layouts such as `TypeTag` work.
+_NAMESPACE: typing.Dict[str, typing.Any] = {
+    "_pack": struct.pack,
+    "_unpack_sequence": _unpack_sequence,
+    "_sized_bytes_error": _sized_bytes_error,
+    "_memoize": _memoize,
+    "_encoder": encoder,
+}
+_NAMES: typing.Dict[type, str] = {}
+# Suffixes for generated names, never reused.
+_COUNTER = itertools.count()
+
+
+class _Run:
+    """Fixed-width fields waiting to be packed or unpacked together."""
+
+    def __init__(self):
+        self.fmt: typing.List[str] = []
+        self.items: typing.List[str] = []
+        self.checks: typing.List[str] = []
+
+
+class _Compiler:
+    def __init__(self):
+        self.pending: typing.List[type] = []
+        self.scheduled: typing.Set[type] = set()
+        self.compiled: typing.List[
+            typing.Tuple[type, typing.Any, typing.Any, typing.Any]
+        ] = []
+        self.counter = 0
+
+    def compile(self, cls: type):
+        self._name(cls)
+        while self.pending:
+            self._compile_one(self.pending.pop())
+        # Published last: codecs call the ones they depend on by name, and
+        # readers of the tables do not take the lock.
+        for (cls, enc, dec, skip) in self.compiled:
+            _ENCODERS[cls] = enc
+            _DECODERS[cls] = dec
+            _SKIPPERS[cls] = skip
+
+    def _name(self, cls: type) -> str:
+        """Name used for the codec functions of `cls`, scheduling it if new."""
+        if cls not in _NAMES:
+            _NAMES[cls] = f"{cls.__name__}_{next(_COUNTER)}"
+            _NAMESPACE["cls_" + _NAMES[cls]] = cls
+        if cls not in _ENCODERS and cls not in self.scheduled:
+            self.scheduled.add(cls)
+            self.pending.append(cls)
+        return _NAMES[cls]
+
+    def _const(self, value: typing.Any) -> str:
+        name = f"_c{next(_COUNTER)}"
+        _NAMESPACE[name] = value
+        return name
+
+    def _cls(self, cls: type) -> str:
+        return "cls_" + self._name(cls)
+
+    def _tmp(self) -> str:
+        self.counter += 1
+        return f"v{self.counter}"
+
+    def _fixed(self, layout: typing.Any) -> bool:
+        if isinstance(layout, type):
+            layout = _LAYOUTS.get(layout)
+        if isinstance(layout, (Primitive, Fixed, SizedBytes)):
+            return True
+        if isinstance(layout, Struct):
+            return all(self._fixed(x) for (_, x) in layout.fields)
+        return False
+
+    def _compile_one(self, cls: type):
+        name = _NAMES[cls]
+        layout = _LAYOUTS.get(cls)
+        self.counter = 0
+
+        if layout is None:
+            _NAMESPACE["enc_" + name] = lambda s, v: v.serialize(s)
+            _NAMESPACE["dec_" + name] = cls.deserialize
+            _NAMESPACE["skip_" + name] = cls.deserialize
+        else:
+            self._generate(cls, name, layout)
+        self.compiled.append(
+            (
+                cls,
+                _NAMESPACE["enc_" + name],
+                _NAMESPACE["dec_" + name],
+                _NAMESPACE["skip_" + name],
+            )
+        )
+
+    def _generate(self, cls: type, name: str, layout: Layout):
+
+        if isinstance(layout, Struct):
+            enc = self._struct_encoder(cls, layout)
+            dec = self._struct_decoder(cls, layout)
+            skip = self._struct_skipper(cls, layout)
+        else:
+            enc = self._enum_encoder(cls, layout)
+            dec = self._enum_decoder(cls, layout)
+            skip = self._enum_skipper(cls, layout)
+
+        # Subclasses without a layout of their own, such as the lazy and
+        # frozen variants, may already hold their bytes; let them write those.
+        dispatch = [
+            f"    if type(v) is not cls_{name}:",
+            "        return _encoder(type(v))(s, v)",
+        ]
+        if cls in _MEMOIZED:
+            enc = (
+                dispatch
+                + [
+                    "    b = v._bcs",
+                    "    if b is None:",
+                    f"        b = _memoize(fill_{name}, v)",
+                    "    s._write(b)",
+                    f"def fill_{name}(s, v):",
+                    "    w = s._write",
+                ]
+                + enc
+            )
+        else:
+            enc = dispatch + ["    w = s._write"] + enc
+        source = "\n".join(
+            [f"def enc_{name}(s, v):"]
+            + enc
+            + [f"def dec_{name}(d):"]
+            + dec
+            + [f"def skip_{name}(d):"]
+            + skip
+        )
+        exec(compile(source, f"<schema {cls.__qualname__}>", "exec"), _NAMESPACE)
+
+    # Encoding
+
+    def _struct_encoder(self, cls: type, layout: Struct) -> typing.List[str]:
+        out: typing.List[str] = []
+        self._encode_values(
+            [(x, f"v.{field}") for (field, x) in layout.fields], out, "    "
+        )
+        return out or ["    pass"]
+
+    def _enum_encoder(self, cls: type, layout: Enum) -> typing.List[str]:
+        if layout.variant_of is None:
+            out = ["    t = v.variant"]
+        else:
+            out = [f"    t = {self._const(layout.variant_of)}(v)"]
+
+        keyword = "if"
+        for (tag, variant) in enumerate(layout.variants):
+            if variant is None:
+                continue
+            body = [f"        w({uleb128_encode(tag)!r})"]
+            self._encode_values([(variant, "v.value")], body, "        ")
+            out.append(f"    {keyword} t == {tag}:")
+            out.extend(body)
+            keyword = "elif"
+        out.append("    else:")
+        out.append(f"        raise {self._const(layout.error)}")
+        return out
+
+    def _encode_values(self, values, out: typing.List[str], indent: str):
+        run = _Run()
+        for (layout, expr) in values:
+            if self._fixed(layout) and layout not in _MEMOIZED:
+                self._encode_fixed(layout, expr, run)
+            else:
+                self._flush_encode(run, out, indent)
+                run = _Run()
+                self._encode_dynamic(layout, expr, out, indent)
+        self._flush_encode(run, out, indent)
+
+    def _flush_encode(self, run: _Run, out: typing.List[str], indent: str):
+        if not run.items:
+            return
+        packer = self._const(struct.Struct("<" + "".join(run.fmt)))
+        out.append(f"{indent}w({packer}.pack({', '.join(run.items)}))")
+
+    def _encode_fixed(self, layout: typing.Any, expr: str, run: _Run):
+        if isinstance(layout, type):
+            layout = _LAYOUTS[layout]
+
+        if layout is BOOL:
+            run.fmt.append("?")
+            run.items.append(expr)
+        elif layout is U128:
+            run.fmt.append("QQ")
+            run.items.append(f"{expr} & 0xFFFFFFFFFFFFFFFF")
+            run.items.append(f"{expr} >> 64")
+        elif isinstance(layout, Primitive):
+            run.fmt.append(layout.fmt)
+            run.items.append(expr)
+        elif isinstance(layout, Fixed):
+            # `struct` only packs `bytes`; `bytes()` returns `bytes` as is and
+            # copies the `memoryview`s of zero-copy decoding.
+            run.fmt.append(f"{layout.length}s")
+            run.items.append(f"bytes({expr})")
+        elif isinstance(layout, SizedBytes):
+            run.fmt.append(f"B{layout.length}s")
+            run.items.append(str(layout.length))
+            run.items.append(f"bytes({expr})")
+        else:
+            for (field, x) in layout.fields:
+                self._encode_fixed(x, f"{expr}.{field}", run)
+
+    def _encode_dynamic(
+        self, layout: typing.Any, expr: str, out: typing.List[str], indent: str
+    ):
+        if isinstance(layout, type):
+            out.append(f"{indent}enc_{self._name(layout)}(s, {expr})")
+        elif layout is BYTES:
+            out.append(f"{indent}s.bytes({expr})")
+        elif layout is STR:
+            out.append(f"{indent}s.str({expr})")
+        elif isinstance(layout, Option):
+            value = self._tmp()
+            out.append(f"{indent}{value} = {expr}")
+            out.append(f"{indent}if {value} is None:")
+            out.append(f"{indent}    w(b'\\x00')")
+            out.append(f"{indent}else:")
+            out.append(f"{indent}    w(b'\\x01')")
+            self._encode_values([(layout.element, value)], out, indent + "    ")
+        elif isinstance(layout, Vector):
+            values = self._tmp()
+            item = self._tmp()
+            out.append(f"{indent}{values} = {expr}")
+            element = layout.element
+            if element is U64:
+                out.append(f"{indent}s.u64_sequence({values})")
+                return
+            out.append(f"{indent}s.uleb128(len({values}))")
+            if isinstance(element, Primitive) and element is not U128:
+                fmt = "?" if element is BOOL else element.fmt
+                out.append(f"{indent}w(_pack(f'<{{len({values})}}{fmt}', *{values}))")
+            elif self._fixed(element):
+                run = _Run()
+                self._encode_fixed(element, item, run)
+                packer = self._const(struct.Struct("<" + "".join(run.fmt)))
+                out.append(
+                    f"{indent}w(b''.join([{packer}.pack({', '.join(run.items)})"
+                    f" for {item} in {values}]))"
+                )
+            else:
+                out.append(f"{indent}for {item} in {values}:")
+                self._encode_dynamic(element, item, out, indent + "    ")
+        else:
+            raise TypeError(f"Unsupported layout {layout!r}")
+
+    # Decoding
+
+    def _struct_decoder(self, cls: type, layout: Struct) -> typing.List[str]:
+        out: typing.List[str] = []
+        exprs = self._decode_values([x for (_, x) in layout.fields], out, "    ")
+        out.append(f"    return {self._cls(cls)}({', '.join(exprs)})")
+        return out
+
+    def _enum_decoder(self, cls: type, layout: Enum) -> typing.List[str]:
+        out = ["    t = d.uleb128()"]
+        keyword = "if"
+        for (tag, variant) in enumerate(layout.variants):
+            out.append(f"    {keyword} t == {tag}:")
+            keyword = "elif"
+            if variant is None:
+                out.append("        raise NotImplementedError")
+                continue
+            (expr,) = self._decode_values([variant], out, "        ")
+            out.append(f"        return {self._cls(cls)}({expr})")
+        out.append(f"    raise {self._const(layout.error)}")
+        return out
+
+    def _decode_values(self, layouts, out: typing.List[str], indent: str):
+        exprs = []
+        run = _Run()
+        for layout in layouts:
+            if self._fixed(layout):
+                exprs.append(self._decode_fixed(layout, run))
+            else:
+                self._flush_decode(run, out, indent)
+                run = _Run()
+                value = self._tmp()
+                out.append(f"{indent}{value} = {self._decode_dynamic(layout)}")
+                exprs.append(value)
+        self._flush_decode(run, out, indent)
+        return exprs
+
+    def _flush_decode(self, run: _Run, out: typing.List[str], indent: str):
+        if not run.items:
+            return
+        unpacker = struct.Struct("<" + "".join(run.fmt))
+        name = self._const(unpacker)
+        out.append(
+            f"{indent}{', '.join(run.items)}, = "
+            f"{name}.unpack_from(d._input, d._advance({unpacker.size}))"
+        )
+        out.extend(indent + check for check in run.checks)
+
+    def _decode_fixed(self, layout: typing.Any, run: _Run) -> str:
+        """Queue the fields of `layout` on `run`, returning the value expression."""
+        cls = None
+        if isinstance(layout, type):
+            (cls, layout) = (layout, _LAYOUTS[layout])
+
+        if layout is BOOL:
+            value = self._tmp()
+            run.fmt.append("B")
+            run.items.append(value)
+            run.checks.append(
+                f"if {value} > 1: raise Exception('Unexpected boolean value: ', {value})"
+            )
+            return f"({value} == 1)"
+        elif layout is U128:
+            (low, high) = (self._tmp(), self._tmp())
+            run.fmt.append("QQ")
+            run.items.extend([low, high])
+            return f"({high} << 64 | {low})"
+        elif isinstance(layout, Primitive):
+            value = self._tmp()
+            run.fmt.append(layout.fmt)
+            run.items.append(value)
+            return value
+        elif isinstance(layout, Fixed):
+            value = self._tmp()
+            run.fmt.append(f"{layout.length}s")
+            run.items.append(value)
+            return value
+        elif isinstance(layout, SizedBytes):
+            (prefix, value) = (self._tmp(), self._tmp())
+            run.fmt.append(f"B{layout.length}s")
+            run.items.extend([prefix, value])
+            run.checks.append(
+                f"if {prefix} != {layout.length}: "
+                f"raise _sized_bytes_error({layout.length}, {prefix})"
+            )
+            return value
+        else:
+            args = [self._decode_fixed(x, run) for (_, x) in layout.fields]
+            return f"{self._cls(cls)}({', '.join(args)})"
+
+    def _decode_dynamic(self, layout: typing.Any) -> str:
+        if isinstance(layout, type):
+            return f"dec_{self._name(layout)}(d)"
+        elif layout is BYTES:
+            return "d.bytes()"
+        elif layout is STR:
+            return "d.str()"
+        elif isinstance(layout, Option):
+            return f"({self._decode_element(layout.element)} if d.bool() else None)"
+        elif isinstance(layout, Vector):
+            element = layout.element
+            if element is U64:
+                return "d.u64_sequence()"
+            elif isinstance(element, Primitive) and element not in (BOOL, U128):
+                size = struct.calcsize(element.fmt)
+                return f"_unpack_sequence(d, {element.fmt!r}, {size})"
+            elif self._fixed(element):
+                return f"{self._fixed_sequence_decoder(element)}(d)"
+            return f"[{self._decode_dynamic(element)} for _ in range(d.uleb128())]"
+        raise TypeError(f"Unsupported layout {layout!r}")
+
+    def _decode_element(self, layout: typing.Any) -> str:
+        if not self._fixed(layout):
+            return self._decode_dynamic(layout)
+        out: typing.List[str] = []
+        (expr,) = self._decode_values([layout], out, "    ")
+        return f"{self._function(out + [f'    return {expr}'])}(d)"
+
+    def _fixed_sequence_decoder(self, layout: typing.Any) -> str:
+        run = _Run()
+        expr = self._decode_fixed(layout, run)
+        unpacker = self._const(struct.Struct("<" + "".join(run.fmt)))
+        body = [
+            "    values = []",
+            "    append = values.append",
+            f"    for {', '.join(run.items)}, in d.packed_sequence({unpacker}):",
+        ]
+        body.extend("        " + check for check in run.checks)
+        body.append(f"        append({expr})")
+        body.append("    return values")
+        return self._function(body)
+
+    def _function(self, body: typing.List[str]) -> str:
+        name = f"_f{next(_COUNTER)}"
+        source = "\n".join([f"def {name}(d):"] + body)
+        exec(compile(source, f"<schema {name}>", "exec"), _NAMESPACE)
+        return name
+
+    # Skipping
+
+    def _struct_skipper(self, cls: type, layout: Struct) -> typing.List[str]:
+        out: typing.List[str] = []
+        self._skip_values([x for (_, x) in layout.fields], out, "    ")
+        return out or ["    pass"]
+
+    def _enum_skipper(self, cls: type, layout: Enum) -> typing.List[str]:
+        out = ["    t = d.uleb128()"]
+        keyword = "if"
+        for (tag, variant) in enumerate(layout.variants):
+            out.append(f"    {keyword} t == {tag}:")
+            keyword = "elif"
+            if variant is None:
+                out.append("        raise NotImplementedError")
+                continue
+            body: typing.List[str] = []
+            self._skip_values([variant], body, "        ")
+            out.extend(body or ["        pass"])
+        out.append("    else:")
+        out.append(f"        raise {self._const(layout.error)}")
+        return out
+
+    def _skip_values(self, layouts, out: typing.List[str], indent: str):
+        size = 0
+        for layout in layouts:
+            if self._fixed(layout):
+                size += self._fixed_size(layout)
+                continue
+            if size:
+                out.append(f"{indent}d._advance({size})")
+                size = 0
+            self._skip_dynamic(layout, out, indent)
+        if size:
+            out.append(f"{indent}d._advance({size})")
+
+    def _skip_dynamic(self, layout: typing.Any, out: typing.List[str], indent: str):
+        if isinstance(layout, type):
+            out.append(f"{indent}skip_{self._name(layout)}(d)")
+        elif layout is BYTES or layout is STR:
+            out.append(f"{indent}d._advance(d.uleb128())")
+        elif isinstance(layout, Option):
+            out.append(f"{indent}if d.bool():")
+            self._skip_values([layout.element], out, indent + "    ")
+        elif isinstance(layout, Vector):
+            element = layout.element
+            if self._fixed(element):
+                size = self._fixed_size(element)
+                out.append(f"{indent}d._advance(d.uleb128() * {size})")
+            else:
+                out.append(f"{indent}for _ in range(d.uleb128()):")
+                self._skip_dynamic(element, out, indent + "    ")
+        else:
+            raise TypeError(f"Unsupported layout {layout!r}")
+
+    def _fixed_size(self, layout: typing.Any) -> int:
+        run = _Run()
+        self._decode_fixed(layout, run)
+        return struct.calcsize("<" + "".join(run.fmt))
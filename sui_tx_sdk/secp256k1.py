@@ -4,44 +4,50 @@
 
 from __future__ import annotations
 
-from hashlib import sha256
-import secp256k1
 import typing
 
+from . import backends
+from .cache import LRUCache
+
 
 class Secp256k1KeyPair:
-    sk: secp256k1.PrivateKey
+    """A private key of `backend`, by default the one `sk` belongs to."""
+
+    sk: typing.Any
+    backend: typing.Any
 
-    def __init__(self, sk: secp256k1.PrivateKey) -> None:
+    def __init__(self, sk: typing.Any, backend: typing.Any = None) -> None:
         self.sk = sk
+        self.backend = backend or backends.owner(backends.SECP256K1, sk)
 
     @staticmethod
-    def from_private_key(sk: bytes) -> Secp256k1KeyPair:
-        return Secp256k1KeyPair(secp256k1.PrivateKey(sk))
+    def from_private_key(
+        sk: bytes, backend: typing.Optional[str] = None
+    ) -> Secp256k1KeyPair:
+        backend = backends.get(backends.SECP256K1, backend)
+        return Secp256k1KeyPair(backend.signing_key(sk), backend)
 
     def public_key(self) -> Secp256k1PublicKey:
-        return Secp256k1PublicKey(self.sk.pubkey)
+        return Secp256k1PublicKey(self.backend.public_key(self.sk), self.backend)
 
     def private_key_bytes(self):
-        hex = self.sk.serialize()
-        return bytes.fromhex(hex)
+        return self.backend.private_bytes(self.sk)
 
     def sign(self, msg: bytes) -> Secp256k1Signature:
-        sig = self.sk.ecdsa_sign_recoverable(msg)
-        rs, v = self.sk.ecdsa_recoverable_serialize(sig)
-        data = bytearray()
-        data.extend(rs)
-        data.append(v)
-        return Secp256k1Signature(bytes(data))
+        return Secp256k1Signature(self.backend.sign_recoverable(self.sk, msg))
 
 
 class Secp256k1PublicKey:
     LENGTH: int = 33
     SCHEME: int = 1
-    pk: secp256k1.PublicKey
+    pk: typing.Any
+    backend: typing.Any
+    # raw key bytes -> parsed Secp256k1PublicKey, shared by every `from_bytes`
+    _parse_cache: typing.ClassVar[typing.Optional[LRUCache]] = LRUCache(4096)
 
-    def __init__(self, pk: secp256k1.PublicKey) -> None:
+    def __init__(self, pk: typing.Any, backend: typing.Any = None) -> None:
         self.pk = pk
+        self.backend = backend or backends.owner(backends.SECP256K1, pk)
 
     @staticmethod
     def scheme() -> int:
@@ -51,22 +57,46 @@ class Secp256k1PublicKey:
     def from_bytes(data: bytes) -> Secp256k1PublicKey:
         if len(data) != Secp256k1PublicKey.LENGTH:
             raise Exception("Expected compressed key of length 33")
-        return Secp256k1PublicKey(secp256k1.PublicKey(data, True))
+        backend = backends.get(backends.SECP256K1)
+        cache = Secp256k1PublicKey._parse_cache
+        if cache is None:
+            return Secp256k1PublicKey(backend.verifying_key(data), backend)
+        data = bytes(data)
+        pk = cache.get(data)
+        # Keys parsed before a backend switch are parsed again.
+        if pk is None or pk.backend is not backend:
+            # Decompressing the curve point is the expensive part.
+            pk = Secp256k1PublicKey(backend.verifying_key(data), backend)
+            cache.put(data, pk)
+        return pk
+
+    @classmethod
+    def parse_cache(cls) -> typing.Optional[LRUCache]:
+        return cls._parse_cache
+
+    @classmethod
+    def set_parse_cache(cls, cache: typing.Optional[LRUCache]):
+        """Cache for `from_bytes`; `None` parses every key afresh."""
+        cls._parse_cache = cache
 
     def bytes(self) -> bytes:
-        return self.pk.serialize()
+        return self.backend.public_bytes(self.pk)
 
     def verify(self, msg: bytes, signature: Secp256k1Signature):
+        """ECDSA verification of `signature` against this key.
+
+        A high-S signature is normalized first, since recovery accepts both
+        forms. The recovery id is not used; `verify_recoverable` checks it by
+        recovering the key instead.
+        """
+        return self.backend.verify(self.pk, msg, signature.bytes()[:64])
+
+    def verify_recoverable(self, msg: bytes, signature: Secp256k1Signature):
+        """Recover the signer from `signature` and compare it with this key."""
         try:
-            ecdsa = secp256k1.ECDSA()
-            signature = signature.bytes()
-            sig = ecdsa.ecdsa_recoverable_deserialize(signature[:64], signature[64])
-            recovered = ecdsa.ecdsa_recover(msg, sig)
-            recovered = secp256k1.PublicKey(recovered)
-            return self.pk.serialize() == recovered.serialize()
+            return self.bytes() == self.backend.recover(msg, signature.bytes())
         except Exception:
             return False
-        return True
 
     @staticmethod
     def verify_batch_emtpy_fail(
@@ -0,0 +1,129 @@
+# Copyright (c) JubiterWallet
+# Author: Ruquan
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Incremental decoding of length-prefixed BCS records.
+
+A record is a ULEB128 byte length followed by that many bytes of BCS, the
+same framing BCS uses for `bytes`. Records may be split across chunks in any
+way; the decoder only keeps the bytes of the record it is still waiting for.
+"""
+
+from __future__ import annotations
+
+import typing
+
+from . import schema
+from .bcs import MAX_U32, Deserializer, Serializer
+
+T = typing.TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class StreamDecoder(typing.Generic[T]):
+    """Decode records of type `typ` from chunks passed to `feed`."""
+
+    _buffer: bytearray
+    _position: int
+    _decode: typing.Callable[[Deserializer], T]
+    _max_record_size: typing.Optional[int]
+
+    def __init__(
+        self, typ: typing.Type[T], max_record_size: typing.Optional[int] = None
+    ):
+        self._buffer = bytearray()
+        self._position = 0
+        self._decode = schema.decoder(typ)
+        self._max_record_size = max_record_size
+
+    def pending(self) -> int:
+        """Number of buffered bytes that do not form a complete record yet."""
+        return len(self._buffer) - self._position
+
+    def feed(self, chunk: bytes) -> typing.Iterator[T]:
+        """Buffer `chunk` and yield every record it completes, in order."""
+        self._buffer += chunk
+        return self._drain()
+
+    def close(self):
+        """Signal the end of the stream, failing if a record is incomplete."""
+        if self.pending():
+            raise Exception(
+                f"Unexpected end of stream. {self.pending()} bytes of an incomplete record"
+            )
+
+    def _drain(self) -> typing.Iterator[T]:
+        while True:
+            record = self._next_record()
+            if record is None:
+                # Drop consumed records once per drain rather than per record.
+                del self._buffer[: self._position]
+                self._position = 0
+                return
+            deserializer = Deserializer(record)
+            value = self._decode(deserializer)
+            if deserializer.remaining() != 0:
+                raise Exception(f"Record has {deserializer.remaining()} trailing bytes")
+            yield value
+
+    def _next_record(self) -> typing.Optional[bytes]:
+        """Return the next complete record in the buffer and step past it."""
+        buffer = self._buffer
+        length = 0
+        shift = 0
+        index = self._position
+        while True:
+            if index == len(buffer):
+                return None
+            byte = buffer[index]
+            index += 1
+            length |= (byte & 0x7F) << shift
+            if byte & 0x80 == 0:
+                break
+            shift += 7
+            if shift > 28:
+                raise Exception("Record length prefix is longer than a u32")
+
+        if length > MAX_U32:
+            raise Exception(f"Record length {length} does not fit into a u32")
+        if byte == 0 and shift:
+            raise Exception("Non-canonical record length prefix")
+        if self._max_record_size is not None and length > self._max_record_size:
+            raise Exception(
+                f"Record of {length} bytes exceeds the limit of {self._max_record_size}"
+            )
+
+        end = index + length
+        if end > len(buffer):
+            return None
+        with memoryview(buffer) as view:
+            record = view[index:end].tobytes()
+        self._position = end
+        return record
+
+
+def iter_records(
+    stream: typing.BinaryIO,
+    typ: typing.Type[T],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_record_size: typing.Optional[int] = None,
+) -> typing.Iterator[T]:
+    """Decode records of type `typ` from a file-like object until EOF."""
+    decoder = StreamDecoder(typ, max_record_size)
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        yield from decoder.feed(chunk)
+    decoder.close()
+
+
+def encode_record(value: typing.Any) -> bytes:
+    """Encode `value` as one length-prefixed record."""
+    payload = Serializer()
+    payload.struct(value)
+    ser = Serializer()
+    ser.bytes(payload.output())
+    return ser.output()
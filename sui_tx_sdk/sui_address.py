@@ -3,27 +3,86 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from __future__ import annotations
+import functools
 import hashlib
+import typing
 
+from . import schema
 from .bcs import Deserializer, Serializer
 from .account_address import AccountAddress
+from .cache import LRUCache
 
 
+@functools.total_ordering
 class SuiAddress:
+    """Immutable and hashable; see `AccountAddress` for the intern pool."""
+
+    __slots__ = ("address",)
+
     address: bytes
     LENGTH: int = 20
+    _intern_pool: typing.ClassVar[typing.Optional[LRUCache]] = None
+    # (scheme, public key bytes) -> SuiAddress
+    _derivation_cache: typing.ClassVar[typing.Optional[LRUCache]] = LRUCache(4096)
+
+    def __new__(cls, address: bytes) -> SuiAddress:
+        pool = cls._intern_pool
+        if pool is not None:
+            interned = pool.get(address)
+            if interned is not None:
+                return interned
 
-    def __init__(self, address: bytes) -> None:
         if len(address) != SuiAddress.LENGTH:
             raise Exception("Expected address of length 20")
-        self.address = address
+
+        self = object.__new__(cls)
+        object.__setattr__(self, "address", address)
+        if pool is not None:
+            pool.put(address, self)
+        return self
+
+    @classmethod
+    def set_intern_pool(cls, pool: typing.Optional[LRUCache]):
+        cls._intern_pool = pool
+
+    @classmethod
+    def derivation_cache(cls) -> typing.Optional[LRUCache]:
+        return cls._derivation_cache
+
+    @classmethod
+    def set_derivation_cache(cls, cache: typing.Optional[LRUCache]):
+        """Cache for `from_public_key`; `None` derives every address afresh."""
+        cls._derivation_cache = cache
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), (self.address,))
 
     def __eq__(self, o: SuiAddress) -> bool:
-        return self.address == o.address
+        try:
+            return self.address == o.address
+        except AttributeError:
+            return NotImplemented
+
+    def __lt__(self, o: SuiAddress) -> bool:
+        if not isinstance(o, SuiAddress):
+            return NotImplemented
+        return bytes(self.address) < bytes(o.address)
+
+    def __hash__(self) -> int:
+        return hash(self.address)
 
     def __str__(self) -> str:
         return self.hex()
 
+    def __repr__(self) -> str:
+        return f"SuiAddress({self.hex()})"
+
     def hex(self) -> str:
         return f"0x{self.address.hex()}"
 
@@ -40,9 +99,32 @@ class SuiAddress:
         Class: `PublicKey` `SuiPublicKey` `Ed25519SuiPublicKey` `Ed25519PublicKey`
         `Secp256k1SuiPublicKey` `Secp256k1Public`
         """
+        return SuiAddress.from_public_key_bytes(pk.scheme(), pk.bytes())
+
+    @staticmethod
+    def from_public_key_bytes(
+        scheme: int, pk: bytes, cached: bool = True
+    ) -> SuiAddress:
+        """Derive the address of a raw public key, through the derivation cache.
+
+        Bulk one-off derivations should pass `cached=False` so they do not
+        evict the hot entries.
+        """
+        cache = SuiAddress._derivation_cache
+        if cache is None or not cached:
+            return SuiAddress._derive(scheme, pk)
+        key = (scheme, bytes(pk))
+        address = cache.get(key)
+        if address is None:
+            address = SuiAddress._derive(scheme, pk)
+            cache.put(key, address)
+        return address
+
+    @staticmethod
+    def _derive(scheme: int, pk: bytes) -> SuiAddress:
         sha3_256 = hashlib.sha3_256()
-        sha3_256.update(bytes([pk.scheme()]))
-        sha3_256.update(pk.bytes())
+        sha3_256.update(bytes([scheme]))
+        sha3_256.update(pk)
         digest = sha3_256.digest()
         return SuiAddress(digest[: SuiAddress.LENGTH])
 
@@ -60,3 +142,18 @@ class SuiAddress:
 
     def serialize(self, serializer: Serializer):
         serializer.fixed_bytes(self.address)
+
+    def serialized_size(self) -> int:
+        return SuiAddress.LENGTH
+
+    @staticmethod
+    def deserialize_sequence(deserializer: Deserializer) -> typing.List[SuiAddress]:
+        values = deserializer.fixed_bytes_sequence(SuiAddress.LENGTH)
+        return [SuiAddress(x) for x in values]
+
+    @staticmethod
+    def serialize_sequence(serializer: Serializer, values: typing.List[SuiAddress]):
+        serializer.fixed_bytes_sequence([x.address for x in values], SuiAddress.LENGTH)
+
+
+schema.define(SuiAddress, schema.Struct(address=schema.Fixed(SuiAddress.LENGTH)))
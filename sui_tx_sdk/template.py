@@ -0,0 +1,267 @@
+# Copyright (c) JubiterWallet
+# Author: Ruquan
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Byte-level templates for transactions that differ only in a few fields.
+
+A `TransactionTemplate` encodes a prototype `TransactionData` once and records
+where each fixed-width field lies in the encoding: the header fields of every
+transaction, plus the recipients, amounts and object refs of `TransferSui`,
+`TransferObject`, `Pay`, `PaySui` and `PayAllSui`. `render` copies the
+encoding into a preallocated buffer and overwrites the fields it is given, so
+building a payment costs a few slice assignments instead of an object graph
+and a full encoding.
+
+A value whose encoding has a different length, such as an `amount` changing
+between `None` and a number or a list changing length, cannot be patched in;
+`render` then builds the `TransactionData` and encodes it in full.
+"""
+
+from __future__ import annotations
+
+import struct
+import typing
+
+from . import schema
+from .bcs import Serializer, uleb128_size
+from .object import ObjectRef
+from .sui_address import SuiAddress
+from .transaction import (
+    Intent,
+    Pay,
+    PayAllSui,
+    PaySui,
+    SingleTransactionKind,
+    TransactionData,
+    TransactionKind,
+    TransferObject,
+    TransferSui,
+)
+
+_U64 = struct.Struct("<Q")
+
+
+def _address(value: SuiAddress) -> bytes:
+    return value.address
+
+
+def _u64(value: int) -> bytes:
+    return _U64.pack(value)
+
+
+def _object_ref(value: ObjectRef) -> bytes:
+    return schema.encode(value)
+
+
+def _option_u64(value: typing.Optional[int]) -> bytes:
+    return b"\x00" if value is None else b"\x01" + _U64.pack(value)
+
+
+def _elements(
+    write: typing.Callable[[Serializer, typing.List[typing.Any]], None]
+) -> typing.Callable[[typing.List[typing.Any]], bytes]:
+    """Encoding of a sequence written by `write`, without its length prefix."""
+
+    def encode(values: typing.List[typing.Any]) -> bytes:
+        ser = Serializer()
+        write(ser, values)
+        return ser.output()[uleb128_size(len(values)) :]
+
+    return encode
+
+
+def _sequence(encode: typing.Callable[[typing.Any], bytes]):
+    def encode_all(values: typing.List[typing.Any]) -> bytes:
+        return b"".join([encode(x) for x in values])
+
+    return encode_all
+
+
+_HEADER = [
+    ("sender", _address),
+    ("gas_payment", _object_ref),
+    ("gas_price", _u64),
+    ("gas_budget", _u64),
+]
+
+# Fields of each patchable payload in wire order; `True` marks a sequence, whose
+# slot starts after its length prefix.
+_PAYLOADS = {
+    TransferSui: [("recipient", _address, False), ("amount", _option_u64, False)],
+    TransferObject: [
+        ("recipient", _address, False),
+        ("object_ref", _object_ref, False),
+    ],
+    PayAllSui: [
+        ("coins", _elements(ObjectRef.serialize_sequence), True),
+        ("recipient", _address, False),
+    ],
+}
+for pay in (Pay, PaySui):
+    _PAYLOADS[pay] = [
+        ("coins", _elements(ObjectRef.serialize_sequence), True),
+        ("recipients", _sequence(_address), True),
+        ("amounts", _elements(Serializer.u64_sequence), True),
+    ]
+
+
+class _Slot:
+    __slots__ = ("offset", "end", "encode", "default")
+
+    def __init__(
+        self, offset: int, encode: typing.Callable[[typing.Any], bytes], default: bytes
+    ):
+        self.offset = offset
+        self.end = offset + len(default)
+        self.encode = encode
+        self.default = default
+
+
+class TransactionTemplate:
+    """
+    Encodings of `prototype` with some fields replaced.
+
+    With `intent` the output is the encoded `IntentMessage`, ready to sign.
+    `render` reuses one buffer and is not safe to call from several threads at
+    once; `render_into` only reads the template.
+    """
+
+    _prototype: TransactionData
+    _intent: bytes
+    _data: bytes
+    _slots: typing.Dict[str, _Slot]
+    _buffer: bytearray
+    _dirty: typing.List[_Slot]
+
+    def __init__(
+        self, prototype: TransactionData, intent: typing.Optional[Intent] = None
+    ):
+        self._prototype = prototype
+        self._intent = b"" if intent is None else intent.bytes()
+        self._data = self._intent + schema.encode(prototype)
+        self._slots = {}
+
+        kind = prototype.kind
+        offset = len(self._intent)
+        if kind.variant == TransactionKind.SINGLE:
+            payload = kind.value.value
+            offset += uleb128_size(kind.variant) + uleb128_size(kind.value.variant)
+            for (name, encode, sequence) in _PAYLOADS.get(type(payload), []):
+                value = getattr(payload, name)
+                if sequence:
+                    offset += uleb128_size(len(value))
+                offset = self._add_slot(name, offset, encode, value)
+
+        # The header closes the encoding.
+        header = [
+            (name, encode, getattr(prototype, name)) for (name, encode) in _HEADER
+        ]
+        offset = len(self._data) - sum(
+            len(encode(value)) for (_, encode, value) in header
+        )
+        for (name, encode, value) in header:
+            offset = self._add_slot(name, offset, encode, value)
+
+        self._buffer = bytearray(self._data)
+        self._dirty = []
+
+    def _add_slot(
+        self,
+        name: str,
+        offset: int,
+        encode: typing.Callable[[typing.Any], bytes],
+        value,
+    ) -> int:
+        default = encode(value)
+        slot = _Slot(offset, encode, default)
+        if self._data[slot.offset : slot.end] != default:
+            raise Exception(f"Field {name} is not at offset {offset} of the template")
+        self._slots[name] = slot
+        return slot.end
+
+    def fields(self) -> typing.List[str]:
+        """Names of the fields `render` can replace."""
+        return list(self._slots)
+
+    def size(self) -> int:
+        """Length of every output that does not fall back to a full encoding."""
+        return len(self._data)
+
+    def render(self, **values: typing.Any) -> bytes:
+        """The encoding of the prototype with `values` in place of its fields."""
+        patches = self._patches(values)
+        if patches is None:
+            return self._encode(values)
+        buf = self._buffer
+        for slot in self._dirty:
+            buf[slot.offset : slot.end] = slot.default
+        for (slot, data) in patches:
+            buf[slot.offset : slot.end] = data
+        self._dirty = [slot for (slot, _) in patches]
+        return bytes(buf)
+
+    def render_into(
+        self,
+        buf: typing.Union[bytearray, memoryview],
+        offset: int,
+        **values: typing.Any,
+    ) -> int:
+        """Write `render(**values)` into `buf` at `offset`; return the offset past it.
+
+        A `bytearray` grows as needed, a `memoryview` must have room.
+        """
+        patches = self._patches(values)
+        if patches is None:
+            ser = Serializer()
+            ser.fixed_bytes(self._encode(values))
+            return ser.output_into(buf, offset)
+        end = offset + len(self._data)
+        if offset < 0 or offset > len(buf):
+            raise Exception(f"Offset {offset} is outside a buffer of {len(buf)}")
+        if end > len(buf) and not isinstance(buf, bytearray):
+            raise Exception(
+                f"Buffer too small. Requested: {end - offset}, found: {len(buf) - offset}"
+            )
+        buf[offset:end] = self._data
+        for (slot, data) in patches:
+            buf[offset + slot.offset : offset + slot.end] = data
+        return end
+
+    def transaction(self, **values: typing.Any) -> TransactionData:
+        """The `TransactionData` that `render(**values)` encodes."""
+        for name in values:
+            if name not in self._slots:
+                raise Exception(f"{name} is not a field of this template")
+        prototype = self._prototype
+        header = {
+            name: values.pop(name, getattr(prototype, name)) for (name, _) in _HEADER
+        }
+        kind = prototype.kind
+        if values:
+            payload = kind.value.value
+            layout = schema.layout_of(type(payload))
+            fields = [
+                values.pop(name, getattr(payload, name)) for (name, _) in layout.fields
+            ]
+            kind = TransactionKind(SingleTransactionKind(type(payload)(*fields)))
+        return TransactionData(kind, **header)
+
+    def _patches(
+        self, values: typing.Dict[str, typing.Any]
+    ) -> typing.Optional[typing.List[typing.Tuple[_Slot, bytes]]]:
+        """Encoded `values` by slot, or `None` if one of them changes size."""
+        patches = []
+        slots = self._slots
+        for (name, value) in values.items():
+            slot = slots.get(name)
+            if slot is None:
+                raise Exception(f"{name} is not a field of this template")
+            data = slot.encode(value)
+            if len(data) != slot.end - slot.offset:
+                return None
+            patches.append((slot, data))
+        return patches
+
+    def _encode(self, values: typing.Dict[str, typing.Any]) -> bytes:
+        return self._intent + schema.encode(self.transaction(**values))
@@ -4,21 +4,68 @@
 
 from __future__ import annotations
 
+import functools
+import struct
 import typing
-import unittest
+import warnings
 
-from hashlib import sha3_256
-from deprecated import deprecated
+from hashlib import blake2b, sha3_256
 
+from . import schema
 from .sui_address import SuiAddress
-from .bcs import Deserializer, Serializer
+from .bcs import (
+    Deserializer,
+    HashingSerializer,
+    Serializer,
+    bytes_size,
+    sequence_size,
+    str_size,
+    uleb128_size,
+)
+from .account_address import AccountAddress
 from .object import ObjectRef, ObjectDigest
 from .type_tag import TypeTag
 from .call_arg import CallArg
 from .crypto import Signature
 
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+
+def deprecated(reason: str):
+    """Mark a function or staticmethod as deprecated, warning on every call.
+
+    Stands in for the `deprecated` package, whose `wrapt` dependency costs
+    more to import than the rest of the SDK.
+    """
+
+    def decorate(func):
+        method = isinstance(func, staticmethod)
+        if method:
+            func = func.__func__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            warnings.warn(
+                f"Call to deprecated function {func.__qualname__}. ({reason})",
+                category=DeprecationWarning,
+                stacklevel=2,
+            )
+            return func(*args, **kwargs)
+
+        return staticmethod(wrapper) if method else wrapper
+
+    return decorate
+
+
+def blake2b_256(data: bytes = b"") -> typing.Any:
+    """hashlib-style constructor for the 32-byte blake2b used by newer digests."""
+    return blake2b(data, digest_size=32)
+
 
 class SenderSignedData:
+    __slots__ = ("intent_message", "tx_signature")
+
     intent_message: IntentMessage
     tx_signature: Signature
 
@@ -32,12 +79,73 @@ class SenderSignedData:
             and self.tx_signature == self.tx_signature
         )
 
-    def digest(self) -> ObjectDigest:
-        digest = sha3_256(self.intent_message.bytes())
-        return ObjectDigest(digest)
+    def digest(
+        self, hash_factory: typing.Callable[[], typing.Any] = sha3_256
+    ) -> ObjectDigest:
+        """Hash of the encoded intent message, computed while encoding it."""
+        ser = HashingSerializer(hash_factory)
+        schema.encoder(type(self.intent_message))(ser, self.intent_message)
+        return ObjectDigest(ser.digest())
+
+    def intent_message_bytes_and_digest(
+        self, hash_factory: typing.Callable[[], typing.Any] = sha3_256
+    ) -> typing.Tuple[bytes, ObjectDigest]:
+        """The encoded intent message and its `digest`, from a single pass."""
+        ser = HashingSerializer(hash_factory, keep_output=True)
+        schema.encoder(type(self.intent_message))(ser, self.intent_message)
+        return ser.output(), ObjectDigest(ser.digest())
 
     def verify(self) -> bool:
-        return self.tx_signature.verify(self.intent_message, self.intent_message.sender)
+        return self.tx_signature.verify(
+            self.intent_message, self.intent_message.value.sender
+        )
+
+    @staticmethod
+    def verify_many(
+        items: typing.Iterable[typing.Union[SenderSignedData, bytes]],
+        workers: typing.Optional[int] = None,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        chunksize: int = 64,
+    ) -> typing.List[bool]:
+        """Verify signed transactions and return one result per item, in order.
+
+        Items may be `SenderSignedData` or its BCS bytes; only bytes are sent
+        to workers. With `workers` a process pool of that size is started for
+        the call; pass `executor` to reuse a pool instead. A thread pool also
+        helps, as both signature backends release the GIL while verifying.
+        Malformed items and author mismatches verify as `False`.
+        """
+        datas = [x if isinstance(x, bytes) else _encode_signed(x) for x in items]
+        if executor is not None:
+            return list(executor.map(_verify_signed_bytes, datas, chunksize=chunksize))
+        if workers is None or workers <= 1:
+            return [_verify_signed_bytes(x) for x in datas]
+        # Imported on use: concurrent.futures pulls in logging and threading.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as pool:
+            return list(pool.map(_verify_signed_bytes, datas, chunksize=chunksize))
+
+    @staticmethod
+    def from_bytes(
+        bs: bytes, lazy: bool = False, frozen: bool = False
+    ) -> SenderSignedData:
+        deser = Deserializer(bs)
+        if frozen:
+            return FrozenSenderSignedData.deserialize(deser)
+        if lazy:
+            return SenderSignedData.deserialize_lazy(deser)
+        return SenderSignedData.deserialize(deser)
+
+    def freeze(self) -> FrozenSenderSignedData:
+        """An immutable copy that encodes once; see `FrozenSenderSignedData`."""
+        return FrozenSenderSignedData(self.intent_message.freeze(), self.tx_signature)
+
+    def serialize_into(
+        self, buf: typing.Union[bytearray, memoryview], offset: int
+    ) -> int:
+        """Encode into `buf` at `offset` and return the offset past the value."""
+        return schema.encode_into(self, buf, offset)
 
     @staticmethod
     def deserialize(deserializer: Deserializer) -> SenderSignedData:
@@ -45,12 +153,52 @@ class SenderSignedData:
         signature = deserializer.struct(Signature)
         return SenderSignedData(data, signature)
 
+    @staticmethod
+    def deserialize_lazy(deserializer: Deserializer) -> SenderSignedData:
+        data = IntentMessage.deserialize_lazy(deserializer)
+        signature = deserializer.struct(Signature)
+        return SenderSignedData(data, signature)
+
     def serialize(self, serializer: Serializer):
         serializer.struct(self.intent_message)
         serializer.struct(self.tx_signature)
 
+    def serialized_size(self) -> int:
+        return (
+            self.intent_message.serialized_size() + self.tx_signature.serialized_size()
+        )
+
+
+def _encode_signed(value: SenderSignedData) -> bytes:
+    """Encoding of `value`, or no bytes at all, which verify as `False`."""
+    try:
+        return schema.encode(value)
+    except Exception:
+        return b""
+
+
+def _verify_signed_bytes(data: bytes) -> bool:
+    """Verify encoded `SenderSignedData`, as `from_bytes(data).verify()` would.
+
+    The intent message is decoded in full, so bytes that decoder rejects fail
+    here too; the signed message is its encoding, a prefix of `data`.
+    """
+    try:
+        deserializer = Deserializer(data)
+        message = schema.decoder(IntentMessage)(deserializer)
+        end = deserializer.offset()
+        signature = deserializer.struct(Signature)
+        if deserializer.remaining() != 0:
+            return False
+        sig, pk = signature.get_verification_inputs(message.value.sender)
+        return pk.verify(data[:end], sig)
+    except Exception:
+        return False
+
 
 class IntentMessage:
+    __slots__ = ("indent", "value")
+
     indent: Intent
     value: TransactionData
 
@@ -63,15 +211,31 @@ class IntentMessage:
         return self.indent == o.indent and self.value == o.value
 
     @staticmethod
-    def from_bytes(bs: bytes) -> IntentMessage:
+    def from_bytes(
+        bs: bytes, lazy: bool = False, frozen: bool = False
+    ) -> IntentMessage:
         deser = Deserializer(bs)
+        if frozen:
+            return FrozenIntentMessage.deserialize(deser)
+        if lazy:
+            return IntentMessage.deserialize_lazy(deser)
         return IntentMessage.deserialize(deser)
 
+    def freeze(self) -> FrozenIntentMessage:
+        """An immutable copy that encodes once; see `FrozenIntentMessage`."""
+        return FrozenIntentMessage(self.indent, self.value.freeze())
+
     def bytes(self) -> bytes:
         ser = Serializer()
         self.serialize(ser)
         return ser.output()
 
+    def serialize_into(
+        self, buf: typing.Union[bytearray, memoryview], offset: int
+    ) -> int:
+        """Encode into `buf` at `offset` and return the offset past the value."""
+        return schema.encode_into(self, buf, offset)
+
     @staticmethod
     def deserialize(deserializer: Deserializer) -> IntentMessage:
         indent = deserializer.struct(Intent)
@@ -79,12 +243,24 @@ class IntentMessage:
 
         return IntentMessage(indent, msg)
 
+    @staticmethod
+    def deserialize_lazy(deserializer: Deserializer) -> IntentMessage:
+        indent = deserializer.struct(Intent)
+        msg = TransactionData.deserialize_lazy(deserializer)
+
+        return IntentMessage(indent, msg)
+
     def serialize(self, serialize: Serializer):
         serialize.struct(self.indent)
         serialize.struct(self.value)
 
+    def serialized_size(self) -> int:
+        return self.indent.serialized_size() + self.value.serialized_size()
+
 
 class Intent:
+    __slots__ = ("scope", "version", "app_id")
+
     scope: int
     version: int
     app_id: int
@@ -111,6 +287,12 @@ class Intent:
         self.serialize(ser)
         return ser.output()
 
+    def serialize_into(
+        self, buf: typing.Union[bytearray, memoryview], offset: int
+    ) -> int:
+        """Encode into `buf` at `offset` and return the offset past the value."""
+        return schema.encode_into(self, buf, offset)
+
     @staticmethod
     def deserialize(deserializer: Deserializer) -> Intent:
         scope = deserializer.u8()
@@ -123,8 +305,13 @@ class Intent:
         serializer.u8(self.version)
         serializer.u8(self.app_id)
 
+    def serialized_size(self) -> int:
+        return 3
+
 
 class TransactionData:
+    __slots__ = ("kind", "sender", "gas_payment", "gas_price", "gas_budget")
+
     kind: TransactionKind
     sender: SuiAddress
     gas_payment: ObjectRef
@@ -184,15 +371,42 @@ class TransactionData:
         return bytes(data)
 
     @staticmethod
-    def from_bytes(bs: bytes) -> TransactionData:
+    def from_bytes(
+        bs: bytes, lazy: bool = False, frozen: bool = False
+    ) -> TransactionData:
         deser = Deserializer(bs)
+        if frozen:
+            return FrozenTransactionData.deserialize(deser)
+        if lazy:
+            return TransactionData.deserialize_lazy(deser)
         return TransactionData.deserialize(deser)
 
+    def freeze(self) -> FrozenTransactionData:
+        """An immutable copy that encodes once; see `FrozenTransactionData`."""
+        return FrozenTransactionData(
+            self.kind, self.sender, self.gas_payment, self.gas_price, self.gas_budget
+        )
+
     def bytes(self) -> bytes:
         ser = Serializer()
         self.serialize(ser)
         return ser.output()
 
+    def serialize_into(
+        self, buf: typing.Union[bytearray, memoryview], offset: int
+    ) -> int:
+        """Encode into `buf` at `offset` and return the offset past the value."""
+        return schema.encode_into(self, buf, offset)
+
+    def digest(
+        self, hash_factory: typing.Callable[[], typing.Any] = blake2b_256
+    ) -> ObjectDigest:
+        """Transaction digest: the hash of `TransactionData::` and the encoding."""
+        ser = HashingSerializer(hash_factory)
+        ser.fixed_bytes(b"TransactionData::")
+        schema.encoder(type(self))(ser, self)
+        return ObjectDigest(ser.digest())
+
     @staticmethod
     def deserialize(deserializer: Deserializer) -> TransactionData:
         kind = TransactionKind.deserialize(deserializer)
@@ -203,6 +417,15 @@ class TransactionData:
 
         return TransactionData(kind, sender, gas_payment, gas_price, gas_budget)
 
+    @staticmethod
+    def deserialize_lazy(deserializer: Deserializer) -> LazyTransactionData:
+        """Step over the kind without decoding it; see `LazyTransactionData`."""
+        start = deserializer.offset()
+        schema.skipper(TransactionKind)(deserializer)
+        kind = deserializer.slice(start, deserializer.offset())
+        header = deserializer.fixed_bytes(_HEADER_SIZE)
+        return LazyTransactionData(kind, header)
+
     def serialize(self, serializer: Serializer):
         serializer.struct(self.kind)
         serializer.struct(self.sender)
@@ -210,8 +433,315 @@ class TransactionData:
         serializer.u64(self.gas_price)
         serializer.u64(self.gas_budget)
 
+    def serialized_size(self) -> int:
+        return (
+            self.kind.serialized_size()
+            + self.sender.serialized_size()
+            + self.gas_payment.serialized_size()
+            + 16
+        )
+
+
+_UNDECODED = object()
+
+# sender, gas_payment, then gas_price and gas_budget packed as "<QQ".
+_SENDER_END = SuiAddress.LENGTH
+_GAS_PAYMENT_END = _SENDER_END + AccountAddress.LENGTH + 8 + 1 + ObjectDigest.LENGTH
+_GAS = struct.Struct("<QQ")
+_HEADER_SIZE = _GAS_PAYMENT_END + _GAS.size
+
+
+def _lazy(name: str, decode: typing.Callable[[LazyTransactionData], typing.Any]):
+    attr = "_" + name
+
+    def get(self):
+        value = getattr(self, attr)
+        if value is _UNDECODED:
+            value = decode(self)
+            setattr(self, attr, value)
+        return value
+
+    def set(self, value):
+        setattr(self, attr, value)
+
+    return property(get, set)
+
+
+class LazyTransactionData(TransactionData):
+    """
+    A `TransactionData` that keeps its encoded kind and header and decodes each
+    field on first access.
+
+    Reading `sender` or `gas_budget` never builds the `TransactionKind`, and
+    serializing an untouched value writes the original bytes back.
+    """
+
+    __slots__ = (
+        "_kind_bytes",
+        "_header",
+        "_kind",
+        "_sender",
+        "_gas_payment",
+        "_gas_price",
+        "_gas_budget",
+    )
+
+    _kind_bytes: bytes
+    _header: bytes
+
+    def __init__(self, kind: bytes, header: bytes) -> None:
+        self._kind_bytes = kind
+        self._header = header
+        self._kind = _UNDECODED
+        self._sender = _UNDECODED
+        self._gas_payment = _UNDECODED
+        self._gas_price = _UNDECODED
+        self._gas_budget = _UNDECODED
+
+    kind = _lazy(
+        "kind",
+        lambda self: TransactionKind.deserialize(Deserializer(self._kind_bytes)),
+    )
+    sender = _lazy(
+        "sender",
+        lambda self: SuiAddress(self._header[:_SENDER_END]),
+    )
+    gas_payment = _lazy(
+        "gas_payment",
+        lambda self: ObjectRef.deserialize(
+            Deserializer(self._header[_SENDER_END:_GAS_PAYMENT_END])
+        ),
+    )
+    gas_price = _lazy(
+        "gas_price",
+        lambda self: _GAS.unpack_from(self._header, _GAS_PAYMENT_END)[0],
+    )
+    gas_budget = _lazy(
+        "gas_budget",
+        lambda self: _GAS.unpack_from(self._header, _GAS_PAYMENT_END)[1],
+    )
+
+    def serialize(self, serializer: Serializer):
+        if self._kind is _UNDECODED:
+            serializer.fixed_bytes(self._kind_bytes)
+        else:
+            serializer.struct(self._kind)
+        if all(
+            x is _UNDECODED
+            for x in (
+                self._sender,
+                self._gas_payment,
+                self._gas_price,
+                self._gas_budget,
+            )
+        ):
+            serializer.fixed_bytes(self._header)
+            return
+        serializer.struct(self.sender)
+        serializer.struct(self.gas_payment)
+        serializer.u64(self.gas_price)
+        serializer.u64(self.gas_budget)
+
+    def serialized_size(self) -> int:
+        if self._kind is _UNDECODED:
+            return len(self._kind_bytes) + _HEADER_SIZE
+        return self._kind.serialized_size() + _HEADER_SIZE
+
+
+class _Frozen:
+    """
+    Immutability, equality and hashing shared by the frozen classes.
+
+    A frozen value holds its canonical encoding in `_bytes`, so encoding it is
+    a copy, equality is a bytes comparison and its hash is that of the bytes,
+    which `bytes` itself caches. Attributes can only be set until `_bytes` is.
+    The objects a frozen value holds are shared, not copied, and must not be
+    changed afterwards.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: typing.Any):
+        if hasattr(self, "_bytes"):
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, o: typing.Any) -> bool:
+        if type(o) is type(self):
+            return self._bytes == o._bytes
+        return super().__eq__(o)
+
+    def __hash__(self) -> int:
+        return hash(self._bytes)
+
+    def __reduce__(self):
+        return (type(self).from_bytes, (self._bytes, False, True))
+
+    def freeze(self):
+        return self
+
+    def bytes(self) -> bytes:
+        return self._bytes
+
+    def serialize(self, serializer: Serializer):
+        serializer.fixed_bytes(self._bytes)
+
+    def serialized_size(self) -> int:
+        return len(self._bytes)
+
+
+def _hash(hash_factory: typing.Callable[[], typing.Any], *parts: bytes) -> bytes:
+    hasher = hash_factory()
+    for part in parts:
+        hasher.update(part)
+    return hasher.digest()
+
+
+class FrozenTransactionData(_Frozen, TransactionData):
+    """A `TransactionData` whose encoding and digest are computed once."""
+
+    __slots__ = ("_bytes", "_digest")
+
+    def __init__(
+        self,
+        kind: TransactionKind,
+        sender: SuiAddress,
+        gas_payment: ObjectRef,
+        gas_price: int,
+        gas_budget: int,
+        data: typing.Optional[bytes] = None,
+    ) -> None:
+        """`data`, the encoding of the fields, is trusted as given."""
+        super().__init__(kind, sender, gas_payment, gas_price, gas_budget)
+        self._digest = None
+        if data is None:
+            # Encoding `self` would go to `serialize`, which needs `_bytes`.
+            data = schema.encode(
+                TransactionData(kind, sender, gas_payment, gas_price, gas_budget)
+            )
+        self._bytes = data
+
+    def thaw(self) -> TransactionData:
+        """A mutable `TransactionData` sharing the fields."""
+        return TransactionData(
+            self.kind, self.sender, self.gas_payment, self.gas_price, self.gas_budget
+        )
+
+    def digest(
+        self, hash_factory: typing.Callable[[], typing.Any] = blake2b_256
+    ) -> ObjectDigest:
+        if hash_factory is not blake2b_256:
+            return ObjectDigest(_hash(hash_factory, b"TransactionData::", self._bytes))
+        if self._digest is None:
+            digest = ObjectDigest(
+                _hash(hash_factory, b"TransactionData::", self._bytes)
+            )
+            object.__setattr__(self, "_digest", digest)
+        return self._digest
+
+    @staticmethod
+    def deserialize(deserializer: Deserializer) -> FrozenTransactionData:
+        start = deserializer.offset()
+        value = schema.decoder(TransactionData)(deserializer)
+        return FrozenTransactionData(
+            value.kind,
+            value.sender,
+            value.gas_payment,
+            value.gas_price,
+            value.gas_budget,
+            bytes(deserializer.slice(start, deserializer.offset())),
+        )
+
+
+class FrozenIntentMessage(_Frozen, IntentMessage):
+    """An `IntentMessage` of a frozen transaction, encoded once.
+
+    Its bytes are the signed message, so `Signature.verify` never re-encodes.
+    """
+
+    __slots__ = ("_bytes",)
+
+    value: FrozenTransactionData
+
+    def __init__(
+        self,
+        indent: Intent,
+        msg: TransactionData,
+        data: typing.Optional[bytes] = None,
+    ) -> None:
+        msg = msg.freeze()
+        super().__init__(indent, msg)
+        if data is None:
+            data = indent.bytes() + msg.bytes()
+        self._bytes = data
+
+    def thaw(self) -> IntentMessage:
+        return IntentMessage(self.indent, self.value.thaw())
+
+    @staticmethod
+    def deserialize(deserializer: Deserializer) -> FrozenIntentMessage:
+        start = deserializer.offset()
+        indent = deserializer.struct(Intent)
+        msg = FrozenTransactionData.deserialize(deserializer)
+        data = bytes(deserializer.slice(start, deserializer.offset()))
+        return FrozenIntentMessage(indent, msg, data)
+
+
+class FrozenSenderSignedData(_Frozen, SenderSignedData):
+    """A `SenderSignedData` whose encoding and digest are computed once."""
+
+    __slots__ = ("_bytes", "_digest")
+
+    intent_message: FrozenIntentMessage
+
+    def __init__(
+        self,
+        data: IntentMessage,
+        signature: Signature,
+        encoded: typing.Optional[bytes] = None,
+    ) -> None:
+        data = data.freeze()
+        super().__init__(data, signature)
+        self._digest = None
+        if encoded is None:
+            ser = Serializer()
+            signature.serialize(ser)
+            encoded = data.bytes() + ser.output()
+        self._bytes = encoded
+
+    def thaw(self) -> SenderSignedData:
+        return SenderSignedData(self.intent_message.thaw(), self.tx_signature)
+
+    def digest(
+        self, hash_factory: typing.Callable[[], typing.Any] = sha3_256
+    ) -> ObjectDigest:
+        message = self.intent_message.bytes()
+        if hash_factory is not sha3_256:
+            return ObjectDigest(_hash(hash_factory, message))
+        if self._digest is None:
+            object.__setattr__(self, "_digest", ObjectDigest(_hash(sha3_256, message)))
+        return self._digest
+
+    def intent_message_bytes_and_digest(
+        self, hash_factory: typing.Callable[[], typing.Any] = sha3_256
+    ) -> typing.Tuple[bytes, ObjectDigest]:
+        return self.intent_message.bytes(), self.digest(hash_factory)
+
+    @staticmethod
+    def deserialize(deserializer: Deserializer) -> FrozenSenderSignedData:
+        start = deserializer.offset()
+        data = FrozenIntentMessage.deserialize(deserializer)
+        signature = deserializer.struct(Signature)
+        encoded = bytes(deserializer.slice(start, deserializer.offset()))
+        return FrozenSenderSignedData(data, signature, encoded)
+
 
 class TransactionKind:
+    __slots__ = ("variant", "value")
+
     SINGLE: int = 0
     BATCH: int = 1
 
@@ -255,8 +785,17 @@ class TransactionKind:
         else:
             serializer.sequence(self.value, Serializer.struct)
 
+    def serialized_size(self) -> int:
+        if isinstance(self.value, SingleTransactionKind):
+            size = self.value.serialized_size()
+        else:
+            size = sequence_size(self.value, SingleTransactionKind.serialized_size)
+        return uleb128_size(self.variant) + size
+
 
 class SingleTransactionKind:
+    __slots__ = ("variant", "value")
+
     TRANSFER_OBJECT: int = 0
     PUBLISH: int = 1
     CALL: int = 2
@@ -323,11 +862,16 @@ class SingleTransactionKind:
         serializer.uleb128(self.variant)
         self.value.serialize(serializer)
 
+    def serialized_size(self) -> int:
+        return uleb128_size(self.variant) + self.value.serialized_size()
+
 
 KIND = SingleTransactionKind | typing.List[SingleTransactionKind]
 
 
 class TransferObject:
+    __slots__ = ("recipient", "object_ref")
+
     recipient: SuiAddress
     object_ref: ObjectRef
 
@@ -354,8 +898,13 @@ class TransferObject:
         self.recipient.serialize(serializer)
         self.object_ref.serialize(serializer)
 
+    def serialized_size(self) -> int:
+        return self.recipient.serialized_size() + self.object_ref.serialized_size()
+
 
 class TransferSui:
+    __slots__ = ("recipient", "amount")
+
     recipient: SuiAddress
     amount: typing.Optional[int]
 
@@ -388,8 +937,14 @@ class TransferSui:
         if isinstance(self.amount, int):
             serializer.u64(self.amount)
 
+    def serialized_size(self) -> int:
+        amount = 9 if isinstance(self.amount, int) else 1
+        return self.recipient.serialized_size() + amount
+
 
 class Pay:
+    __slots__ = ("coins", "recipients", "amounts")
+
     coins: typing.List[ObjectRef]
     recipients: typing.List[SuiAddress]
     amounts: typing.List[int]
@@ -429,18 +984,29 @@ class Pay:
 
     @staticmethod
     def deserialize(deserializer: Deserializer) -> Pay:
-        coins = deserializer.sequence(ObjectRef.deserialize)
-        recipients = deserializer.sequence(SuiAddress.deserialize)
-        amounts = deserializer.sequence(Deserializer.u64)
+        coins = ObjectRef.deserialize_sequence(deserializer)
+        recipients = SuiAddress.deserialize_sequence(deserializer)
+        amounts = deserializer.u64_sequence()
         return Pay(coins, recipients, amounts)
 
     def serialize(self, serializer: Serializer):
-        serializer.sequence(self.coins, Serializer.struct)
-        serializer.sequence(self.recipients, Serializer.struct)
-        serializer.sequence(self.amounts, Serializer.u64)
+        ObjectRef.serialize_sequence(serializer, self.coins)
+        SuiAddress.serialize_sequence(serializer, self.recipients)
+        serializer.u64_sequence(self.amounts)
+
+    def serialized_size(self) -> int:
+        return (
+            sequence_size(self.coins, ObjectRef.serialized_size)
+            + uleb128_size(len(self.recipients))
+            + SuiAddress.LENGTH * len(self.recipients)
+            + uleb128_size(len(self.amounts))
+            + 8 * len(self.amounts)
+        )
 
 
 class PaySui:
+    __slots__ = ("coins", "recipients", "amounts")
+
     coins: typing.List[ObjectRef]
     recipients: typing.List[SuiAddress]
     amounts: typing.List[int]
@@ -480,18 +1046,29 @@ class PaySui:
 
     @staticmethod
     def deserialize(deserializer: Deserializer) -> PaySui:
-        coins = deserializer.sequence(ObjectRef.deserialize)
-        recipients = deserializer.sequence(SuiAddress.deserialize)
-        amounts = deserializer.sequence(Deserializer.u64)
+        coins = ObjectRef.deserialize_sequence(deserializer)
+        recipients = SuiAddress.deserialize_sequence(deserializer)
+        amounts = deserializer.u64_sequence()
         return PaySui(coins, recipients, amounts)
 
     def serialize(self, serializer: Serializer):
-        serializer.sequence(self.coins, Serializer.struct)
-        serializer.sequence(self.recipients, Serializer.struct)
-        serializer.sequence(self.amounts, Serializer.u64)
+        ObjectRef.serialize_sequence(serializer, self.coins)
+        SuiAddress.serialize_sequence(serializer, self.recipients)
+        serializer.u64_sequence(self.amounts)
+
+    def serialized_size(self) -> int:
+        return (
+            sequence_size(self.coins, ObjectRef.serialized_size)
+            + uleb128_size(len(self.recipients))
+            + SuiAddress.LENGTH * len(self.recipients)
+            + uleb128_size(len(self.amounts))
+            + 8 * len(self.amounts)
+        )
 
 
 class PayAllSui:
+    __slots__ = ("coins", "recipient")
+
     coins: typing.List[ObjectRef]
     recipient: SuiAddress
 
@@ -520,16 +1097,24 @@ class PayAllSui:
 
     @staticmethod
     def deserialize(deserializer: Deserializer) -> PayAllSui:
-        coins = deserializer.sequence(ObjectRef.deserialize)
+        coins = ObjectRef.deserialize_sequence(deserializer)
         recipient = SuiAddress.deserialize(deserializer)
         return PayAllSui(coins, recipient)
 
     def serialize(self, serializer: Serializer):
-        serializer.sequence(self.coins, Serializer.struct)
+        ObjectRef.serialize_sequence(serializer, self.coins)
         self.recipient.serialize(serializer)
 
+    def serialized_size(self) -> int:
+        return (
+            sequence_size(self.coins, ObjectRef.serialized_size)
+            + self.recipient.serialized_size()
+        )
+
 
 class ChangeEpoch:
+    __slots__ = ("epoch", "storage_charge", "computation_charge", "storage_rebate")
+
     epoch: int
     storage_charge: int
     computation_charge: int
@@ -580,8 +1165,13 @@ class ChangeEpoch:
         serializer.u64(self.computation_charge)
         serializer.u64(self.storage_rebate)
 
+    def serialized_size(self) -> int:
+        return 32
+
 
 class MoveModulePublish:
+    __slots__ = ("modules",)
+
     modules: typing.List[bytes]
 
     def __init__(self, modules: typing.List[bytes]):
@@ -604,8 +1194,13 @@ class MoveModulePublish:
     def serialize(self, serializer: Serializer):
         serializer.sequence(self.modules, Serializer.bytes)
 
+    def serialized_size(self) -> int:
+        return sequence_size(self.modules, bytes_size)
+
 
 class MoveCall:
+    __slots__ = ("package", "module", "function", "type_args", "args")
+
     package: ObjectRef
     module: str
     function: str
@@ -663,6 +1258,15 @@ class MoveCall:
         serializer.sequence(self.type_args, Serializer.struct)
         serializer.sequence(self.args, Serializer.struct)
 
+    def serialized_size(self) -> int:
+        return (
+            self.package.serialized_size()
+            + str_size(self.module)
+            + str_size(self.function)
+            + sequence_size(self.type_args, TypeTag.serialized_size)
+            + sequence_size(self.args, CallArg.serialized_size)
+        )
+
 
 TX = (
     TransferObject
@@ -674,3 +1278,82 @@ TX = (
     | PayAllSui
     | ChangeEpoch
 )
+
+
+schema.define(
+    SenderSignedData,
+    schema.Struct(intent_message=IntentMessage, tx_signature=Signature),
+)
+schema.define(IntentMessage, schema.Struct(indent=Intent, value=TransactionData))
+schema.define(
+    Intent,
+    schema.Struct(scope=schema.U8, version=schema.U8, app_id=schema.U8),
+)
+schema.define(
+    TransactionData,
+    schema.Struct(
+        kind=TransactionKind,
+        sender=SuiAddress,
+        gas_payment=ObjectRef,
+        gas_price=schema.U64,
+        gas_budget=schema.U64,
+    ),
+)
+schema.define(
+    TransactionKind,
+    schema.Enum(SingleTransactionKind, schema.Vector(SingleTransactionKind)),
+)
+schema.define(
+    SingleTransactionKind,
+    schema.Enum(
+        TransferObject,
+        MoveModulePublish,
+        MoveCall,
+        TransferSui,
+        Pay,
+        PaySui,
+        PayAllSui,
+        ChangeEpoch,
+    ),
+)
+schema.define(
+    TransferObject,
+    schema.Struct(recipient=SuiAddress, object_ref=ObjectRef),
+)
+schema.define(
+    TransferSui,
+    schema.Struct(recipient=SuiAddress, amount=schema.Option(schema.U64)),
+)
+for pay in (Pay, PaySui):
+    schema.define(
+        pay,
+        schema.Struct(
+            coins=schema.Vector(ObjectRef),
+            recipients=schema.Vector(SuiAddress),
+            amounts=schema.Vector(schema.U64),
+        ),
+    )
+schema.define(
+    PayAllSui,
+    schema.Struct(coins=schema.Vector(ObjectRef), recipient=SuiAddress),
+)
+schema.define(
+    ChangeEpoch,
+    schema.Struct(
+        epoch=schema.U64,
+        storage_charge=schema.U64,
+        computation_charge=schema.U64,
+        storage_rebate=schema.U64,
+    ),
+)
+schema.define(MoveModulePublish, schema.Struct(modules=schema.Vector(schema.BYTES)))
+schema.define(
+    MoveCall,
+    schema.Struct(
+        package=ObjectRef,
+        module=schema.STR,
+        function=schema.STR,
+        type_args=schema.Vector(TypeTag),
+        args=schema.Vector(CallArg),
+    ),
+)
@@ -3,14 +3,24 @@
 
 from __future__ import annotations
 
+import re
 import typing
 
+from . import schema
 from .account_address import AccountAddress
-from .bcs import Deserializer, Serializer
+from .bcs import Deserializer, Serializer, sequence_size, str_size, uleb128_size
+from .cache import LRUCache
 
 
 class TypeTag:
-    """TypeTag represents a primitive in Move."""
+    """TypeTag represents a primitive in Move.
+
+    Immutable and hashable, so its encoding is memoized; see `schema.define`.
+    `from_str` parses Move type strings through a bounded cache and interns
+    what it builds, so equal tags parsed from any string share one instance.
+    """
+
+    __slots__ = ("value", "_bcs")
 
     BOOL: int = 0
     U8: int = 1
@@ -20,23 +30,69 @@ class TypeTag:
     SIGNER: int = 5
     VECTOR: int = 6
     STRUCT: int = 7
+    U16: int = 8
+    U32: int = 9
+    U256: int = 10
 
     value: typing.Any
+    # type string -> parsed TypeTag, shared by every `from_str`
+    _parse_cache: typing.ClassVar[typing.Optional[LRUCache]] = LRUCache(4096)
+    # TypeTag -> the one instance `from_str` hands out for it
+    _intern_pool: typing.ClassVar[typing.Optional[LRUCache]] = LRUCache(4096)
 
     def __init__(self, value: typing.Any):
-        self.value = value
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "_bcs", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), (self.value,))
 
     def __eq__(self, other: TypeTag) -> bool:
         return (
             self.value.variant() == other.value.variant() and self.value == other.value
         )
 
+    def __hash__(self) -> int:
+        return hash(self.value)
+
     def __str__(self):
         return self.value.__str__()
 
     def __repr__(self):
         return self.__str__()
 
+    @staticmethod
+    def from_str(type_tag: str) -> TypeTag:
+        """Parse a Move type such as `vector<0x2::coin::Coin<0x2::sui::SUI>>`."""
+        cache = TypeTag._parse_cache
+        if cache is None:
+            return _Parser(type_tag).parse()
+        tag = cache.get(type_tag)
+        if tag is None:
+            tag = _Parser(type_tag).parse()
+            cache.put(type_tag, tag)
+        return tag
+
+    @classmethod
+    def parse_cache(cls) -> typing.Optional[LRUCache]:
+        return cls._parse_cache
+
+    @classmethod
+    def set_parse_cache(cls, cache: typing.Optional[LRUCache]):
+        """Cache for `from_str`; `None` parses every string afresh."""
+        cls._parse_cache = cache
+
+    @classmethod
+    def set_intern_pool(cls, pool: typing.Optional[LRUCache]):
+        """Pool for the tags `from_str` builds; `None` keeps every parse apart."""
+        cls._intern_pool = pool
+
     @staticmethod
     def deserialize(deserializer: Deserializer) -> TypeTag:
         variant = deserializer.uleb128()
@@ -49,33 +105,71 @@ class TypeTag:
         elif variant == TypeTag.U128:
             return TypeTag(U128Tag.deserialize(deserializer))
         elif variant == TypeTag.ADDRESS:
-            return TypeTag(AccountAddressTag.deserialize(deserializer))
+            return TypeTag(AddressTag.deserialize(deserializer))
         elif variant == TypeTag.SIGNER:
-            raise NotImplementedError
+            return TypeTag(SignerTag.deserialize(deserializer))
         elif variant == TypeTag.VECTOR:
-            raise NotImplementedError
+            return TypeTag(VectorTag.deserialize(deserializer))
         elif variant == TypeTag.STRUCT:
             return TypeTag(StructTag.deserialize(deserializer))
+        elif variant == TypeTag.U16:
+            return TypeTag(U16Tag.deserialize(deserializer))
+        elif variant == TypeTag.U32:
+            return TypeTag(U32Tag.deserialize(deserializer))
+        elif variant == TypeTag.U256:
+            return TypeTag(U256Tag.deserialize(deserializer))
         raise NotImplementedError
 
     def serialize(self, serializer: Serializer):
+        data = self._bcs
+        if data is None:
+            data = _memoize(self, TypeTag._serialize)
+        serializer.fixed_bytes(data)
+
+    def _serialize(self, serializer: Serializer):
         serializer.uleb128(self.value.variant())
         serializer.struct(self.value)
 
+    def serialized_size(self) -> int:
+        if self._bcs is not None:
+            return len(self._bcs)
+        return uleb128_size(self.value.variant()) + self.value.serialized_size()
+
+
+def _memoize(value, serialize: typing.Callable[[typing.Any, Serializer], None]):
+    """Encode `value` and keep the bytes in its `_bcs`, as `schema` does."""
+    ser = Serializer()
+    serialize(value, ser)
+    data = ser.output()
+    object.__setattr__(value, "_bcs", data)
+    return data
+
+
+# Move name -> the single instance of each simple tag
+_SIMPLE_TAGS: typing.Dict[str, typing.Any] = {}
+
 
 def simple_tag(tag: int, name: str):
+    """Give a payload-less tag its codec and make it a singleton."""
+
     def decorate(cls):
+        instance = object.__new__(cls)
+
         def deserialize(deserializer: Deserializer):
-            return cls()
+            return instance
 
         def serialize(self, serializer: Serializer):
             return
 
         setattr(cls, "deserialize", deserialize)
         setattr(cls, "serialize", serialize)
+        setattr(cls, "serialized_size", lambda self: 0)
         setattr(cls, "variant", lambda self: tag)
         setattr(cls, "__str__", lambda self: name)
         setattr(cls, "__eq__", lambda self, o: isinstance(o, cls))
+        setattr(cls, "__hash__", lambda self: hash(tag))
+        setattr(cls, "__new__", staticmethod(lambda cls: instance))
+        _SIMPLE_TAGS[name] = instance
 
         return cls
 
@@ -84,40 +178,117 @@ def simple_tag(tag: int, name: str):
 
 @simple_tag(TypeTag.BOOL, "bool")
 class BoolTag:
-    pass
+    __slots__ = ()
 
 
 @simple_tag(TypeTag.U8, "u8")
 class U8Tag:
-    pass
+    __slots__ = ()
 
 
 @simple_tag(TypeTag.U64, "u64")
 class U64Tag:
-    pass
+    __slots__ = ()
 
 
 @simple_tag(TypeTag.U128, "u128")
 class U128Tag:
-    pass
+    __slots__ = ()
 
 
 @simple_tag(TypeTag.ADDRESS, "address")
 class AddressTag:
-    pass
+    __slots__ = ()
+
+
+@simple_tag(TypeTag.SIGNER, "signer")
+class SignerTag:
+    __slots__ = ()
+
+
+@simple_tag(TypeTag.U16, "u16")
+class U16Tag:
+    __slots__ = ()
+
+
+@simple_tag(TypeTag.U32, "u32")
+class U32Tag:
+    __slots__ = ()
+
+
+@simple_tag(TypeTag.U256, "u256")
+class U256Tag:
+    __slots__ = ()
+
+
+class VectorTag:
+    """Immutable and hashable; the element tag's encoding is memoized."""
+
+    __slots__ = ("value",)
+
+    value: TypeTag
+
+    def __init__(self, value: TypeTag):
+        object.__setattr__(self, "value", value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), (self.value,))
+
+    def __eq__(self, other: VectorTag) -> bool:
+        return self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash((TypeTag.VECTOR, self.value))
+
+    def __str__(self) -> str:
+        return f"vector<{self.value}>"
+
+    def variant(self):
+        return TypeTag.VECTOR
+
+    @staticmethod
+    def deserialize(deserializer: Deserializer) -> VectorTag:
+        return VectorTag(TypeTag.deserialize(deserializer))
+
+    def serialize(self, serializer: Serializer):
+        serializer.struct(self.value)
+
+    def serialized_size(self) -> int:
+        return self.value.serialized_size()
 
 
 class StructTag:
+    """Immutable and hashable, so its encoding is memoized; see `schema.define`."""
+
+    __slots__ = ("address", "module", "name", "type_args", "_bcs")
+
     address: AccountAddress
     module: str
     name: str
-    type_args: typing.List[TypeTag]
+    type_args: typing.Tuple[TypeTag, ...]
 
     def __init__(self, address, module, name, type_args):
-        self.address = address
-        self.module = module
-        self.name = name
-        self.type_args = type_args
+        set = object.__setattr__
+        set(self, "address", address)
+        set(self, "module", module)
+        set(self, "name", name)
+        set(self, "type_args", tuple(type_args))
+        set(self, "_bcs", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), (self.address, self.module, self.name, self.type_args))
 
     def __eq__(self, other: StructTag) -> bool:
         return (
@@ -127,6 +298,9 @@ class StructTag:
             and self.type_args == other.type_args
         )
 
+    def __hash__(self) -> int:
+        return hash((self.address, self.module, self.name, self.type_args))
+
     def __str__(self) -> str:
         value = f"{self.address}::{self.module}::{self.name}"
         if len(self.type_args) > 0:
@@ -138,19 +312,11 @@ class StructTag:
 
     @staticmethod
     def from_str(type_tag: str) -> StructTag:
-        name = ""
-        index = 0
-        while index < len(type_tag):
-            letter = type_tag[index]
-            index += 1
-
-            if letter == "<":
-                raise NotImplementedError
-            else:
-                name += letter
-
-        split = name.split("::")
-        return StructTag(AccountAddress.from_hex(split[0]), split[1], split[2], [])
+        """Parse `address::module::name<type, ...>`; see `TypeTag.from_str`."""
+        tag = TypeTag.from_str(type_tag).value
+        if not isinstance(tag, StructTag):
+            raise Exception(f"Expected a struct type, got {type_tag!r}")
+        return tag
 
     def variant(self):
         return TypeTag.STRUCT
@@ -164,7 +330,166 @@ class StructTag:
         return StructTag(address, module, name, type_args)
 
     def serialize(self, serializer: Serializer):
+        data = self._bcs
+        if data is None:
+            data = _memoize(self, StructTag._serialize)
+        serializer.fixed_bytes(data)
+
+    def _serialize(self, serializer: Serializer):
         serializer.struct(self.address)
         serializer.str(self.module)
         serializer.str(self.name)
         serializer.sequence(self.type_args, Serializer.struct)
+
+    def serialized_size(self) -> int:
+        if self._bcs is not None:
+            return len(self._bcs)
+        return (
+            self.address.serialized_size()
+            + str_size(self.module)
+            + str_size(self.name)
+            + sequence_size(self.type_args, TypeTag.serialized_size)
+        )
+
+
+# `::`, `<`, `>`, `,` or a name, address or keyword, after optional spaces.
+_TOKEN = re.compile(r"\s*(::|[<>,]|\w+)")
+
+
+class _Parser:
+    """Recursive descent over the tokens of one Move type string."""
+
+    def __init__(self, type_tag: str):
+        self.source = type_tag
+        self.tokens: typing.List[str] = []
+        self.index = 0
+
+        end = len(type_tag.rstrip())
+        pos = 0
+        while pos < end:
+            match = _TOKEN.match(type_tag, pos)
+            if match is None:
+                raise Exception(f"Invalid type tag {type_tag!r} at offset {pos}")
+            self.tokens.append(match.group(1))
+            pos = match.end()
+
+    def parse(self) -> TypeTag:
+        tag = self.type_tag()
+        if self.index != len(self.tokens):
+            self.fail("end of input")
+        return tag
+
+    def fail(self, expected: str):
+        if self.index < len(self.tokens):
+            found = repr(self.tokens[self.index])
+        else:
+            found = "end of input"
+        raise Exception(
+            f"Invalid type tag {self.source!r}: expected {expected}, found {found}"
+        )
+
+    def peek(self) -> typing.Optional[str]:
+        if self.index < len(self.tokens):
+            return self.tokens[self.index]
+        return None
+
+    def expect(self, token: str):
+        if self.peek() != token:
+            self.fail(repr(token))
+        self.index += 1
+
+    def name(self) -> str:
+        token = self.peek()
+        if token is None or not (token[0].isalpha() or token[0] == "_"):
+            self.fail("an identifier")
+        self.index += 1
+        return token
+
+    def type_tag(self) -> TypeTag:
+        token = self.peek()
+        if token is None or token in ("::", "<", ">", ","):
+            self.fail("a type")
+        self.index += 1
+
+        if token in _SIMPLE_TAGS:
+            return self.intern(TypeTag(_SIMPLE_TAGS[token]))
+        if token == "vector":
+            self.expect("<")
+            value = self.type_tag()
+            self.expect(">")
+            return self.intern(TypeTag(VectorTag(value)))
+
+        # `from_hex` also takes bare hex, which would read `add` as an address.
+        address = None
+        if token.startswith("0x"):
+            try:
+                address = AccountAddress.from_hex(token)
+            except Exception:
+                pass
+        if address is None:
+            self.index -= 1
+            self.fail("a type")
+        self.expect("::")
+        module = self.name()
+        self.expect("::")
+        name = self.name()
+        type_args = []
+        if self.peek() == "<":
+            self.index += 1
+            type_args.append(self.type_tag())
+            while self.peek() == ",":
+                self.index += 1
+                type_args.append(self.type_tag())
+            self.expect(">")
+        return self.intern(TypeTag(StructTag(address, module, name, type_args)))
+
+    @staticmethod
+    def intern(tag: TypeTag) -> TypeTag:
+        pool = TypeTag._intern_pool
+        if pool is None:
+            return tag
+        return pool.get_or_create(tag, lambda: tag)
+
+
+schema.define(
+    TypeTag,
+    schema.Enum(
+        BoolTag,
+        U8Tag,
+        U64Tag,
+        U128Tag,
+        AddressTag,
+        SignerTag,
+        VectorTag,
+        StructTag,
+        U16Tag,
+        U32Tag,
+        U256Tag,
+        variant_of=lambda tag: tag.value.variant(),
+        error=NotImplementedError,
+    ),
+    memoize=True,
+)
+for tag in (
+    BoolTag,
+    U8Tag,
+    U64Tag,
+    U128Tag,
+    AddressTag,
+    SignerTag,
+    U16Tag,
+    U32Tag,
+    U256Tag,
+):
+    schema.define(tag, schema.Struct())
+schema.define(VectorTag, schema.Struct(value=TypeTag))
+schema.define(
+    StructTag,
+    schema.Struct(
+        address=AccountAddress,
+        module=schema.STR,
+        name=schema.STR,
+        type_args=schema.Vector(TypeTag),
+    ),
+    memoize=True,
+)
@@ -0,0 +1,66 @@
+import pickle
+
+import pytest
+
+from sui_tx_sdk.account_address import AccountAddress
+from sui_tx_sdk.bcs import Deserializer
+from sui_tx_sdk.cache import LRUCache
+from sui_tx_sdk.sui_address import SuiAddress
+
+address = "0xf7c6cd8a54d4b0b2aa75e0c3a5407027d11fd6b8"
+
+
+@pytest.mark.parametrize("typ", [SuiAddress, AccountAddress])
+def test_hashable(typ):
+    a = typ.from_hex(address)
+    b = typ.from_hex(address)
+    assert a == b and a is not b
+    assert hash(a) == hash(b)
+    assert {a: 1}[b] == 1
+    assert len({a, b, typ.from_hex("0x2")}) == 2
+
+
+@pytest.mark.parametrize("typ", [SuiAddress, AccountAddress])
+def test_ordering(typ):
+    values = [typ.from_hex(x) for x in ["0x3", address, "0x1"]]
+    assert [str(x) for x in sorted(values)] == [
+        "0x" + "0" * 39 + "1",
+        "0x" + "0" * 39 + "3",
+        address,
+    ]
+    with pytest.raises(TypeError):
+        values[0] < address
+
+
+@pytest.mark.parametrize("typ", [SuiAddress, AccountAddress])
+def test_immutable(typ):
+    a = typ.from_hex(address)
+    with pytest.raises(AttributeError):
+        a.address = bytes(20)
+    with pytest.raises(AttributeError):
+        a.other = 1
+    assert not hasattr(a, "__dict__")
+    assert pickle.loads(pickle.dumps(a)) == a
+
+
+@pytest.mark.parametrize("typ", [SuiAddress, AccountAddress])
+def test_intern_pool(typ):
+    pool = LRUCache()
+    typ.set_intern_pool(pool)
+    try:
+        data = bytes.fromhex(address[2:]) * 2
+        deser = Deserializer(data)
+        a = deser.struct(typ)
+        b = deser.struct(typ)
+        assert a is b
+        assert (pool.hits, pool.misses, len(pool)) == (1, 1, 1)
+    finally:
+        typ.set_intern_pool(None)
+
+
+def test_zero_copy():
+    data = bytes.fromhex(address[2:])
+    a = Deserializer(data, zero_copy=True).struct(SuiAddress)
+    assert isinstance(a.address, memoryview)
+    assert hash(a) == hash(SuiAddress(data))
+    assert a == SuiAddress(data)
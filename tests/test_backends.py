@@ -0,0 +1,191 @@
+import itertools
+
+import pytest
+
+from sui_tx_sdk import backends
+from sui_tx_sdk.ed25519 import Ed25519KeyPair, Ed25519PublicKey
+from sui_tx_sdk.secp256k1 import Secp256k1KeyPair, Secp256k1PublicKey
+
+ed25519_backends = backends.available(backends.ED25519)
+secp256k1_backends = backends.available(backends.SECP256K1)
+
+ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+SECRETS = [bytes([i]) * 32 for i in range(1, 5)]
+MSGS = [b"", b"message", bytes(range(256)) * 4]
+
+
+def high_s(sig: bytes) -> bytes:
+    s = (ORDER - int.from_bytes(sig[32:64], "big")).to_bytes(32, "big")
+    return sig[:32] + s + bytes([sig[64] ^ 1])
+
+
+@pytest.mark.parametrize("a,b", list(itertools.product(ed25519_backends, repeat=2)))
+def test_ed25519_conformance(a, b):
+    a, b = backends.load(backends.ED25519, a), backends.load(backends.ED25519, b)
+    for secret in SECRETS:
+        sk_a, sk_b = a.signing_key(secret), b.signing_key(secret)
+        assert a.private_bytes(sk_a) == b.private_bytes(sk_b) == secret
+        data = a.public_bytes(a.public_key(sk_a))
+        assert b.public_bytes(b.public_key(sk_b)) == data
+        pk = b.verifying_key(data)
+        assert b.public_bytes(pk) == data
+        for msg in MSGS:
+            sig = a.sign(sk_a, msg)
+            assert sig == b.sign(sk_b, msg)
+            assert b.verify(pk, msg, sig)
+            assert not b.verify(pk, msg + b"!", sig)
+            assert not b.verify(pk, msg, bytes(64))
+
+    pks = [
+        b.verifying_key(a.public_bytes(a.public_key(a.signing_key(x)))) for x in SECRETS
+    ]
+    msgs = [bytes([i]) * 10 for i in range(len(SECRETS))]
+    sigs = [a.sign(a.signing_key(x), m) for (x, m) in zip(SECRETS, msgs)]
+    assert b.verify_batch(msgs, pks, sigs) == []
+    sigs[1], msgs[3] = sigs[0], b"tampered"
+    assert b.verify_batch(msgs, pks, sigs) == [1, 3]
+
+
+@pytest.mark.parametrize("a,b", list(itertools.product(secp256k1_backends, repeat=2)))
+def test_secp256k1_conformance(a, b):
+    a, b = backends.load(backends.SECP256K1, a), backends.load(backends.SECP256K1, b)
+    for secret in SECRETS:
+        sk_a, sk_b = a.signing_key(secret), b.signing_key(secret)
+        assert a.private_bytes(sk_a) == b.private_bytes(sk_b) == secret
+        data = a.public_bytes(a.public_key(sk_a))
+        assert len(data) == Secp256k1PublicKey.LENGTH
+        assert b.public_bytes(b.public_key(sk_b)) == data
+        pk = b.verifying_key(data)
+        assert b.public_bytes(pk) == data
+        for msg in MSGS:
+            sig = a.sign_recoverable(sk_a, msg)
+            assert sig == b.sign_recoverable(sk_b, msg)
+            assert b.verify(pk, msg, sig[:64])
+            assert b.verify(pk, msg, high_s(sig)[:64])
+            assert not b.verify(pk, msg + b"!", sig[:64])
+            assert not b.verify(pk, msg, bytes(64))
+            assert b.recover(msg, sig) == data
+            assert b.recover(msg, high_s(sig)) == data
+
+
+@pytest.mark.parametrize("name", ed25519_backends)
+def test_ed25519_key_types(name):
+    kp = Ed25519KeyPair.from_private_key(SECRETS[0], name)
+    assert kp.backend.name == name
+    sig = kp.sign(MSGS[1])
+    for other in ed25519_backends:
+        backends.use(backends.ED25519, other)
+        try:
+            pk = Ed25519PublicKey.from_bytes(kp.public_key().bytes())
+            assert pk.backend.name == other
+            assert pk.verify(MSGS[1], sig)
+        finally:
+            backends.use(backends.ED25519, None)
+
+
+@pytest.mark.parametrize("name", secp256k1_backends)
+def test_secp256k1_key_types(name):
+    kp = Secp256k1KeyPair.from_private_key(SECRETS[0], name)
+    assert kp.backend.name == name
+    sig = kp.sign(MSGS[1])
+    for other in secp256k1_backends:
+        backends.use(backends.SECP256K1, other)
+        try:
+            pk = Secp256k1PublicKey.from_bytes(kp.public_key().bytes())
+            assert pk.backend.name == other
+            assert pk.verify(MSGS[1], sig) and pk.verify_recoverable(MSGS[1], sig)
+        finally:
+            backends.use(backends.SECP256K1, None)
+
+
+def test_verify_batch_mixed_backends():
+    if len(ed25519_backends) < 2:
+        pytest.skip("needs two Ed25519 backends")
+    kps = [
+        Ed25519KeyPair.from_private_key(x, ed25519_backends[i % 2])
+        for (i, x) in enumerate(SECRETS)
+    ]
+    pks = [kp.public_key() for kp in kps]
+    sigs = [kp.sign(MSGS[1]) for kp in kps]
+    msgs = [MSGS[1]] * len(kps)
+    assert Ed25519PublicKey.verify_batch(msgs, pks, sigs) == []
+    msgs[0] = msgs[3] = b"tampered"
+    assert Ed25519PublicKey.verify_batch(msgs, pks, sigs) == [0, 3]
+
+
+@pytest.mark.parametrize("algorithm", [backends.ED25519, backends.SECP256K1])
+def test_benchmark(algorithm):
+    names = backends.available(algorithm)
+    timings = backends.benchmark(algorithm, rounds=4)
+    assert sorted(timings) == sorted(names)
+    assert all(x > 0 for x in timings.values())
+
+
+@pytest.mark.parametrize("algorithm", [backends.ED25519, backends.SECP256K1])
+def test_select(algorithm, monkeypatch):
+    env = f"SUI_TX_SDK_{algorithm.upper()}_BACKEND"
+    try:
+        for name in backends.available(algorithm):
+            backends.use(algorithm, None)
+            monkeypatch.setenv(env, name)
+            assert backends.get(algorithm).name == name
+
+        monkeypatch.setenv(env, backends.AUTO)
+        backends.use(algorithm, None)
+        assert backends.get(algorithm).name in backends.available(algorithm)
+
+        monkeypatch.setenv(env, "missing")
+        backends.use(algorithm, None)
+        with pytest.raises(Exception, match="Unknown"):
+            backends.get(algorithm)
+        with pytest.raises(Exception, match="Unknown"):
+            backends.use(algorithm, "missing")
+    finally:
+        backends.use(algorithm, None)
+        monkeypatch.delenv(env)
+
+
+@pytest.mark.parametrize(
+    "algorithm, key_pair, public_key",
+    [
+        (backends.ED25519, Ed25519KeyPair, Ed25519PublicKey),
+        (backends.SECP256K1, Secp256k1KeyPair, Secp256k1PublicKey),
+    ],
+)
+def test_owner(algorithm, key_pair, public_key):
+    names = backends.available(algorithm)
+    for name in names:
+        backend = backends.load(algorithm, name)
+        sk = backend.signing_key(SECRETS[0])
+        for other in names:
+            # Keys of one library keep working whichever backend is in use.
+            backends.use(algorithm, other)
+            try:
+                kp = key_pair(sk)
+                assert kp.backend is backend
+                assert public_key(backend.public_key(sk)).backend is backend
+                assert kp.public_key().verify(MSGS[1], kp.sign(MSGS[1]))
+            finally:
+                backends.use(algorithm, None)
+
+
+@pytest.mark.parametrize("algorithm", [backends.ED25519, backends.SECP256K1])
+def test_select_keeps_first_within_margin(algorithm, monkeypatch):
+    names = backends.available(algorithm)
+    if len(names) < 2:
+        pytest.skip("needs two backends")
+    first, other = names[0], names[1]
+    monkeypatch.delenv(f"SUI_TX_SDK_{algorithm.upper()}_BACKEND", raising=False)
+
+    def timings(seconds):
+        return lambda *args, **kwargs: {first: 1.0, other: seconds}
+
+    try:
+        monkeypatch.setattr(backends, "benchmark", timings(0.9))
+        backends.use(algorithm, None)
+        assert backends.get(algorithm).name == first
+        monkeypatch.setattr(backends, "benchmark", timings(0.5))
+        backends.use(algorithm, None)
+        assert backends.get(algorithm).name == other
+    finally:
+        backends.use(algorithm, None)
@@ -0,0 +1,367 @@
+import hashlib
+import struct
+import unittest
+
+from sui_tx_sdk.bcs import (
+    MAX_U32,
+    MAX_U64,
+    Deserializer,
+    HashingSerializer,
+    Serializer,
+    bytes_size,
+    sequence_size,
+    str_size,
+    uleb128_size,
+)
+
+
+class Test(unittest.TestCase):
+    def test_bool_true(self):
+        in_value = True
+
+        ser = Serializer()
+        ser.bool(in_value)
+        der = Deserializer(ser.output())
+        out_value = der.bool()
+
+        self.assertEqual(in_value, out_value)
+
+    def test_bool_false(self):
+        in_value = False
+
+        ser = Serializer()
+        ser.bool(in_value)
+        der = Deserializer(ser.output())
+        out_value = der.bool()
+
+        self.assertEqual(in_value, out_value)
+
+    def test_bool_error(self):
+        ser = Serializer()
+        ser.u8(32)
+        der = Deserializer(ser.output())
+        with self.assertRaises(Exception):
+            der.bool()
+
+    def test_bytes(self):
+        in_value = b"1234567890"
+
+        ser = Serializer()
+        ser.bytes(in_value)
+        der = Deserializer(ser.output())
+        out_value = der.bytes()
+
+        self.assertEqual(in_value, out_value)
+
+    def test_map(self):
+        in_value = {"a": 12345, "b": 99234, "c": 23829}
+
+        ser = Serializer()
+        ser.map(in_value, Serializer.str, Serializer.u32)
+        der = Deserializer(ser.output())
+        out_value = der.map(Deserializer.str, Deserializer.u32)
+
+        self.assertEqual(in_value, out_value)
+
+    def test_map_sorted_by_encoded_key(self):
+        in_value = {"bb": 2, "c": 3, "a": 1}
+
+        ser = Serializer()
+        ser.map(in_value, Serializer.str, Serializer.u8)
+
+        # Keys sort by their BCS encoding, so the length prefix comes first.
+        self.assertEqual(ser.output(), bytes.fromhex("03016101016303026262" "02"))
+
+    def test_nested_sequence(self):
+        in_value = [[1, 2], [], [3]]
+
+        ser = Serializer()
+        ser.sequence(in_value, Serializer.sequence_serializer(Serializer.u16))
+        der = Deserializer(ser.output())
+        out_value = der.sequence(lambda d: d.sequence(Deserializer.u16))
+
+        self.assertEqual(in_value, out_value)
+
+    def test_sequence(self):
+        in_value = ["a", "abc", "def", "ghi"]
+
+        ser = Serializer()
+        ser.sequence(in_value, Serializer.str)
+        der = Deserializer(ser.output())
+        out_value = der.sequence(Deserializer.str)
+
+        self.assertEqual(in_value, out_value)
+
+    def test_sequence_serializer(self):
+        in_value = ["a", "abc", "def", "ghi"]
+
+        ser = Serializer()
+        seq_ser = Serializer.sequence_serializer(Serializer.str)
+        seq_ser(ser, in_value)
+        der = Deserializer(ser.output())
+        out_value = der.sequence(Deserializer.str)
+
+        self.assertEqual(in_value, out_value)
+
+    def test_u64_sequence(self):
+        in_value = [0, 1, 1111111111111111115, MAX_U64]
+
+        ser = Serializer()
+        ser.u64_sequence(in_value)
+        generic = Serializer()
+        generic.sequence(in_value, Serializer.u64)
+        self.assertEqual(ser.output(), generic.output())
+
+        der = Deserializer(ser.output())
+        out_value = der.u64_sequence()
+
+        self.assertEqual(in_value, out_value)
+
+    def test_u64_sequence_range(self):
+        ser = Serializer()
+        with self.assertRaisesRegex(Exception, f"Cannot encode {MAX_U64 + 1} into u64"):
+            ser.u64_sequence([1, MAX_U64 + 1])
+        with self.assertRaisesRegex(Exception, "Cannot encode -1 into u64"):
+            ser.u64_sequence([1, -1])
+        self.assertEqual(ser.output(), b"")
+
+    def test_fixed_bytes_sequence(self):
+        in_value = [b"abc", b"def", b"ghi"]
+
+        ser = Serializer()
+        ser.fixed_bytes_sequence(in_value, 3)
+        self.assertEqual(ser.output(), b"\x03abcdefghi")
+
+        der = Deserializer(ser.output())
+        self.assertEqual(der.fixed_bytes_sequence(3), in_value)
+
+        der = Deserializer(ser.output(), zero_copy=True)
+        out_value = der.fixed_bytes_sequence(3)
+        self.assertIsInstance(out_value[0], memoryview)
+        self.assertEqual(out_value, in_value)
+
+        with self.assertRaises(Exception):
+            ser.fixed_bytes_sequence([b"ab", b"cdef"], 3)
+
+    def test_packed_sequence(self):
+        layout = struct.Struct("<HB")
+        in_value = [(1, 2), (300, 4)]
+
+        ser = Serializer()
+        ser.sequence(in_value, lambda s, x: (s.u16(x[0]), s.u8(x[1])))
+        der = Deserializer(ser.output())
+        out_value = list(der.packed_sequence(layout))
+
+        self.assertEqual(in_value, out_value)
+        self.assertEqual(der.remaining(), 0)
+
+    def test_serialized_sizes(self):
+        for value in [0, 1, 0x7F, 0x80, 0x3FFF, 0x4000, MAX_U32]:
+            ser = Serializer()
+            ser.uleb128(value)
+            self.assertEqual(uleb128_size(value), len(ser.output()))
+
+        for value in ["", "abc", "\u00e9\u4e2d", "x" * 200]:
+            ser = Serializer()
+            ser.str(value)
+            self.assertEqual(str_size(value), len(ser.output()))
+
+        in_value = [b"", b"a", b"bc" * 100]
+        ser = Serializer()
+        ser.sequence(in_value, Serializer.bytes)
+        self.assertEqual(sequence_size(in_value, bytes_size), len(ser.output()))
+
+    def test_reset(self):
+        ser = Serializer()
+        ser.u32(1)
+        ser.reset()
+        ser.u8(2)
+        self.assertEqual(ser.output(), b"\x02")
+        self.assertEqual(ser.size(), 1)
+
+    def test_caller_output(self):
+        buf = bytearray(b"\xff")
+        ser = Serializer(buf)
+        ser.u16(1)
+        self.assertEqual(buf, b"\xff\x01\x00")
+
+    def test_output_into(self):
+        ser = Serializer()
+        ser.u16(0x0201)
+        buf = bytearray(4)
+        self.assertEqual(ser.output_into(buf, 1), 3)
+        self.assertEqual(buf, b"\x00\x01\x02\x00")
+        self.assertEqual(ser.output_into(buf, 3), 5)
+        self.assertEqual(buf, b"\x00\x01\x02\x01\x02")
+        view = memoryview(bytearray(3))
+        self.assertEqual(ser.output_into(view, 1), 3)
+        self.assertEqual(view.tobytes(), b"\x00\x01\x02")
+        with self.assertRaises(Exception):
+            ser.output_into(view, 2)
+
+    def test_hashing_serializer(self):
+        values = {"b": 2, "a": 1}
+        ser = Serializer()
+        ser.map(values, Serializer.str, Serializer.u8)
+        ser.sequence([b"x" * 100] * 3, Serializer.bytes)
+        expected = ser.output()
+
+        for block_size in [1, 7, 64 * 1024]:
+            hasher = HashingSerializer(hashlib.sha3_256, block_size=block_size)
+            hasher.map(values, Serializer.str, Serializer.u8)
+            hasher.sequence([b"x" * 100] * 3, Serializer.bytes)
+            self.assertEqual(hasher.digest(), hashlib.sha3_256(expected).digest())
+            self.assertEqual(hasher.size(), len(expected))
+            with self.assertRaises(Exception):
+                hasher.output()
+
+        hasher = HashingSerializer(hashlib.blake2b, keep_output=True, block_size=7)
+        hasher.map(values, Serializer.str, Serializer.u8)
+        hasher.sequence([b"x" * 100] * 3, Serializer.bytes)
+        self.assertEqual(hasher.output(), expected)
+        self.assertEqual(hasher.digest(), hashlib.blake2b(expected).digest())
+
+        hasher.reset()
+        self.assertEqual(hasher.digest(), hashlib.blake2b().digest())
+
+    def test_str(self):
+        in_value = "1234567890"
+
+        ser = Serializer()
+        ser.str(in_value)
+        der = Deserializer(ser.output())
+        out_value = der.str()
+
+        self.assertEqual(in_value, out_value)
+
+    def test_u8(self):
+        in_value = 15
+
+        ser = Serializer()
+        ser.u8(in_value)
+        der = Deserializer(ser.output())
+        out_value = der.u8()
+
+        self.assertEqual(in_value, out_value)
+
+    def test_u16(self):
+        in_value = 11115
+
+        ser = Serializer()
+        ser.u16(in_value)
+        der = Deserializer(ser.output())
+        out_value = der.u16()
+
+        self.assertEqual(in_value, out_value)
+
+    def test_u32(self):
+        in_value = 1111111115
+
+        ser = Serializer()
+        ser.u32(in_value)
+        der = Deserializer(ser.output())
+        out_value = der.u32()
+
+        self.assertEqual(in_value, out_value)
+
+    def test_u64(self):
+        in_value = 1111111111111111115
+
+        ser = Serializer()
+        ser.u64(in_value)
+        der = Deserializer(ser.output())
+        out_value = der.u64()
+
+        self.assertEqual(in_value, out_value)
+
+    def test_u128(self):
+        in_value = 1111111111111111111111111111111111115
+
+        ser = Serializer()
+        ser.u128(in_value)
+        der = Deserializer(ser.output())
+        out_value = der.u128()
+
+        self.assertEqual(in_value, out_value)
+
+    def test_zero_copy_bytes(self):
+        in_value = b"1234567890"
+
+        ser = Serializer()
+        ser.bytes(in_value)
+        ser.fixed_bytes(in_value)
+        der = Deserializer(ser.output(), zero_copy=True)
+        out_value = der.bytes()
+        fixed_value = der.fixed_bytes(len(in_value))
+
+        self.assertIsInstance(out_value, memoryview)
+        self.assertIsInstance(fixed_value, memoryview)
+        self.assertEqual(in_value, out_value)
+        self.assertEqual(in_value, fixed_value)
+        self.assertEqual(der.remaining(), 0)
+
+    def test_memoryview_input(self):
+        ser = Serializer()
+        ser.u8(7)
+        ser.u64(1111111111111111115)
+        data = bytearray(ser.output())
+        der = Deserializer(memoryview(data))
+
+        self.assertEqual(der.u8(), 7)
+        self.assertEqual(der.remaining(), 8)
+        self.assertEqual(der.u64(), 1111111111111111115)
+        self.assertEqual(der.remaining(), 0)
+
+    def test_unexpected_end(self):
+        der = Deserializer(b"\x01\x02\x03")
+        der.u8()
+        with self.assertRaisesRegex(
+            Exception, "Unexpected end of input. Requested: 4, found: 2"
+        ):
+            der.u32()
+        self.assertEqual(der.remaining(), 2)
+
+    def test_uleb128(self):
+        in_value = 1111111115
+
+        ser = Serializer()
+        ser.uleb128(in_value)
+        der = Deserializer(ser.output())
+        out_value = der.uleb128()
+
+        self.assertEqual(in_value, out_value)
+
+    def test_uleb128_boundaries(self):
+        for (value, encoded) in [
+            (0, "00"),
+            (0x7F, "7f"),
+            (0x80, "8001"),
+            (0x3FFF, "ff7f"),
+            (0x4000, "808001"),
+            (0x1FFFFF, "ffff7f"),
+            (0x200000, "80808001"),
+            (MAX_U32, "ffffffff0f"),
+        ]:
+            ser = Serializer()
+            ser.uleb128(value)
+            self.assertEqual(ser.output().hex(), encoded)
+            self.assertEqual(uleb128_size(value), len(ser.output()))
+            der = Deserializer(bytes.fromhex(encoded))
+            self.assertEqual(der.uleb128(), value)
+            self.assertEqual(der.remaining(), 0)
+
+    def test_uleb128_errors(self):
+        for value in [-1, MAX_U32 + 1]:
+            with self.assertRaises(Exception):
+                Serializer().uleb128(value)
+
+        for (encoded, error) in [
+            ("ffffffff1f", "does not fit into a u32"),
+            ("ffffffffff01", "Unexpectedly large"),
+            ("8000", "Non-canonical"),
+            ("8080", "Unexpected end of input. Requested: 3, found: 2"),
+        ]:
+            der = Deserializer(bytes.fromhex(encoded))
+            with self.assertRaisesRegex(Exception, error):
+                der.uleb128()
+            self.assertEqual(der.offset(), 0)
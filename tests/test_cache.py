@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+from sui_tx_sdk.cache import LRUCache
+
+
+def test_lru_eviction():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert (cache.hits, cache.misses, len(cache)) == (3, 1, 2)
+
+
+def test_get_or_create():
+    cache = LRUCache(4)
+    calls = []
+    create = lambda: calls.append(1) or len(calls)
+    assert cache.get_or_create("k", create) == 1
+    assert cache.get_or_create("k", create) == 1
+    assert calls == [1]
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_invalid_size():
+    with pytest.raises(Exception):
+        LRUCache(0)
+
+
+class YieldingKey:
+    """Key whose hashing lets other threads run, as Python `__hash__`es can."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        time.sleep(0)
+        return hash(self.value)
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def test_threaded_stress():
+    # Another thread's eviction between a lookup and its reordering used to
+    # raise KeyError.
+    cache = LRUCache(2)
+    keys = [YieldingKey(i) for i in range(3)]
+    errors = []
+
+    def run(seed):
+        try:
+            for i in range(1000):
+                key = keys[(seed + i) % 3]
+                cache.put(key, key.value)
+                other = keys[(seed + i + 1) % 3]
+                assert cache.get(other) in (None, other.value)
+                assert cache.get_or_create(other, lambda: other.value) == other.value
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert len(cache) == 2
@@ -1,6 +1,11 @@
 import base64
+import concurrent.futures
 from yaml import load, Loader
 import random
+
+import pytest
+
+from sui_tx_sdk.cache import LRUCache
 from sui_tx_sdk.crypto import (
     SuiKeyPair,
     Signature,
@@ -16,6 +21,12 @@ from sui_tx_sdk.transaction import (
     Intent,
 )
 from sui_tx_sdk.sui_address import SuiAddress
+from sui_tx_sdk.ed25519 import Ed25519KeyPair, Ed25519PublicKey
+from sui_tx_sdk.secp256k1 import (
+    Secp256k1KeyPair,
+    Secp256k1PublicKey,
+    Secp256k1Signature,
+)
 from sui_tx_sdk.object import ObjectRef, ObjectID, ObjectDigest
 
 from sui_tx_sdk.bcs import Deserializer, Serializer
@@ -42,6 +53,24 @@ class TestSuiKeyPair:
             sig = kp.sign(data)
             assert kp.public_key().verify(data, sig.value.signature)
 
+    def test_sign_many(self):
+        msgs = [random.randbytes(64) for _ in range(5)]
+        for key_pair in key_pairs:
+            kp = SuiKeyPair.from_base64(key_pair["value"])
+            pk = kp.public_key()
+            sigs = kp.sign_many(msgs)
+            assert [sig.bytes() for sig in sigs] == [kp.sign(m).bytes() for m in msgs]
+            assert all(
+                pk.verify(m, sig.value.signature) for (m, sig) in zip(msgs, sigs)
+            )
+
+            with concurrent.futures.ThreadPoolExecutor(2) as pool:
+                pooled = kp.sign_many(iter(msgs), executor=pool, chunksize=2)
+            assert [sig.bytes() for sig in pooled] == [sig.bytes() for sig in sigs]
+            pooled = kp.sign_many(msgs, workers=2, chunksize=2)
+            assert [sig.bytes() for sig in pooled] == [sig.bytes() for sig in sigs]
+            assert kp.sign_many([]) == []
+
 
 class TestSignature:
     def test_base64(self):
@@ -105,6 +134,28 @@ class TestSignature:
         signatue = Signature.from_bytes(b64)
         assert signatue.verify(intent_tx, tx.sender)
 
+    def test_address_derivation_cache(self):
+        cache = LRUCache(16)
+        SuiAddress.set_derivation_cache(cache)
+        try:
+            for key_pair in key_pairs:
+                kp = SuiKeyPair.from_base64(key_pair["value"])
+                expected = SuiAddress._derive(
+                    kp.public_key().scheme(), kp.public_key().bytes()
+                )
+                assert kp.address() == expected
+                assert SuiAddress.from_public_key(kp.public_key()) is kp.address()
+
+                sig = kp.sign(b"message")
+                _, pk = sig.get_verification_inputs(expected)
+                assert pk.bytes() == kp.public_key().bytes()
+                with pytest.raises(Exception, match="get_verification_inputs Failed"):
+                    sig.get_verification_inputs(SuiAddress(bytes(20)))
+            assert cache.misses == len(key_pairs)
+            assert cache.hits == 4 * len(key_pairs)
+        finally:
+            SuiAddress.set_derivation_cache(LRUCache(4096))
+
 
 class TestEd25519SuiSignature:
     value = "AAr6fTwqiTgQ/JwOAl3rSjgTRgcHrshcHr8UoydBXj3MmK6Vks3gLtDBY2whwMQmog2JvYv25Bl7anLephmdvAoTbNko0neirryuISInMDku3bxjM+3m8Z9KyQAsNqZiVA=="
@@ -138,3 +189,89 @@ class TestSecp256k1SuiSignature:
         ser = Serializer()
         ser.struct(sig)
         assert ser.output() == value
+
+    def test_cached_parts(self):
+        sig = Secp256k1SuiSignature.from_bytes(base64.b64decode(self.value))
+        assert sig.public_key is sig.public_key
+        assert sig.signature is sig.signature
+
+
+@pytest.mark.parametrize("typ", [Ed25519PublicKey, Secp256k1PublicKey])
+def test_public_key_parse_cache(typ):
+    kp = next(
+        SuiKeyPair.from_base64(x["value"])
+        for x in key_pairs
+        if base64.b64decode(x["value"])[0] == typ.SCHEME
+    )
+    data = kp.public_key().bytes()
+    cache = LRUCache(2)
+    typ.set_parse_cache(cache)
+    try:
+        pk = typ.from_bytes(data)
+        assert typ.from_bytes(bytearray(data)) is pk
+        assert (cache.hits, cache.misses) == (1, 1)
+        typ.set_parse_cache(None)
+        assert typ.from_bytes(data) is not pk
+        assert typ.from_bytes(data).bytes() == pk.bytes()
+    finally:
+        typ.set_parse_cache(LRUCache(4096))
+
+
+def test_ed25519_verify_batch():
+    kps = [Ed25519KeyPair.from_private_key(bytes([i]) * 32) for i in range(1, 9)]
+    msgs = [bytes([i]) * (i + 10) for i in range(len(kps))]
+    sigs = [kp.sign(msg) for (kp, msg) in zip(kps, msgs)]
+    pks = [kp.public_key() for kp in kps]
+    assert Ed25519PublicKey.verify_batch(msgs, pks, sigs) == []
+    assert Ed25519PublicKey.verify_batch_emtpy_fail_different_msgs(msgs, pks, sigs)
+
+    msgs[2] = b"tampered"
+    sigs[5] = sigs[4]
+    assert Ed25519PublicKey.verify_batch(msgs, pks, sigs) == [2, 5]
+    assert not Ed25519PublicKey.verify_batch_emtpy_fail_different_msgs(msgs, pks, sigs)
+    with pytest.raises(Exception, match="Mismatch"):
+        Ed25519PublicKey.verify_batch(msgs[1:], pks, sigs)
+
+
+def test_ed25519_verify_batch_stops_early(monkeypatch):
+    kps = [Ed25519KeyPair.from_private_key(bytes([i]) * 32) for i in range(1, 5)]
+    msg = b"message"
+    sigs = [kp.sign(msg) for kp in kps]
+    pks = [kp.public_key() for kp in kps]
+    sigs[0] = sigs[1]
+
+    calls = []
+    verify = Ed25519PublicKey.verify
+
+    def counting(self, msg, sig):
+        calls.append(self)
+        return verify(self, msg, sig)
+
+    monkeypatch.setattr(Ed25519PublicKey, "verify", counting)
+    assert not Ed25519PublicKey.verify_batch_emtpy_fail(msg, pks, sigs)
+    assert len(calls) == 1
+    assert not Ed25519PublicKey.verify_batch_emtpy_fail_different_msgs(
+        [msg] * len(pks), pks, sigs
+    )
+    assert len(calls) == 2
+
+
+def test_secp256k1_verify():
+    kp = Secp256k1KeyPair.from_private_key(bytes(range(1, 33)))
+    other = Secp256k1KeyPair.from_private_key(bytes(range(2, 34)))
+    msg = b"message"
+    sig = kp.sign(msg)
+    pk = kp.public_key()
+    assert pk.verify(msg, sig) and pk.verify_recoverable(msg, sig)
+    assert not pk.verify(b"other", sig)
+    assert not other.public_key().verify(msg, sig)
+    assert not other.public_key().verify_recoverable(msg, sig)
+
+    # The same signature with S negated, which recovery also accepts.
+    data = sig.bytes()
+    order = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+    high = (order - int.from_bytes(data[32:64], "big")).to_bytes(32, "big")
+    high_s = Secp256k1Signature(data[:32] + high + bytes([data[64] ^ 1]))
+    assert pk.verify(msg, high_s) and pk.verify_recoverable(msg, high_s)
+
+    assert not pk.verify(msg, Secp256k1Signature(bytes(65)))
@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that only signing, verification or test code needs.
+HEAVY = [
+    "nacl",
+    "secp256k1",
+    "coincurve",
+    "cryptography",
+    "deprecated",
+    "wrapt",
+    "unittest",
+    "concurrent.futures",
+    "logging",
+    "asyncio",
+]
+
+
+def import_times(module):
+    """Cumulative import time, in microseconds, of every module `module` imports."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "module,budget_ms",
+    [("sui_tx_sdk.bcs", 50), ("sui_tx_sdk.transaction", 100)],
+)
+def test_import_budget(module, budget_ms):
+    times = import_times(module)
+    assert not [x for x in HEAVY if x in times]
+    # The best of a few runs, so a busy machine does not fail the budget.
+    best = min([times[module]] + [import_times(module)[module] for _ in range(2)])
+    assert best < budget_ms * 1000
+
+
+def test_backends_imported_on_use():
+    code = (
+        "import sys\n"
+        "from sui_tx_sdk.crypto import SuiKeyPair\n"
+        "assert 'nacl' not in sys.modules\n"
+        "from sui_tx_sdk.ed25519 import Ed25519KeyPair\n"
+        "Ed25519KeyPair.from_private_key(bytes(32), 'pynacl')\n"
+        "assert 'nacl' in sys.modules and 'secp256k1' not in sys.modules\n"
+    )
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
@@ -0,0 +1,74 @@
+import base64
+import json
+import os
+
+import pytest
+from yaml import load, Loader
+
+from sui_tx_sdk.crypto import SuiKeyPair
+from sui_tx_sdk.ed25519 import Ed25519KeyPair
+from sui_tx_sdk.keystore import INDEX_SUFFIX, Keystore, address_of
+from sui_tx_sdk.sui_address import SuiAddress
+
+with open("sui-tx-test-case.yaml") as f:
+    objs = load(f, Loader)
+    keys = [x["KeyPair"]["value"] for x in objs if "KeyPair" in x]
+
+
+def write_keystore(path, keys):
+    with open(path, "w") as f:
+        json.dump(keys, f)
+    return str(path)
+
+
+def test_address_of():
+    for key in keys:
+        assert address_of(key) == SuiKeyPair.from_base64(key).address()
+
+
+@pytest.mark.parametrize("index", [True, False])
+def test_load(tmp_path, index):
+    path = write_keystore(tmp_path / "sui.keystore", keys)
+    keystore = Keystore.load(path, index=index)
+    assert len(keystore) == len(keys)
+    assert os.path.exists(path + INDEX_SUFFIX) == index
+    for key in keys:
+        kp = SuiKeyPair.from_base64(key)
+        assert kp.address() in keystore
+        signer = keystore.signer_for(kp.address())
+        assert signer.base64() == kp.base64()
+        assert keystore.signer_for(kp.address()) is signer
+    with pytest.raises(KeyError):
+        keystore.signer_for(SuiAddress(bytes(SuiAddress.LENGTH)))
+
+
+def test_index(tmp_path):
+    path = write_keystore(tmp_path / "sui.keystore", keys)
+    expected = Keystore.load(path).addresses()
+    with open(path + INDEX_SUFFIX, "rb") as f:
+        index = f.read()
+    assert index[32:] == b"".join(x.address for x in expected)
+    assert Keystore.load(path).addresses() == expected
+
+    # A stale index is rebuilt rather than trusted.
+    write_keystore(path, keys[::-1])
+    assert Keystore.load(path).addresses() == expected[::-1]
+    with open(path + INDEX_SUFFIX, "wb") as f:
+        f.write(index[:-1])
+    assert Keystore.load(path).addresses() == expected[::-1]
+
+
+def test_unknown_scheme():
+    with pytest.raises(TypeError):
+        Keystore(["CQ" + keys[0][2:]])
+
+
+def test_mismatched_entry():
+    a = SuiKeyPair(Ed25519KeyPair.from_private_key(bytes([1]) * 32))
+    b = SuiKeyPair(Ed25519KeyPair.from_private_key(bytes([2]) * 32))
+    # a's public key in front of b's private key.
+    data = base64.b64decode(a.base64())[:33] + base64.b64decode(b.base64())[33:]
+    keystore = Keystore([base64.b64encode(data).decode()])
+    assert keystore.addresses() == [a.address()]
+    with pytest.raises(Exception, match="holds the private key of"):
+        keystore.signer_for(a.address())
@@ -1,4 +1,9 @@
 import base64
+import pickle
+
+import pytest
+
+from sui_tx_sdk.cache import LRUCache
 from sui_tx_sdk.object import ObjectID, ObjectDigest, ObjectRef
 from sui_tx_sdk.bcs import Deserializer, Serializer
 
@@ -53,3 +58,61 @@ def test_objectref_serialization():
         "200cf9de3cae487fa16b673969d90381d4a2e5daa94d09e6770d27a1439310cd0e"
     )
     assert ser.output() == bytes.fromhex(serialization)
+    assert ref.serialized_size() == len(ser.output())
+
+
+def test_objectref_sequence():
+    refs = [
+        ObjectRef(
+            ObjectID.from_hex(object_id),
+            object_seq + i,
+            ObjectDigest.from_base64(object_digest),
+        )
+        for i in range(3)
+    ]
+    ser = Serializer()
+    ObjectRef.serialize_sequence(ser, refs)
+
+    generic = Serializer()
+    generic.sequence(refs, Serializer.struct)
+    assert ser.output() == generic.output()
+
+    deser = Deserializer(ser.output())
+    assert ObjectRef.deserialize_sequence(deser) == refs
+    assert deser.remaining() == 0
+
+
+def test_object_id_hash_and_order():
+    a = ObjectID.from_hex("0x1")
+    b = ObjectID.from_hex("0x2")
+    assert {a: 1}[ObjectID.from_hex("0x01")] == 1
+    assert sorted([b, a]) == [a, b]
+    assert a < b and a <= a and b > a
+    with pytest.raises(AttributeError):
+        a.value = b.value
+    assert pickle.loads(pickle.dumps(a)) == a
+
+
+def test_object_digest_hash_and_order():
+    digest = ObjectDigest.from_base64(object_digest)
+    other = ObjectDigest(bytes(32))
+    assert len({digest, ObjectDigest.from_base64(object_digest), other}) == 2
+    assert other < digest
+    assert digest != digest.value
+    with pytest.raises(AttributeError):
+        digest.value = other.value
+
+
+def test_intern_pool():
+    pool = LRUCache(2)
+    ObjectDigest.set_intern_pool(pool)
+    try:
+        first = ObjectDigest.from_base64(object_digest)
+        assert ObjectDigest.from_base64(object_digest) is first
+        assert pool.hits == 1
+        ObjectDigest(bytes(32))
+        ObjectDigest(bytes([1]) * 32)
+        assert ObjectDigest.from_base64(object_digest) is not first
+    finally:
+        ObjectDigest.set_intern_pool(None)
+    assert ObjectDigest(bytes(32)) is not ObjectDigest(bytes(32))
@@ -0,0 +1,151 @@
+import threading
+
+import pytest
+
+import sui_tx_sdk.transaction as stx
+import sui_tx_sdk.type_tag as type_tag
+from sui_tx_sdk import schema
+from sui_tx_sdk.account_address import AccountAddress
+from sui_tx_sdk.bcs import Deserializer, Serializer
+from sui_tx_sdk.object import ObjectRef
+from test_transaction import (
+    get_kind_and_serialization,
+    get_tx_data_and_serialization,
+    get_signed_tx_and_serialization,
+    load_test_data,
+    serialize_obj,
+)
+
+kinds = [get_kind_and_serialization(x) for x in load_test_data("Kind")]
+tx_datas = [get_tx_data_and_serialization(x) for x in load_test_data("TxData")]
+signed_txs = [get_signed_tx_and_serialization(x) for x in load_test_data("SignedTx")]
+
+
+class TestSchemaCodec:
+    def test_kind(self):
+        for obj, serialization in kinds:
+            kind = stx.SingleTransactionKind(obj)
+            assert schema.encode(kind) == serialization
+            assert schema.decode(stx.SingleTransactionKind, serialization) == kind
+
+    def test_tx_data(self):
+        for tx, serialization in tx_datas:
+            assert schema.encode(tx) == serialization
+            assert schema.decode(stx.TransactionData, serialization) == tx
+
+    def test_signed_tx(self):
+        for tx, serialization in signed_txs:
+            assert schema.encode(tx) == serialization
+            decoded = schema.decode(stx.SenderSignedData, serialization)
+            assert decoded.intent_message == tx.intent_message
+            assert decoded.tx_signature.bytes() == tx.tx_signature.bytes()
+
+    def test_matches_hand_written(self):
+        for tx, serialization in tx_datas:
+            decoded = schema.decode(stx.TransactionData, serialization)
+            assert serialize_obj(decoded) == schema.encode(tx)
+
+    def test_struct_tag(self):
+        tag = type_tag.StructTag(
+            AccountAddress.from_hex("0x2"),
+            "coin",
+            "Coin",
+            [type_tag.TypeTag(type_tag.StructTag.from_str("0x2::sui::SUI"))],
+        )
+        value = type_tag.TypeTag(tag)
+        assert schema.encode(value) == serialize_obj(value)
+        assert schema.decode(type_tag.TypeTag, schema.encode(value)) == value
+
+    def test_memoized_type_tag(self):
+        inner = type_tag.TypeTag(type_tag.StructTag.from_str("0x2::sui::SUI"))
+        value = type_tag.TypeTag(
+            type_tag.StructTag(AccountAddress.from_hex("0x2"), "coin", "Coin", [inner])
+        )
+        assert value._bcs is None
+        data = schema.encode(value)
+        assert data == serialize_obj(value)
+        assert value._bcs == data
+        assert inner._bcs == data[-len(inner._bcs) :]
+        assert schema.encode(value) == data
+        with pytest.raises(AttributeError, match="immutable"):
+            value.value = inner
+        assert hash(value) == hash(schema.decode(type_tag.TypeTag, data))
+
+    def test_unsupported_variant(self):
+        with pytest.raises(NotImplementedError):
+            schema.decode(type_tag.TypeTag, bytes([type_tag.TypeTag.U256 + 1]))
+
+    def test_digest_length_prefix(self):
+        _, serialization = tx_datas[0]
+        ref = Deserializer(serialization)
+        ref.struct(stx.TransactionKind)
+        start = len(serialization) - ref.remaining() + 20
+        data = bytearray(serialization[start : start + 61])
+        data[28] = 31
+        with pytest.raises(Exception, match="Expected bytes of length 32"):
+            schema.decode(ObjectRef, bytes(data))
+
+    def test_unexpected_end(self):
+        _, serialization = tx_datas[0]
+        with pytest.raises(Exception, match="Unexpected end of input"):
+            schema.decode(stx.TransactionData, serialization[:-1])
+
+    def test_skipper(self):
+        for _, serialization in tx_datas:
+            deser = Deserializer(serialization)
+            schema.skipper(stx.TransactionData)(deser)
+            assert deser.remaining() == 0
+        for _, serialization in signed_txs:
+            deser = Deserializer(serialization)
+            schema.skipper(stx.SenderSignedData)(deser)
+            assert deser.remaining() == 0
+        with pytest.raises(Exception, match="Unexpected end of input"):
+            schema.skipper(stx.TransactionData)(Deserializer(tx_datas[0][1][:-1]))
+
+
+class Pair:
+    __slots__ = ("a", "b")
+
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+
+def test_concurrent_compilation():
+    # Fresh classes, so every thread compiles a codec of its own at once.
+    layouts = [schema.U8, schema.U32, schema.U64, schema.STR] * 4
+    classes = []
+    for (i, layout) in enumerate(layouts):
+        cls = type(f"Pair{i}", (Pair,), {"__slots__": ()})
+        schema.define(cls, schema.Struct(a=layout, b=schema.U64))
+        classes.append(cls)
+
+    def value(i):
+        return classes[i]("x" * i if layouts[i] is schema.STR else i, i)
+
+    barrier = threading.Barrier(len(classes))
+    results = [None] * len(classes)
+
+    def run(i):
+        barrier.wait()
+        results[i] = schema.encode(value(i))
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(classes))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    writers = {
+        schema.U8: Serializer.u8,
+        schema.U32: Serializer.u32,
+        schema.U64: Serializer.u64,
+        schema.STR: Serializer.str,
+    }
+    for (i, cls) in enumerate(classes):
+        expected = value(i)
+        ser = Serializer()
+        writers[layouts[i]](ser, expected.a)
+        ser.u64(expected.b)
+        assert results[i] == ser.output()
+        decoded = schema.decode(cls, results[i])
+        assert (decoded.a, decoded.b) == (expected.a, expected.b)
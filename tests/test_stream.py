@@ -0,0 +1,78 @@
+import io
+
+import pytest
+
+import sui_tx_sdk.transaction as stx
+from sui_tx_sdk.stream import StreamDecoder, encode_record, iter_records
+from test_transaction import (
+    get_signed_tx_and_serialization,
+    get_tx_data_and_serialization,
+    load_test_data,
+)
+
+tx_datas = [get_tx_data_and_serialization(x)[0] for x in load_test_data("TxData")]
+signed_txs = [get_signed_tx_and_serialization(x)[0] for x in load_test_data("SignedTx")]
+stream = b"".join(encode_record(tx) for tx in tx_datas)
+
+
+class TestStreamDecoder:
+    def test_whole_stream(self):
+        decoder = StreamDecoder(stx.TransactionData)
+        assert list(decoder.feed(stream)) == tx_datas
+        assert decoder.pending() == 0
+        decoder.close()
+
+    def test_byte_by_byte(self):
+        decoder = StreamDecoder(stx.TransactionData)
+        decoded = []
+        for i in range(len(stream)):
+            decoded.extend(decoder.feed(stream[i : i + 1]))
+        assert decoded == tx_datas
+        decoder.close()
+
+    def test_records_yielded_as_soon_as_complete(self):
+        first = encode_record(tx_datas[0])
+        decoder = StreamDecoder(stx.TransactionData)
+        assert list(decoder.feed(first[:-1])) == []
+        assert decoder.pending() == len(first) - 1
+        assert list(decoder.feed(first[-1:] + stream[:1])) == tx_datas[:1]
+        assert decoder.pending() == 1
+
+    def test_signed_data(self):
+        data = b"".join(encode_record(tx) for tx in signed_txs)
+        decoder = StreamDecoder(stx.SenderSignedData)
+        decoded = list(decoder.feed(data))
+        assert [x.intent_message for x in decoded] == [
+            x.intent_message for x in signed_txs
+        ]
+
+    def test_incomplete_record(self):
+        decoder = StreamDecoder(stx.TransactionData)
+        list(decoder.feed(stream[:-1]))
+        with pytest.raises(Exception, match="Unexpected end of stream"):
+            decoder.close()
+
+    def test_trailing_bytes(self):
+        record = encode_record(stx.Intent(0, 0, 0))
+        decoder = StreamDecoder(stx.Intent)
+        with pytest.raises(Exception, match="trailing bytes"):
+            list(decoder.feed(bytes([record[0] + 1]) + record[1:] + b"\x00"))
+
+    def test_max_record_size(self):
+        decoder = StreamDecoder(stx.TransactionData, max_record_size=16)
+        with pytest.raises(Exception, match="exceeds the limit"):
+            list(decoder.feed(stream))
+
+    def test_length_prefix_checked_like_uleb128(self):
+        record = encode_record(stx.Intent(0, 0, 0))
+        decoder = StreamDecoder(stx.Intent)
+        with pytest.raises(Exception, match="Non-canonical"):
+            list(decoder.feed(bytes([record[0] | 0x80, 0]) + record[1:]))
+        decoder = StreamDecoder(stx.Intent)
+        with pytest.raises(Exception, match="does not fit into a u32"):
+            list(decoder.feed(b"\xff\xff\xff\xff\x1f"))
+
+
+def test_iter_records():
+    decoded = list(iter_records(io.BytesIO(stream), stx.TransactionData, chunk_size=7))
+    assert decoded == tx_datas
@@ -0,0 +1,118 @@
+import pytest
+
+import sui_tx_sdk.transaction as stx
+from sui_tx_sdk import schema
+from sui_tx_sdk.account_address import AccountAddress
+from sui_tx_sdk.object import ObjectDigest, ObjectID, ObjectRef
+from sui_tx_sdk.sui_address import SuiAddress
+from sui_tx_sdk.template import TransactionTemplate
+from test_transaction import get_tx_data_and_serialization, load_test_data
+
+tx_datas = [get_tx_data_and_serialization(x) for x in load_test_data("TxData")]
+
+
+def address(i):
+    return SuiAddress(bytes([i]) * SuiAddress.LENGTH)
+
+
+def object_ref(i):
+    return ObjectRef(
+        ObjectID(AccountAddress(bytes([i]) * AccountAddress.LENGTH)),
+        i,
+        ObjectDigest(bytes([i]) * ObjectDigest.LENGTH),
+    )
+
+
+def transaction(tx):
+    kind = stx.TransactionKind(stx.SingleTransactionKind(tx))
+    return stx.TransactionData(kind, address(1), object_ref(1), 1, 10000)
+
+
+def new_value(value, i):
+    if isinstance(value, SuiAddress):
+        return address(i)
+    if isinstance(value, ObjectRef):
+        return object_ref(i)
+    if isinstance(value, list):
+        return [new_value(x, i + j) for (j, x) in enumerate(value)]
+    return i if value is None else value + i
+
+
+def test_prototypes():
+    for tx, serialization in tx_datas:
+        template = TransactionTemplate(tx)
+        assert template.render() == serialization
+        assert template.size() == len(serialization)
+        assert set(template.fields()) >= {"sender", "gas_payment", "gas_budget"}
+
+        payload = tx.kind.value.value if tx.kind.variant == 0 else None
+        for (i, name) in enumerate(template.fields()):
+            owner = tx if hasattr(tx, name) else payload
+            values = {name: new_value(getattr(owner, name), i + 7)}
+            expected = schema.encode(template.transaction(**values))
+            assert template.render(**values) == expected
+            # Patched fields are restored for the next render.
+            assert template.render() == serialization
+
+
+@pytest.mark.parametrize(
+    "tx",
+    [
+        stx.TransferSui(address(2), 1000),
+        stx.TransferSui(address(2), None),
+        stx.TransferObject(address(2), object_ref(3)),
+        stx.PaySui([object_ref(3), object_ref(4)], [address(2)], [5]),
+        stx.Pay([object_ref(3)], [address(2), address(3)], [5, 6]),
+        stx.PayAllSui([object_ref(3)], address(2)),
+    ],
+)
+def test_payloads(tx):
+    template = TransactionTemplate(transaction(tx), stx.Intent(0, 0, 0))
+    intent = stx.Intent(0, 0, 0).bytes()
+    assert template.render() == intent + schema.encode(transaction(tx))
+    values = {name: new_value(getattr(tx, name), 9) for name in schema_fields(tx)}
+    values.update(sender=address(8), gas_payment=object_ref(8), gas_budget=5)
+    expected = intent + schema.encode(template.transaction(**values))
+    assert template.render(**values) == expected
+
+    buf = bytearray(b"\xff")
+    assert template.render_into(buf, 1, **values) == len(expected) + 1
+    assert buf[1:] == expected
+    with pytest.raises(Exception, match="Buffer too small"):
+        template.render_into(memoryview(bytearray(3)), 0)
+
+
+def schema_fields(tx):
+    return [name for (name, _) in schema.layout_of(type(tx)).fields]
+
+
+def test_size_change_falls_back():
+    template = TransactionTemplate(transaction(stx.TransferSui(address(2), 1000)))
+    expected = schema.encode(transaction(stx.TransferSui(address(3), None)))
+    assert template.render(recipient=address(3), amount=None) == expected
+
+    pay = stx.PaySui([object_ref(3)], [address(2)], [5])
+    template = TransactionTemplate(transaction(pay))
+    values = dict(recipients=[address(2), address(3)], amounts=[5, 6])
+    expected = schema.encode(template.transaction(**values))
+    assert template.render(**values) == expected
+    assert len(expected) > template.size()
+    with pytest.raises(Exception, match="Expected same count"):
+        template.render(recipients=[address(2), address(3)])
+
+
+def test_unknown_field():
+    call = next(
+        tx for tx, _ in tx_datas if isinstance(tx.kind.value.value, stx.MoveCall)
+    )
+    template = TransactionTemplate(call)
+    assert sorted(template.fields()) == [
+        "gas_budget",
+        "gas_payment",
+        "gas_price",
+        "sender",
+    ]
+    with pytest.raises(Exception, match="not a field"):
+        template.render(args=[])
+    with pytest.raises(Exception, match="not a field"):
+        template.transaction(args=[])
@@ -1,4 +1,9 @@
 import base64
+import concurrent.futures
+import hashlib
+import pickle
+
+import pytest
 from yaml import load, Loader
 
 import sui_tx_sdk.transaction as stx
@@ -6,7 +11,8 @@ from sui_tx_sdk.sui_address import SuiAddress
 from sui_tx_sdk.account_address import AccountAddress
 from sui_tx_sdk.object import ObjectID, ObjectDigest, ObjectRef
 from sui_tx_sdk.bcs import Serializer, Deserializer
-from sui_tx_sdk.crypto import Signature
+from sui_tx_sdk.crypto import Signature, SuiKeyPair
+from sui_tx_sdk.ed25519 import Ed25519KeyPair
 import sui_tx_sdk.type_tag as type_tag
 import sui_tx_sdk.call_arg as call_arg
 
@@ -212,6 +218,13 @@ class TestKind:
         )
         assert all(x.value == y for x, y in zip(deserialized, objs))
 
+    def test_serialized_size(self):
+        kind_serialization = map(get_kind_and_serialization, kinds)
+        objs, serializations = [list(x) for x in zip(*kind_serialization)]
+
+        objs = [stx.SingleTransactionKind(x) for x in objs]
+        assert [x.serialized_size() for x in objs] == [len(x) for x in serializations]
+
 
 # - TxData:
 #     value:
@@ -276,6 +289,99 @@ class TestTxData:
         )
         assert all(x == y for x, y in zip(deserialized, objs))
 
+    def test_serialized_size(self):
+        tx_and_serialization = map(get_tx_data_and_serialization, tx_datas)
+        txs, serializations = [list(x) for x in zip(*tx_and_serialization)]
+
+        assert [x.serialized_size() for x in txs] == [len(x) for x in serializations]
+
+    def test_digest(self):
+        for tx, serialization in map(get_tx_data_and_serialization, tx_datas):
+            data = b"TransactionData::" + serialization
+            expected = hashlib.blake2b(data, digest_size=32).digest()
+            assert tx.digest().value == expected
+            lazy = stx.TransactionData.from_bytes(serialization, lazy=True)
+            assert lazy.digest().value == expected
+
+    def test_frozen(self):
+        for tx, serialization in map(get_tx_data_and_serialization, tx_datas):
+            for frozen in [
+                tx.freeze(),
+                stx.TransactionData.from_bytes(serialization, frozen=True),
+            ]:
+                assert isinstance(frozen, stx.FrozenTransactionData)
+                assert frozen.bytes() == serialization
+                assert serialize_obj(frozen) == serialization
+                assert frozen.serialized_size() == len(serialization)
+                assert frozen.digest() is frozen.digest()
+                assert frozen.digest() == tx.digest()
+                assert frozen == tx and tx == frozen
+                assert frozen.freeze() is frozen
+                assert frozen.thaw() == tx
+                assert pickle.loads(pickle.dumps(frozen)) == frozen
+                with pytest.raises(AttributeError, match="immutable"):
+                    frozen.gas_budget = 1
+            assert hash(tx.freeze()) == hash(frozen)
+            assert len({tx.freeze(), frozen}) == 1
+
+    def test_signable_bytes_deprecated(self):
+        tx, serialization = get_tx_data_and_serialization(tx_datas[0])
+        with pytest.warns(DeprecationWarning, match="signable_bytes"):
+            data = tx.signable_bytes()
+        assert data == b"TransactionData::" + serialization
+        with pytest.warns(DeprecationWarning, match="from_signable_bytes"):
+            assert stx.TransactionData.from_signable_bytes(data) == tx
+
+    def test_slots(self):
+        def walk(value):
+            if isinstance(value, list):
+                for x in value:
+                    walk(x)
+            elif type(value).__module__.startswith("sui_tx_sdk"):
+                assert not hasattr(value, "__dict__"), type(value)
+                for cls in type(value).__mro__:
+                    for name in getattr(cls, "__slots__", ()):
+                        walk(getattr(value, name))
+
+        for _, serialization in map(get_tx_data_and_serialization, tx_datas):
+            walk(stx.TransactionData.from_bytes(serialization))
+
+    def test_serialize_into(self):
+        tx_and_serialization = map(get_tx_data_and_serialization, tx_datas)
+        txs, serializations = [list(x) for x in zip(*tx_and_serialization)]
+
+        frame = bytearray()
+        for tx in txs:
+            assert tx.serialize_into(frame, len(frame)) == len(frame)
+        assert frame == b"".join(serializations)
+
+        view = memoryview(bytearray(len(frame) + 1))
+        offset = 1
+        for tx in txs:
+            offset = tx.serialize_into(view, offset)
+        assert offset == len(view)
+        assert view[1:] == frame
+
+    def test_deserialize_lazy(self):
+        for tx, serialization in map(get_tx_data_and_serialization, tx_datas):
+            lazy = stx.TransactionData.from_bytes(serialization, lazy=True)
+            assert lazy._kind is stx._UNDECODED
+            assert lazy.sender == tx.sender
+            assert lazy.gas_payment == tx.gas_payment
+            assert lazy.gas_price == tx.gas_price
+            assert lazy.gas_budget == tx.gas_budget
+            assert lazy._kind is stx._UNDECODED
+            assert lazy.serialized_size() == len(serialization)
+            assert serialize_obj(lazy) == serialization
+            assert lazy == tx
+
+    def test_lazy_update(self):
+        tx, serialization = get_tx_data_and_serialization(tx_datas[0])
+        lazy = stx.TransactionData.from_bytes(serialization, lazy=True)
+        lazy.gas_budget = tx.gas_budget + 1
+        tx.gas_budget += 1
+        assert serialize_obj(lazy) == serialize_obj(tx)
+
 
 class TestIntent:
     def test_serialize(self):
@@ -376,6 +482,158 @@ class TestSenderSignedData:
         objs = (deserialize_ojb(x, stx.SenderSignedData) for x in serialization)
         assert all(a == b for a, b in zip(txs, objs))
 
+    def test_serialized_size(self):
+        signed_tx_and_serialization = map(get_signed_tx_and_serialization, signed_txs)
+        txs, serialization = [list(x) for x in zip(*signed_tx_and_serialization)]
+
+        assert [x.serialized_size() for x in txs] == [len(x) for x in serialization]
+
+    def test_digest(self):
+        signed_tx_and_serialization = map(get_signed_tx_and_serialization, signed_txs)
+        for tx, _ in signed_tx_and_serialization:
+            data = tx.intent_message.bytes()
+            digest = tx.digest()
+            assert digest.value == hashlib.sha3_256(data).digest()
+            assert tx.intent_message_bytes_and_digest() == (data, digest)
+            blake = tx.digest(stx.blake2b_256).value
+            assert blake == hashlib.blake2b(data, digest_size=32).digest()
+
+    def test_digest_zero_copy(self):
+        for _, serialization in map(get_signed_tx_and_serialization, signed_txs):
+            copied = Deserializer(serialization).struct(stx.SenderSignedData)
+            viewed = Deserializer(serialization, zero_copy=True).struct(
+                stx.SenderSignedData
+            )
+            assert viewed.digest() == copied.digest()
+            assert (
+                viewed.intent_message_bytes_and_digest()
+                == copied.intent_message_bytes_and_digest()
+            )
+            assert viewed.intent_message.value.digest() == (
+                copied.intent_message.value.digest()
+            )
+
+    def test_serialize_into(self):
+        signed_tx_and_serialization = map(get_signed_tx_and_serialization, signed_txs)
+        for tx, serialization in signed_tx_and_serialization:
+            buf = bytearray(b"\x00" * (len(serialization) + 2))
+            assert tx.serialize_into(buf, 1) == len(serialization) + 1
+            assert buf[1:-1] == serialization
+            with pytest.raises(Exception, match="Buffer too small"):
+                tx.serialize_into(memoryview(buf), 3)
+
+    def test_serialize_into_zero_copy(self):
+        for _, serialization in map(get_signed_tx_and_serialization, signed_txs):
+            viewed = Deserializer(serialization, zero_copy=True).struct(
+                stx.SenderSignedData
+            )
+            message = viewed.intent_message
+            for value in [viewed, message, message.indent, message.value]:
+                ser = Serializer()
+                value.serialize(ser)
+                buf = bytearray(len(ser.output()))
+                assert value.serialize_into(buf, 0) == len(buf)
+                assert buf == ser.output()
+            buf = bytearray(len(serialization))
+            viewed.serialize_into(buf, 0)
+            assert buf == serialization
+
+    def test_deserialize_lazy(self):
+        signed_tx_and_serialization = map(get_signed_tx_and_serialization, signed_txs)
+        for tx, serialization in signed_tx_and_serialization:
+            lazy = stx.SenderSignedData.from_bytes(serialization, lazy=True)
+            assert lazy.intent_message.value.sender == tx.intent_message.value.sender
+            assert serialize_obj(lazy) == serialization
+            assert lazy.tx_signature.verify(
+                lazy.intent_message, lazy.intent_message.value.sender
+            )
+            assert lazy == tx
+
+    def test_digest_reuses_bytes(self):
+        for tx, serialization in map(get_signed_tx_and_serialization, signed_txs):
+            lazy = stx.SenderSignedData.from_bytes(serialization, lazy=True)
+            assert lazy.digest() == tx.digest()
+            assert lazy.intent_message.value._kind is stx._UNDECODED
+            assert serialize_obj(lazy) == serialization
+            assert lazy.intent_message.value._kind is stx._UNDECODED
+
+            frozen = tx.intent_message.value.freeze()
+            object.__setattr__(frozen, "_bytes", b"cached")
+            message = stx.IntentMessage(tx.intent_message.indent, frozen)
+            assert message.bytes() == tx.intent_message.indent.bytes() + b"cached"
+
+    def test_frozen(self):
+        signed_tx_and_serialization = map(get_signed_tx_and_serialization, signed_txs)
+        for tx, serialization in signed_tx_and_serialization:
+            for frozen in [
+                tx.freeze(),
+                stx.SenderSignedData.from_bytes(serialization, frozen=True),
+            ]:
+                assert isinstance(frozen, stx.FrozenSenderSignedData)
+                message = frozen.intent_message
+                assert isinstance(message, stx.FrozenIntentMessage)
+                assert isinstance(message.value, stx.FrozenTransactionData)
+                assert frozen.bytes() == serialization
+                assert serialize_obj(frozen) == serialization
+                assert message.bytes() == tx.intent_message.bytes()
+                assert frozen.digest() is frozen.digest()
+                assert frozen.digest() == tx.digest()
+                assert frozen.digest(stx.blake2b_256) == tx.digest(stx.blake2b_256)
+                assert frozen.intent_message_bytes_and_digest() == (
+                    tx.intent_message_bytes_and_digest()
+                )
+                assert frozen == tx and frozen.thaw() == tx
+                assert frozen.verify()
+                with pytest.raises(AttributeError, match="immutable"):
+                    message.value = None
+            assert stx.SenderSignedData.verify_many([frozen]) == [True]
+            assert stx.IntentMessage.from_bytes(message.bytes(), frozen=True) == message
+
+    def test_verify_many(self):
+        signed_tx_and_serialization = map(get_signed_tx_and_serialization, signed_txs)
+        txs, serialization = [list(x) for x in zip(*signed_tx_and_serialization)]
+        assert all(tx.verify() for tx in txs)
+
+        tampered = bytearray(serialization[0])
+        tampered[-70] ^= 1
+        items = txs + serialization + [bytes(tampered), b"\x00"]
+        expected = [True] * (2 * len(txs)) + [False, False]
+        assert stx.SenderSignedData.verify_many(items) == expected
+        with concurrent.futures.ThreadPoolExecutor(2) as pool:
+            results = stx.SenderSignedData.verify_many(items, executor=pool)
+            assert results == expected
+        results = stx.SenderSignedData.verify_many(items, workers=2, chunksize=3)
+        assert results == expected
+
+    def test_verify_many_unencodable(self):
+        tx, serialization = get_signed_tx_and_serialization(signed_txs[0])
+        broken = stx.SenderSignedData.from_bytes(serialization)
+        broken.intent_message.value.gas_budget = -1
+        items = [tx, broken, serialization]
+        assert stx.SenderSignedData.verify_many(items) == [True, False, True]
+
+    def test_verify_many_rejects_what_from_bytes_rejects(self):
+        kp = SuiKeyPair(Ed25519KeyPair.from_private_key(bytes(range(32))))
+        ref = ObjectRef(ObjectID.from_hex("0x5"), 1, ObjectDigest(bytes(32)))
+        call = stx.MoveCall(ref, "abc", "call", [], [])
+        kind = stx.TransactionKind(stx.SingleTransactionKind(call))
+        tx = stx.TransactionData(kind, kp.address(), ref, 1, 1000)
+        message = stx.IntentMessage(stx.Intent(0, 0, 0), tx)
+
+        def signed(data: bytes) -> bytes:
+            ser = Serializer()
+            kp.sign(data).serialize(ser)
+            return data + ser.output()
+
+        good = message.bytes()
+        # Same length, correctly signed, but the module name is not UTF-8.
+        bad = good.replace(b"\x03abc", b"\x03\xff\xfe\xfd", 1)
+        with pytest.raises(Exception):
+            stx.SenderSignedData.from_bytes(signed(bad))
+
+        items = [signed(good), signed(bad)]
+        assert stx.SenderSignedData.verify_many(items) == [True, False]
+
     def test_verify(self):
         signed_tx_and_serialization = map(get_signed_tx_and_serialization, signed_txs)
         txs, _ = [list(x) for x in zip(*signed_tx_and_serialization)]
@@ -0,0 +1,131 @@
+import pickle
+
+import pytest
+
+from sui_tx_sdk import schema
+from sui_tx_sdk.account_address import AccountAddress
+from sui_tx_sdk.bcs import Deserializer, Serializer
+from sui_tx_sdk.cache import LRUCache
+from sui_tx_sdk.type_tag import (
+    BoolTag,
+    SignerTag,
+    StructTag,
+    TypeTag,
+    U16Tag,
+    U256Tag,
+    U32Tag,
+    U8Tag,
+    VectorTag,
+)
+
+sui = StructTag(AccountAddress.from_hex("0x2"), "sui", "SUI", [])
+coin = StructTag(AccountAddress.from_hex("0x2"), "coin", "Coin", [TypeTag(sui)])
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("u8", TypeTag(U8Tag())),
+        ("u16", TypeTag(U16Tag())),
+        ("u32", TypeTag(U32Tag())),
+        ("u256", TypeTag(U256Tag())),
+        ("signer", TypeTag(SignerTag())),
+        (
+            "vector<vector<u8>>",
+            TypeTag(VectorTag(TypeTag(VectorTag(TypeTag(U8Tag()))))),
+        ),
+        ("0x2::sui::SUI", TypeTag(sui)),
+        ("0x2::coin::Coin<0x2::sui::SUI>", TypeTag(coin)),
+        (
+            "0x3::pool::LP< 0x2::coin::Coin<0x2::sui::SUI>, vector<bool> >",
+            TypeTag(
+                StructTag(
+                    AccountAddress.from_hex("0x3"),
+                    "pool",
+                    "LP",
+                    [TypeTag(coin), TypeTag(VectorTag(TypeTag(BoolTag())))],
+                )
+            ),
+        ),
+    ],
+)
+def test_from_str(source, expected):
+    tag = TypeTag.from_str(source)
+    assert tag == expected
+    assert TypeTag.from_str(str(tag)) is tag
+    ser = Serializer()
+    tag.serialize(ser)
+    assert schema.encode(tag) == ser.output()
+    assert TypeTag.deserialize(Deserializer(ser.output())) == tag
+    assert schema.decode(TypeTag, ser.output()) == tag
+    assert pickle.loads(pickle.dumps(tag)) == tag
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "",
+        "u8 u8",
+        "vector<u8",
+        "vector<>",
+        "0x2::sui",
+        "0x2::1a::B",
+        "0xzz::a::b",
+        "2::sui::SUI",
+        "abc::m::T",
+        "vector<add>",
+    ],
+)
+def test_from_str_invalid(source):
+    with pytest.raises(Exception, match="Invalid type tag"):
+        TypeTag.from_str(source)
+
+
+def test_struct_tag_from_str():
+    assert StructTag.from_str("0x2::coin::Coin<0x2::sui::SUI>") == coin
+    with pytest.raises(Exception, match="Expected a struct type"):
+        StructTag.from_str("vector<u8>")
+
+
+def test_simple_tags_are_singletons():
+    assert U8Tag() is U8Tag()
+    assert U8Tag.deserialize(Deserializer(b"")) is U8Tag()
+    assert pickle.loads(pickle.dumps(U256Tag())) is U256Tag()
+    assert schema.decode(TypeTag, bytes([TypeTag.U32])).value is U32Tag()
+
+
+def test_parsed_tags_are_interned():
+    TypeTag.set_parse_cache(LRUCache(16))
+    try:
+        outer = TypeTag.from_str("0x2::coin::Coin<0x2::sui::SUI>")
+        assert TypeTag.from_str("0x2::sui::SUI") is outer.value.type_args[0]
+        assert TypeTag.from_str("0x02::sui::SUI") is outer.value.type_args[0]
+        TypeTag.from_str("0x2::coin::Coin<0x2::sui::SUI>")
+        assert TypeTag.parse_cache().hits == 1
+    finally:
+        TypeTag.set_parse_cache(LRUCache(4096))
+
+
+def test_without_caches():
+    TypeTag.set_parse_cache(None)
+    TypeTag.set_intern_pool(None)
+    try:
+        a = TypeTag.from_str("0x2::sui::SUI")
+        b = TypeTag.from_str("0x2::sui::SUI")
+        assert a == b and a is not b
+    finally:
+        TypeTag.set_parse_cache(LRUCache(4096))
+        TypeTag.set_intern_pool(LRUCache(4096))
+
+
+def test_serialize_memoizes():
+    tag = TypeTag(StructTag(coin.address, "coin", "Coin", [TypeTag(sui)]))
+    assert tag._bcs is None
+    ser = Serializer()
+    tag.serialize(ser)
+    assert tag._bcs == ser.output() == schema.encode(tag)
+    assert tag.value._bcs == tag._bcs[1:]
+    assert tag.serialized_size() == len(tag._bcs)
+    ser = Serializer()
+    tag.serialize(ser)
+    assert ser.output() == tag._bcs